@@ -0,0 +1,1043 @@
+# Generated by generate_registry.py from PQClean/crypto_*/*/META.yml, do not edit.
+
+KEM_INDEX = {
+    "firesaber": {
+        "identifier": "firesaber",
+        "name": "FireSaber",
+        "nist_level": 5,
+        "nistkat_sha256": "937d9b2e139112e13d4093a6afe715deff476e4d578208b9e8e1809de43835cd",
+        "public_key_bytes": 1312,
+        "private_key_bytes": 3040,
+        "cipher_text_bytes": 1472,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FIRESABER_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_FIRESABER_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}, {"name": "aarch64", "namespace": "PQCLEAN_FIRESABER_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "frodokem1344aes": {
+        "identifier": "frodokem1344aes",
+        "name": "FrodoKEM-1344-AES",
+        "nist_level": 5,
+        "nistkat_sha256": "2f4f1c352c1b343cce386c54234ca39fe29b48e45c66300f7311f5d3060d82b3",
+        "public_key_bytes": 21520,
+        "private_key_bytes": 43088,
+        "cipher_text_bytes": 21632,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FRODOKEM1344AES_CLEAN", "platforms": ()}, {"name": "opt", "namespace": "PQCLEAN_FRODOKEM1344AES_OPT", "platforms": ()}),
+    },
+    "frodokem1344shake": {
+        "identifier": "frodokem1344shake",
+        "name": "FrodoKEM-1344-SHAKE",
+        "nist_level": 5,
+        "nistkat_sha256": "6e54e319cc590c3f136af81990a04cd0009ef78dec92825d2eb834adfec661dc",
+        "public_key_bytes": 21520,
+        "private_key_bytes": 43088,
+        "cipher_text_bytes": 21632,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FRODOKEM1344SHAKE_CLEAN", "platforms": ()}, {"name": "opt", "namespace": "PQCLEAN_FRODOKEM1344SHAKE_OPT", "platforms": ()}),
+    },
+    "frodokem640aes": {
+        "identifier": "frodokem640aes",
+        "name": "FrodoKEM-640-AES",
+        "nist_level": 1,
+        "nistkat_sha256": "c1f006531583896c47416e10707d1c8e487fe549df304d7a9c43155d5e47b8b6",
+        "public_key_bytes": 9616,
+        "private_key_bytes": 19888,
+        "cipher_text_bytes": 9720,
+        "shared_secret_bytes": 16,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FRODOKEM640AES_CLEAN", "platforms": ()}, {"name": "opt", "namespace": "PQCLEAN_FRODOKEM640AES_OPT", "platforms": ()}),
+    },
+    "frodokem640shake": {
+        "identifier": "frodokem640shake",
+        "name": "FrodoKEM-640-SHAKE",
+        "nist_level": 1,
+        "nistkat_sha256": "df2b77b8e108c61d16c78a99e79f3351ab15840a690f25c1f87a8e89295e9219",
+        "public_key_bytes": 9616,
+        "private_key_bytes": 19888,
+        "cipher_text_bytes": 9720,
+        "shared_secret_bytes": 16,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FRODOKEM640SHAKE_CLEAN", "platforms": ()}, {"name": "opt", "namespace": "PQCLEAN_FRODOKEM640SHAKE_OPT", "platforms": ()}),
+    },
+    "frodokem976aes": {
+        "identifier": "frodokem976aes",
+        "name": "FrodoKEM-976-AES",
+        "nist_level": 3,
+        "nistkat_sha256": "7e415ab659d0d08d8f43135e1e9d75a8b342f52b65e8326ebf8135521b987615",
+        "public_key_bytes": 15632,
+        "private_key_bytes": 31296,
+        "cipher_text_bytes": 15744,
+        "shared_secret_bytes": 24,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FRODOKEM976AES_CLEAN", "platforms": ()}, {"name": "opt", "namespace": "PQCLEAN_FRODOKEM976AES_OPT", "platforms": ()}),
+    },
+    "frodokem976shake": {
+        "identifier": "frodokem976shake",
+        "name": "FrodoKEM-976-SHAKE",
+        "nist_level": 3,
+        "nistkat_sha256": "0d3d3a3ad11b69a93e72f1233b310884e97be8d16c9981bf1eb1321880cd0658",
+        "public_key_bytes": 15632,
+        "private_key_bytes": 31296,
+        "cipher_text_bytes": 15744,
+        "shared_secret_bytes": 24,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FRODOKEM976SHAKE_CLEAN", "platforms": ()}, {"name": "opt", "namespace": "PQCLEAN_FRODOKEM976SHAKE_OPT", "platforms": ()}),
+    },
+    "hqc-rmrs-128": {
+        "identifier": "hqc-rmrs-128",
+        "name": "HQC-RMRS-128",
+        "nist_level": 1,
+        "nistkat_sha256": "b9d10eda065c8ff31d40b929ad7f742889544363aa031096850009a882d9d827",
+        "public_key_bytes": 2249,
+        "private_key_bytes": 2289,
+        "cipher_text_bytes": 4481,
+        "shared_secret_bytes": 64,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_HQCRMRS128_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_HQCRMRS128_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi1", "pclmulqdq")},)}),
+    },
+    "hqc-rmrs-192": {
+        "identifier": "hqc-rmrs-192",
+        "name": "HQC-RMRS-192",
+        "nist_level": 3,
+        "nistkat_sha256": "e0aaabf79ac558dc9d5e79a8abe88c313ecad1e55956de323f8811c81d0c0779",
+        "public_key_bytes": 4522,
+        "private_key_bytes": 4562,
+        "cipher_text_bytes": 9026,
+        "shared_secret_bytes": 64,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_HQCRMRS192_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_HQCRMRS192_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi1", "pclmulqdq")},)}),
+    },
+    "hqc-rmrs-256": {
+        "identifier": "hqc-rmrs-256",
+        "name": "HQC-RMRS-256",
+        "nist_level": 5,
+        "nistkat_sha256": "4a5bc02661794464576dc2742636bd6123a3c0fde9dd0b52d9703866beae2f32",
+        "public_key_bytes": 7245,
+        "private_key_bytes": 7285,
+        "cipher_text_bytes": 14469,
+        "shared_secret_bytes": 64,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_HQCRMRS256_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_HQCRMRS256_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi1", "pclmulqdq")},)}),
+    },
+    "kyber1024": {
+        "identifier": "kyber1024",
+        "name": "Kyber1024",
+        "nist_level": 5,
+        "nistkat_sha256": "5afcf2a568ad32d49b55105b032af1850f03f3888ff9e2a72f4059c58e968f60",
+        "public_key_bytes": 1568,
+        "private_key_bytes": 3168,
+        "cipher_text_bytes": 1568,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_KYBER1024_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_KYBER1024_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "bmi2", "popcnt")},)}, {"name": "aarch64", "namespace": "PQCLEAN_KYBER1024_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "kyber1024-90s": {
+        "identifier": "kyber1024-90s",
+        "name": "Kyber1024-90s",
+        "nist_level": 5,
+        "nistkat_sha256": "a1b564348a126a118fbc49a6aeaebcb74896753fd99f30eeb0f75f0b2d25115f",
+        "public_key_bytes": 1568,
+        "private_key_bytes": 3168,
+        "cipher_text_bytes": 1568,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_KYBER102490S_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_KYBER102490S_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "bmi2", "popcnt")},)}),
+    },
+    "kyber512": {
+        "identifier": "kyber512",
+        "name": "Kyber512",
+        "nist_level": 1,
+        "nistkat_sha256": "bb0481d3325d828817900b709d23917cefbc10026fc857f098979451f67bb0ca",
+        "public_key_bytes": 800,
+        "private_key_bytes": 1632,
+        "cipher_text_bytes": 768,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_KYBER512_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_KYBER512_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "bmi2", "popcnt")},)}, {"name": "aarch64", "namespace": "PQCLEAN_KYBER512_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "kyber512-90s": {
+        "identifier": "kyber512-90s",
+        "name": "Kyber512-90s",
+        "nist_level": 1,
+        "nistkat_sha256": "7bfe0653b63b3fac7ee300a6e4801046c1a3d8d445b271633b6c9d81ed125e5b",
+        "public_key_bytes": 800,
+        "private_key_bytes": 1632,
+        "cipher_text_bytes": 768,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_KYBER51290S_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_KYBER51290S_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "bmi2", "popcnt")},)}),
+    },
+    "kyber768": {
+        "identifier": "kyber768",
+        "name": "Kyber768",
+        "nist_level": 3,
+        "nistkat_sha256": "89e82a5bf2d4ddb2c6444e10409e6d9ca65dafbca67d1a0db2c9b54920a29172",
+        "public_key_bytes": 1184,
+        "private_key_bytes": 2400,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_KYBER768_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_KYBER768_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "bmi2", "popcnt")},)}, {"name": "aarch64", "namespace": "PQCLEAN_KYBER768_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "kyber768-90s": {
+        "identifier": "kyber768-90s",
+        "name": "Kyber768-90s",
+        "nist_level": 3,
+        "nistkat_sha256": "68bf2e3914c0b4e053cefc67dd9f10f567946da5720f0b453b347610c3cc2c0a",
+        "public_key_bytes": 1184,
+        "private_key_bytes": 2400,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_KYBER76890S_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_KYBER76890S_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "bmi2", "popcnt")},)}),
+    },
+    "lightsaber": {
+        "identifier": "lightsaber",
+        "name": "LightSaber",
+        "nist_level": 1,
+        "nistkat_sha256": "dc2233ae221cfabbb1db5ab1a76c93967d37de9f87a8092561f95ab28eff6061",
+        "public_key_bytes": 672,
+        "private_key_bytes": 1568,
+        "cipher_text_bytes": 736,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_LIGHTSABER_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_LIGHTSABER_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}, {"name": "aarch64", "namespace": "PQCLEAN_LIGHTSABER_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "mceliece348864": {
+        "identifier": "mceliece348864",
+        "name": "Classic McEliece 348864",
+        "nist_level": 1,
+        "nistkat_sha256": "f0a166a9115a0c8481c85aee3fe901729a21a8a84a5d2b871fb99fc50223046b",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE348864_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE348864_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE348864_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "bmi1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE348864_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "popcnt")},)}),
+    },
+    "mceliece348864f": {
+        "identifier": "mceliece348864f",
+        "name": "Classic McEliece 348864f",
+        "nist_level": 1,
+        "nistkat_sha256": "f0a166a9115a0c8481c85aee3fe901729a21a8a84a5d2b871fb99fc50223046b",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE348864F_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE348864F_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE348864F_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "bmi1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE348864F_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "popcnt", "bmi1")},)}),
+    },
+    "mceliece460896": {
+        "identifier": "mceliece460896",
+        "name": "Classic McEliece 460896",
+        "nist_level": 3,
+        "nistkat_sha256": "b0822a5d00d7fad26380044c77b33370a5fb38e7851263229f590cac323a46a7",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE460896_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE460896_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE460896_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE460896_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "popcnt")},)}),
+    },
+    "mceliece460896f": {
+        "identifier": "mceliece460896f",
+        "name": "Classic McEliece 460896f",
+        "nist_level": 3,
+        "nistkat_sha256": "b0822a5d00d7fad26380044c77b33370a5fb38e7851263229f590cac323a46a7",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE460896F_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE460896F_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE460896F_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "bmi1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE460896F_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi1", "popcnt")},)}),
+    },
+    "mceliece6688128": {
+        "identifier": "mceliece6688128",
+        "name": "Classic McEliece 6688128",
+        "nist_level": 5,
+        "nistkat_sha256": "2946eb61d1505967d2ba223ff64c9baadbefa18ec6849fcbc068c0348a39f6f8",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE6688128_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE6688128_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE6688128_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE6688128_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "popcnt")},)}),
+    },
+    "mceliece6688128f": {
+        "identifier": "mceliece6688128f",
+        "name": "Classic McEliece 6688128",
+        "nist_level": 5,
+        "nistkat_sha256": "a8270440cacaa34509c9cf24bd5c79cc58db774adcd65b2f98d46dcf8749f632",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE6688128F_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE6688128F_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE6688128F_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "bmi1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE6688128F_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi1", "popcnt")},)}),
+    },
+    "mceliece6960119": {
+        "identifier": "mceliece6960119",
+        "name": "Classic McEliece 6960119",
+        "nist_level": 5,
+        "nistkat_sha256": "653ada51f795f7c606a6316f6c6db50f18804fe4a07aa26c78dc8f4ae2f9bccd",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE6960119_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE6960119_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE6960119_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE6960119_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "popcnt")},)}),
+    },
+    "mceliece6960119f": {
+        "identifier": "mceliece6960119f",
+        "name": "Classic McEliece 6960119f",
+        "nist_level": 5,
+        "nistkat_sha256": "653ada51f795f7c606a6316f6c6db50f18804fe4a07aa26c78dc8f4ae2f9bccd",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE6960119F_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE6960119F_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE6960119F_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "bmi1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE6960119F_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi1", "popcnt")},)}),
+    },
+    "mceliece8192128": {
+        "identifier": "mceliece8192128",
+        "name": "Classic McEliece 8192128",
+        "nist_level": 5,
+        "nistkat_sha256": "be85dab645c70e3a5eb91edcef125b2ae3838a8742e1fccf199149c4b814e357",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE8192128_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE8192128_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE8192128_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "popcnt")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE8192128_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "popcnt")},)}),
+    },
+    "mceliece8192128f": {
+        "identifier": "mceliece8192128f",
+        "name": "Classic McEliece 8192128f",
+        "nist_level": 5,
+        "nistkat_sha256": "464f27c8eeef313c1bb024330fdc00125bbf0a28fccd9053e232a9cb0a1a0ac0",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_MCELIECE8192128F_CLEAN", "platforms": ()}, {"name": "vec", "namespace": "PQCLEAN_MCELIECE8192128F_VEC", "platforms": ()}, {"name": "sse", "namespace": "PQCLEAN_MCELIECE8192128F_SSE", "platforms": ({"architecture": "x86_64", "required_flags": ("sse4_1", "popcnt", "bmi1")},)}, {"name": "avx", "namespace": "PQCLEAN_MCELIECE8192128F_AVX", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "popcnt", "bmi1")},)}),
+    },
+    "ntruhps2048509": {
+        "identifier": "ntruhps2048509",
+        "name": "ntruhps2048509",
+        "nist_level": 1,
+        "nistkat_sha256": "fc314366fbe795e2db6d29abb9f5b2ff43f0f608d0bd66161f9450364f0d271b",
+        "public_key_bytes": 699,
+        "private_key_bytes": 935,
+        "cipher_text_bytes": 699,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRUHPS2048509_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRUHPS2048509_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi2")},)}),
+    },
+    "ntruhps2048677": {
+        "identifier": "ntruhps2048677",
+        "name": "ntruhps2048677",
+        "nist_level": 3,
+        "nistkat_sha256": "33e2cad6c2a2f17991517050d7a1b745908c84b8283a4e0f07dbe6f62d166507",
+        "public_key_bytes": 930,
+        "private_key_bytes": 1234,
+        "cipher_text_bytes": 930,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRUHPS2048677_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRUHPS2048677_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi2")},)}),
+    },
+    "ntruhps40961229": {
+        "identifier": "ntruhps40961229",
+        "name": "ntruhps40961229",
+        "nist_level": 5,
+        "nistkat_sha256": "89fee43b0809f927ab78db68c46d34e9c2f71ad76903767c42c0bdd3b9f5c262",
+        "public_key_bytes": 1842,
+        "private_key_bytes": 2366,
+        "cipher_text_bytes": 1842,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRUHPS40961229_CLEAN", "platforms": ()},),
+    },
+    "ntruhps4096821": {
+        "identifier": "ntruhps4096821",
+        "name": "ntruhps4096821",
+        "nist_level": 5,
+        "nistkat_sha256": "1a8382ae0c801a43cf461c98d22743f5b2d8a1ffed1b1df0dd767de2c2874597",
+        "public_key_bytes": 1230,
+        "private_key_bytes": 1590,
+        "cipher_text_bytes": 1230,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRUHPS4096821_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRUHPS4096821_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi2")},)}),
+    },
+    "ntruhrss1373": {
+        "identifier": "ntruhrss1373",
+        "name": "ntruhrss1373",
+        "nist_level": 5,
+        "nistkat_sha256": "1e40d89aa9181f0aa7ceca3f4b22f0993cfbfadeb702b4241b2f0d4caeab127e",
+        "public_key_bytes": 2401,
+        "private_key_bytes": 2983,
+        "cipher_text_bytes": 2401,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRUHRSS1373_CLEAN", "platforms": ()},),
+    },
+    "ntruhrss701": {
+        "identifier": "ntruhrss701",
+        "name": "ntruhrss701",
+        "nist_level": 3,
+        "nistkat_sha256": "501e000c3eb374ffbfb81b0f16673a6282116465936608d7d164b05635e769e8",
+        "public_key_bytes": 1138,
+        "private_key_bytes": 1450,
+        "cipher_text_bytes": 1138,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRUHRSS701_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRUHRSS701_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2", "bmi2")},)}),
+    },
+    "ntrulpr1013": {
+        "identifier": "ntrulpr1013",
+        "name": "ntrulpr1013",
+        "nist_level": 4,
+        "nistkat_sha256": "6b1dfcc1ec5b899cdc75e3cc3e320cd45a2bcdbf1ae1a29e1b7eadcd94f02e06",
+        "public_key_bytes": 1455,
+        "private_key_bytes": 1773,
+        "cipher_text_bytes": 1583,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRULPR1013_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRULPR1013_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "ntrulpr1277": {
+        "identifier": "ntrulpr1277",
+        "name": "ntrulpr1277",
+        "nist_level": 5,
+        "nistkat_sha256": "93bc0a78461614cf46625741dfebdfb3dee1421e47d6952b0b0089ef7c3a5369",
+        "public_key_bytes": 1847,
+        "private_key_bytes": 2231,
+        "cipher_text_bytes": 1975,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRULPR1277_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRULPR1277_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "ntrulpr653": {
+        "identifier": "ntrulpr653",
+        "name": "ntrulpr653",
+        "nist_level": 1,
+        "nistkat_sha256": "1b24f14e46c7a2fe7d3b5b1d15f5d901311e1a94d64d35ee2e17a6deb7a75d61",
+        "public_key_bytes": 897,
+        "private_key_bytes": 1125,
+        "cipher_text_bytes": 1025,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRULPR653_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRULPR653_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "ntrulpr761": {
+        "identifier": "ntrulpr761",
+        "name": "ntrulpr761",
+        "nist_level": 2,
+        "nistkat_sha256": "06aa733e296035f1f171c4f48d1700571979cb0ccb27a4c0479c3ca32684797f",
+        "public_key_bytes": 1039,
+        "private_key_bytes": 1294,
+        "cipher_text_bytes": 1167,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRULPR761_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRULPR761_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "ntrulpr857": {
+        "identifier": "ntrulpr857",
+        "name": "ntrulpr857",
+        "nist_level": 3,
+        "nistkat_sha256": "b5816d6156b856a42b9152322b23aca53db17c67c8b30ba660e1ff6d389d2608",
+        "public_key_bytes": 1184,
+        "private_key_bytes": 1463,
+        "cipher_text_bytes": 1312,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRULPR857_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRULPR857_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "ntrulpr953": {
+        "identifier": "ntrulpr953",
+        "name": "ntrulpr953",
+        "nist_level": 4,
+        "nistkat_sha256": "cd3b185326a50921f9962da5306f0abe776c1e0e7d28e4c29c65e0e360bf03a6",
+        "public_key_bytes": 1349,
+        "private_key_bytes": 1652,
+        "cipher_text_bytes": 1477,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_NTRULPR953_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_NTRULPR953_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "saber": {
+        "identifier": "saber",
+        "name": "Saber",
+        "nist_level": 3,
+        "nistkat_sha256": "c9e2c16f41f162c607a1d5704107159e5e12713b9bb8c356b1d68b216e79096e",
+        "public_key_bytes": 992,
+        "private_key_bytes": 2304,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SABER_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SABER_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}, {"name": "aarch64", "namespace": "PQCLEAN_SABER_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "sntrup1013": {
+        "identifier": "sntrup1013",
+        "name": "sntrup1013",
+        "nist_level": 4,
+        "nistkat_sha256": "bbc3d76c65da19761a671321c7a1aefa3d2abaf876c1b1d7c892c71665bf6a0e",
+        "public_key_bytes": 1623,
+        "private_key_bytes": 2417,
+        "cipher_text_bytes": 1455,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SNTRUP1013_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SNTRUP1013_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sntrup1277": {
+        "identifier": "sntrup1277",
+        "name": "sntrup1277",
+        "nist_level": 5,
+        "nistkat_sha256": "d87346476ee6d70d6a8b27f811bf3cf20c1bd2b2d836f64c9c83348d5769865a",
+        "public_key_bytes": 2067,
+        "private_key_bytes": 3059,
+        "cipher_text_bytes": 1847,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SNTRUP1277_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SNTRUP1277_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sntrup653": {
+        "identifier": "sntrup653",
+        "name": "sntrup653",
+        "nist_level": 1,
+        "nistkat_sha256": "0d8643f1c81a20f4de836542224c49f01a3d4498d612f98577d76710896ed7fc",
+        "public_key_bytes": 994,
+        "private_key_bytes": 1518,
+        "cipher_text_bytes": 897,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SNTRUP653_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SNTRUP653_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sntrup761": {
+        "identifier": "sntrup761",
+        "name": "sntrup761",
+        "nist_level": 2,
+        "nistkat_sha256": "afc42c3a5b10f4ef69654250097ebda9b9564570f4086744b24a6daf2bd1f89a",
+        "public_key_bytes": 1158,
+        "private_key_bytes": 1763,
+        "cipher_text_bytes": 1039,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SNTRUP761_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SNTRUP761_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sntrup857": {
+        "identifier": "sntrup857",
+        "name": "sntrup857",
+        "nist_level": 3,
+        "nistkat_sha256": "8e58185a923122f15522eba1626f7f01f5bd5aa4503c1245df88f0e31a22d967",
+        "public_key_bytes": 1322,
+        "private_key_bytes": 1999,
+        "cipher_text_bytes": 1184,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SNTRUP857_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SNTRUP857_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sntrup953": {
+        "identifier": "sntrup953",
+        "name": "sntrup953",
+        "nist_level": 4,
+        "nistkat_sha256": "8c786712c07f62d81a1f5e3952db73d0b789d55ca72fd601ba23d20a309bf85c",
+        "public_key_bytes": 1505,
+        "private_key_bytes": 2254,
+        "cipher_text_bytes": 1349,
+        "shared_secret_bytes": 32,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SNTRUP953_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SNTRUP953_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+}
+
+SIGNATURE_INDEX = {
+    "dilithium2": {
+        "identifier": "dilithium2",
+        "name": "Dilithium2",
+        "nist_level": 2,
+        "nistkat_sha256": "faa8998108fa541309c9df5044018c5d26cc23654594bef639dd64b838646cbd",
+        "public_key_size": 1312,
+        "private_key_size": 2528,
+        "signature_bytes": 2420,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_DILITHIUM2_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_DILITHIUM2_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "popcnt")},)}, {"name": "aarch64", "namespace": "PQCLEAN_DILITHIUM2_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "dilithium2aes": {
+        "identifier": "dilithium2aes",
+        "name": "Dilithium2-AES",
+        "nist_level": 2,
+        "nistkat_sha256": "62569a8c8cf8781a60c88753dfa8806afac09e39f01df1bb6598ca29bac7f425",
+        "public_key_size": 1312,
+        "private_key_size": 2528,
+        "signature_bytes": 2420,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_DILITHIUM2AES_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_DILITHIUM2AES_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "popcnt")},)}),
+    },
+    "dilithium3": {
+        "identifier": "dilithium3",
+        "name": "Dilithium3",
+        "nist_level": 3,
+        "nistkat_sha256": "8439f580566c46b99449b2cbbd597ce59bcd5d184b90c1108b79a08f6bdbbcb1",
+        "public_key_size": 1952,
+        "private_key_size": 4000,
+        "signature_bytes": 3293,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_DILITHIUM3_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_DILITHIUM3_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "popcnt")},)}, {"name": "aarch64", "namespace": "PQCLEAN_DILITHIUM3_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "dilithium3aes": {
+        "identifier": "dilithium3aes",
+        "name": "Dilithium3-AES",
+        "nist_level": 3,
+        "nistkat_sha256": "199db029b177b368d71bac8689e16394621b84ddc5517e8476312165288e63d3",
+        "public_key_size": 1952,
+        "private_key_size": 4000,
+        "signature_bytes": 3293,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_DILITHIUM3AES_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_DILITHIUM3AES_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "popcnt")},)}),
+    },
+    "dilithium5": {
+        "identifier": "dilithium5",
+        "name": "Dilithium5",
+        "nist_level": 5,
+        "nistkat_sha256": "984ea5f06b13778292f60ecc07301af76e375f1bb9f4a39d676513439e1e83a2",
+        "public_key_size": 2592,
+        "private_key_size": 4864,
+        "signature_bytes": 4595,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_DILITHIUM5_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_DILITHIUM5_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "popcnt")},)}, {"name": "aarch64", "namespace": "PQCLEAN_DILITHIUM5_AARCH64", "platforms": ({"architecture": "arm_8", "required_flags": ("asimd",)},)}),
+    },
+    "dilithium5aes": {
+        "identifier": "dilithium5aes",
+        "name": "Dilithium5-AES",
+        "nist_level": 5,
+        "nistkat_sha256": "5734f0f32acf7190130448bbc121994a29fa4355deeee167ef65dbed014f6ee0",
+        "public_key_size": 2592,
+        "private_key_size": 4864,
+        "signature_bytes": 4595,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_DILITHIUM5AES_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_DILITHIUM5AES_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("aes", "avx2", "popcnt")},)}),
+    },
+    "falcon-1024": {
+        "identifier": "falcon-1024",
+        "name": "Falcon-1024",
+        "nist_level": 5,
+        "nistkat_sha256": "ef2104e326221515621638ca03cd99802271bdd9907e2ae5fc7b8d19d696c584",
+        "public_key_size": 1793,
+        "private_key_size": 2305,
+        "signature_bytes": 1330,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FALCON1024_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_FALCON1024_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "falcon-512": {
+        "identifier": "falcon-512",
+        "name": "Falcon-512",
+        "nist_level": 1,
+        "nistkat_sha256": "e9c3985f1ce732e29ca81aeca091f20d4dbb5beb456ee1a7ab41d04add4dab10",
+        "public_key_size": 897,
+        "private_key_size": 1281,
+        "signature_bytes": 690,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_FALCON512_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_FALCON512_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "rainbowI-circumzenithal": {
+        "identifier": "rainbowI-circumzenithal",
+        "name": "RAINBOW(16,36,32,32) - circumzenithal",
+        "nist_level": 1,
+        "nistkat_sha256": "819bd33be86eea97c3da516b7dfbe4885ea7dfad6c44d196f5fd7c1c8b00b8a7",
+        "public_key_size": 60192,
+        "private_key_size": 103648,
+        "signature_bytes": 66,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN", "platforms": ()},),
+    },
+    "rainbowI-classic": {
+        "identifier": "rainbowI-classic",
+        "name": "RAINBOW(16,36,32,32) - classic",
+        "nist_level": 1,
+        "nistkat_sha256": "5cef855ed222382139f2fd91a84c3c651c5c4f8f59f5bb9cb3c8648b6ca34c52",
+        "public_key_size": 161600,
+        "private_key_size": 103648,
+        "signature_bytes": 66,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWICLASSIC_CLEAN", "platforms": ()},),
+    },
+    "rainbowI-compressed": {
+        "identifier": "rainbowI-compressed",
+        "name": "RAINBOW(16,36,32,32) - compressed",
+        "nist_level": 1,
+        "nistkat_sha256": "6ff3ff91f17c85593317f18a9de09acf4204c45d620250cb948c9fbc9042f1e9",
+        "public_key_size": 60192,
+        "private_key_size": 64,
+        "signature_bytes": 66,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWICOMPRESSED_CLEAN", "platforms": ()},),
+    },
+    "rainbowIII-circumzenithal": {
+        "identifier": "rainbowIII-circumzenithal",
+        "name": "RAINBOW(256,68,32,48) - circumzenithal",
+        "nist_level": 3,
+        "nistkat_sha256": "1b5cbbdef12492ba8176309a44461d3d64a05b049f78edb85af1d166f4b64f32",
+        "public_key_size": 264608,
+        "private_key_size": 626048,
+        "signature_bytes": 164,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN", "platforms": ()},),
+    },
+    "rainbowIII-classic": {
+        "identifier": "rainbowIII-classic",
+        "name": "RAINBOW(256,68,32,48) - classic",
+        "nist_level": 3,
+        "nistkat_sha256": "1eb9bb6e63cfdbd05a6eaca9989e969fd234b110b67ff7e6373e1af080b35f41",
+        "public_key_size": 882080,
+        "private_key_size": 626048,
+        "signature_bytes": 164,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWIIICLASSIC_CLEAN", "platforms": ()},),
+    },
+    "rainbowIII-compressed": {
+        "identifier": "rainbowIII-compressed",
+        "name": "RAINBOW(256,68,32,48) - compressed",
+        "nist_level": 3,
+        "nistkat_sha256": "8f895e88918df9e26123b5e0be722e952f3603bfc1f6b2859a8155edf3907969",
+        "public_key_size": 264608,
+        "private_key_size": 64,
+        "signature_bytes": 164,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN", "platforms": ()},),
+    },
+    "rainbowV-circumzenithal": {
+        "identifier": "rainbowV-circumzenithal",
+        "name": "RAINBOW(256,96,36,64) - circumzenithal",
+        "nist_level": 5,
+        "nistkat_sha256": "fba7a186c7f809da0d7ee0dcbc64d2573d824b44e539539b30c7ef1a36911760",
+        "public_key_size": 536136,
+        "private_key_size": 1408736,
+        "signature_bytes": 212,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN", "platforms": ()},),
+    },
+    "rainbowV-classic": {
+        "identifier": "rainbowV-classic",
+        "name": "RAINBOW(256,96,36,64) - classic",
+        "nist_level": 5,
+        "nistkat_sha256": "3b13607b2761cd4b5ccf3206d3fec04f2568e0b01d6f370a336d0de7c70051ff",
+        "public_key_size": 1930600,
+        "private_key_size": 1408736,
+        "signature_bytes": 212,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWVCLASSIC_CLEAN", "platforms": ()},),
+    },
+    "rainbowV-compressed": {
+        "identifier": "rainbowV-compressed",
+        "name": "RAINBOW(256,96,36,64) - compressed",
+        "nist_level": 5,
+        "nistkat_sha256": "452159bbc353bcb8e209d466df8c2ba3816d66a8dcf2059aa96185e10016feec",
+        "public_key_size": 536136,
+        "private_key_size": 64,
+        "signature_bytes": 212,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_RAINBOWVCOMPRESSED_CLEAN", "platforms": ()},),
+    },
+    "sphincs-haraka-128f-robust": {
+        "identifier": "sphincs-haraka-128f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "a8b966844b0c9bb2d954d95d25777bd548ee3dcb78e0833de8333a033d24cacb",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 17088,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-128f-simple": {
+        "identifier": "sphincs-haraka-128f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "266fb0a5e65ba0183fe4e462d48ff814842a389fb0785d30f89fa1c126df518b",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 17088,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-128s-robust": {
+        "identifier": "sphincs-haraka-128s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "ffad452b5ec3217d204ed13f5af76009ce265dd61ce9097714d941fec106dd01",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 7856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-128s-simple": {
+        "identifier": "sphincs-haraka-128s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "625422a71b884ecf4d42e21f96091a18635e4862b68d0627e21a4a0033819603",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 7856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-192f-robust": {
+        "identifier": "sphincs-haraka-192f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "1d32cab46df0d4e6678a06a9eae7b187c80eaedf56b1e7d221035d7c6f08ef06",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 35664,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-192f-simple": {
+        "identifier": "sphincs-haraka-192f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "4888059ed11c192b3a07e227e3befc967819d05f85723a7740bbc31eadc37f37",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 35664,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-192s-robust": {
+        "identifier": "sphincs-haraka-192s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "3d6f746167b234c7e689dff201558ac6ce6883b0c545517fe29c33fd24bfe619",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 16224,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-192s-simple": {
+        "identifier": "sphincs-haraka-192s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "ce6e8ff33f0264027bfe874c4265dc84de981b5fcb1d8ead2459c85a37f49cbf",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 16224,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-256f-robust": {
+        "identifier": "sphincs-haraka-256f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "7e346ad1ab94be33b757d833f1a934e23af6251e7aac7072d098ef15dc3264fd",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 49856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-256f-simple": {
+        "identifier": "sphincs-haraka-256f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "b7bfc3a28daf35cd4110628c70294d1bcbd2a5da066bdc459891b7684432e037",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 49856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-256s-robust": {
+        "identifier": "sphincs-haraka-256s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "a419bdba92da2d07f99c3c3ba4f776b955244a7c3b565816c7fd2151f6c3363f",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 29792,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-haraka-256s-simple": {
+        "identifier": "sphincs-haraka-256s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "0b8c7d3d8001eec6ddb317e0301fef4adc4f5b03301e5f4b93d09881b1a5ba7a",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 29792,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "platforms": ()}, {"name": "aesni", "namespace": "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "platforms": ({"architecture": "x86_64", "required_flags": ("aes",)},)}),
+    },
+    "sphincs-sha256-128f-robust": {
+        "identifier": "sphincs-sha256-128f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "99c5e790fd3e2afb33b4b7b3666247368b3aa6d8c216c8537626a7fd8a680430",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 17088,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-128f-simple": {
+        "identifier": "sphincs-sha256-128f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "d08e30ae626e0c203cd66f51fb3a6f39f353e26bd1532ce437c1a428383fbc00",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 17088,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-128s-robust": {
+        "identifier": "sphincs-sha256-128s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "78c5432a5acc8f01ef5aeebc6659f15641b5dbe66ee7327ab86a1541ce1672ae",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 7856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-128s-simple": {
+        "identifier": "sphincs-sha256-128s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "f398be19cd856c2fd5c894e9c6b7f872ce5db63b874b7160cb6efb40a9628773",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 7856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-192f-robust": {
+        "identifier": "sphincs-sha256-192f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "9d0898cb264172c31d0fb4901dd56d46728e83e0bf008abccb8b0912c2ebbc52",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 35664,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-192f-simple": {
+        "identifier": "sphincs-sha256-192f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "306fef951d07b17b27c67ffe9e63185ae5d5fde87619b76872a3ca969299d47c",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 35664,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-192s-robust": {
+        "identifier": "sphincs-sha256-192s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "37cb7031fbd4436d3b4724fe4147af3a23e2e8240174a2eef99ec17dd3e5a5c9",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 16224,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-192s-simple": {
+        "identifier": "sphincs-sha256-192s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "45c9c28e85bb3f3b90b16f6deb25a32862613f4f3fcd17de9a46d83b7ff27745",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 16224,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-256f-robust": {
+        "identifier": "sphincs-sha256-256f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "8006df7b3bf31e1c8a262d2d7fd2279d2fa4b0edb10bcb36c72ecc8a6ada03f5",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 49856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-256f-simple": {
+        "identifier": "sphincs-sha256-256f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "a563c2870fc6cb7c4b84b7cd5cd271ccd7bedf741d35592370fc9aea517f366d",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 49856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-256s-robust": {
+        "identifier": "sphincs-sha256-256s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "da28ff350ac552f100b35b01ecb494dc02f9dcf542fa2d88439cd427985e9581",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 29792,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-sha256-256s-simple": {
+        "identifier": "sphincs-sha256-256s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "768d61c537b3abacca3ab468623edafb33d28a33dc5a9859f803679a3020b639",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 29792,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-128f-robust": {
+        "identifier": "sphincs-shake256-128f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "39af7b5cee0e03dfa61070d0ac8dcae358a3d9b9a5d0eebb356cb25051a6b4b7",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 17088,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-128f-simple": {
+        "identifier": "sphincs-shake256-128f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "ebebf1a5da339c6e2073f41d7b499b7e5a456ac91c68ef5d15d18643c89d8e7d",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 17088,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-128s-robust": {
+        "identifier": "sphincs-shake256-128s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "094df7ed9198f66c0dfa02429d48320dc942f01bc2f90289519c4fbd37085ad6",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 7856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-128s-simple": {
+        "identifier": "sphincs-shake256-128s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 1,
+        "nistkat_sha256": "260c24c6de710d81f86184fc034d382abe5d705b5352d7329ca662f6def392a4",
+        "public_key_size": 32,
+        "private_key_size": 64,
+        "signature_bytes": 7856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-192f-robust": {
+        "identifier": "sphincs-shake256-192f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "5cfcf998ad0bedf8e6b961c8891048f456d6422d3b4a26fcb095a913c9efd03e",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 35664,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-192f-simple": {
+        "identifier": "sphincs-shake256-192f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "28528adef75a728d013bb493d85e358a75344c72000792419f1f539c16f24f10",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 35664,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-192s-robust": {
+        "identifier": "sphincs-shake256-192s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "92eed523fc2f48b66826929b49a58d44c46aaa2c286a6d0e822a8d1e34555121",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 16224,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-192s-simple": {
+        "identifier": "sphincs-shake256-192s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 3,
+        "nistkat_sha256": "3cb0a4fccbb8d204aaa5c06e5be66a53e8c4ba1cbf1aefef8fdfaa5c63d60094",
+        "public_key_size": 48,
+        "private_key_size": 96,
+        "signature_bytes": 16224,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-256f-robust": {
+        "identifier": "sphincs-shake256-256f-robust",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "4bd4c9610754bb66530f492cf2e98e81b0d525339bae56038034e692f46f7927",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 49856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-256f-simple": {
+        "identifier": "sphincs-shake256-256f-simple",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "1ec2691198f9a5c29c45a2bb72b3e04c9127f8e1df19d6c874d8b5bdfab89ef7",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 49856,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-256s-robust": {
+        "identifier": "sphincs-shake256-256s-robust",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "09004dba03b2a190a327b5404a4d75c663f025703253b78946d0a99ca1492d6f",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 29792,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+    "sphincs-shake256-256s-simple": {
+        "identifier": "sphincs-shake256-256s-simple",
+        "name": "SPHINCS+",
+        "nist_level": 5,
+        "nistkat_sha256": "f704deaf990987c306082bb28258cfb8c6f03b49940c06df582ef3fb86958e8a",
+        "public_key_size": 64,
+        "private_key_size": 128,
+        "signature_bytes": 29792,
+        "implementations": ({"name": "clean", "namespace": "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "platforms": ()}, {"name": "avx2", "namespace": "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "platforms": ({"architecture": "x86_64", "required_flags": ("avx2",)},)}),
+    },
+}
@@ -0,0 +1,496 @@
+import ctypes
+import os
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from build_profiles import DEFAULT_PROFILE, combined_library_path, profile_dir
+from cpu_features import preference, supports
+from pqclean_bindings import PROTOTYPES, SCHEMES
+
+# Spec keys ending in this suffix name a library symbol; the loaded entry holds the
+# function under the same key with the suffix replaced by "_algorithm"
+SYMBOL_SUFFIX = "_symbol"
+
+# C types of the prototype table mapped to their ctypes types. Byte buffers are passed
+# as c_void_p, which takes bytes as well as ctypes arrays without a copy
+C_TYPES = {
+    "int": ctypes.c_int,
+    "size_t": ctypes.c_size_t,
+    "size_t *": ctypes.POINTER(ctypes.c_size_t),
+    "uint8_t *": ctypes.c_void_p,
+    "const uint8_t *": ctypes.c_void_p,
+}
+
+# Minimum buffer size of each argument of the library functions, by function name: a
+# size key of the algorithm entry, the index of the `size_t` argument holding the
+# length, or None for arguments that are not checked. c_void_p does not know the size
+# of the buffer behind it, so too short buffers are rejected before the call.
+BUFFER_SIZES = {
+    "crypto_kem_keypair": ("public_key_bytes", "private_key_bytes"),
+    "crypto_kem_enc": ("cipher_text_bytes", "shared_secret_bytes", "public_key_bytes"),
+    "crypto_kem_dec": ("shared_secret_bytes", "cipher_text_bytes", "private_key_bytes"),
+    "crypto_sign_keypair": ("public_key_size", "private_key_size"),
+    "crypto_sign_signature": ("signature_bytes", None, 3, None, "private_key_size"),
+    "crypto_sign_verify": (1, None, 3, None, "public_key_size"),
+}
+# The Rust Kyber libraries export the KEM functions under unprefixed names
+BUFFER_SIZES["generate_keypair"] = BUFFER_SIZES["crypto_kem_keypair"]
+BUFFER_SIZES["encapsulate_key"] = BUFFER_SIZES["crypto_kem_enc"]
+BUFFER_SIZES["decapsulate_key"] = BUFFER_SIZES["crypto_kem_dec"]
+
+# Identifiers the registries used before they were generated from META.yml, kept as
+# the canonical names so timing CSVs and configurations stay comparable. The scheme
+# directory names are accepted as aliases.
+LEGACY_IDENTIFIERS = {
+    "falcon-512": "falcon512",
+    "falcon-1024": "falcon1024",
+    "rainbowI-classic": "rainbowIclassic",
+    "rainbowIII-classic": "rainbowIIIclassic",
+    "rainbowV-classic": "rainbowVclassic",
+}
+
+# Algorithms benchmarked when KEMS / SIGNATURES are not configured
+DEFAULT_KEMS = [
+    "mceliece348864",
+    "mceliece460896",
+    "mceliece6688128",
+    "mceliece6960119",
+    "mceliece8192128",
+    "kyber512rust",
+    "kyber768rust",
+    "kyber1024rust",
+    "kyber512",
+    "kyber768",
+    "kyber1024",
+    "hqc-rmrs-128",
+    "hqc-rmrs-192",
+    "hqc-rmrs-256",
+]
+DEFAULT_SIGNATURES = [
+    "dilithium2",
+    "dilithium3",
+    "dilithium5",
+    "falcon512",
+    "falcon1024",
+    "rainbowIclassic",
+    "rainbowIIIclassic",
+    "rainbowVclassic",
+]
+
+_libraries = {}
+_libraries_lock = threading.Lock()
+
+
+def _reset_libraries_lock():
+    global _libraries_lock
+    _libraries_lock = threading.Lock()
+
+
+# A thread loading a library while the process forks would leave the child's lock held
+os.register_at_fork(after_in_child=_reset_libraries_lock)
+
+
+def load_library(library_path):
+    """
+    Loads a shared library once per process.
+
+    Args:
+        library_path (str): Path to the shared library.
+
+    Returns:
+        ctypes.CDLL: The loaded library.
+    """
+    with _libraries_lock:
+        if library_path not in _libraries:
+            _libraries[library_path] = ctypes.CDLL(library_path)
+        return _libraries[library_path]
+
+
+def check_sizes(entry, symbol):
+    """
+    Checks the entry's buffer sizes against the api.h constants of the symbol's scheme.
+
+    Args:
+        entry (dict): Algorithm entry.
+        symbol (str): Name of one of the entry's library functions.
+
+    Raises:
+        ValueError: If a size of the entry differs from its api.h constant.
+    """
+    prototype = PROTOTYPES.get(symbol)
+    if prototype is None or prototype[0] is None:
+        return
+    for key, size in SCHEMES[prototype[0]].items():
+        if key in entry and entry[key] != size:
+            raise ValueError(
+                f"{entry['identifier']}: {key} is {entry[key]}, but api.h of "
+                f"{SCHEMES[prototype[0]]['scheme']} defines {size}"
+            )
+
+
+def buffer_length(argument):
+    """
+    Args:
+        argument: Argument passed for a `uint8_t *` parameter.
+
+    Returns:
+        int: Size of the buffer in bytes, or None for a raw address or NULL.
+    """
+    if isinstance(argument, (bytes, bytearray)):
+        return len(argument)
+    if isinstance(argument, ctypes.Array):
+        return ctypes.sizeof(argument)
+    return None
+
+
+def typed_function(library, symbol, sizes=None):
+    """
+    Looks up a library function and sets its argument and return types from the
+    prototype table, so ctypes converts and checks the arguments, e.g. passes a
+    `size_t` as 64 bits instead of as an int.
+
+    Functions in `BUFFER_SIZES` are wrapped to check the size of every buffer argument
+    before the call, since a too short buffer would be read or written past its end.
+
+    Args:
+        library (ctypes.CDLL): The loaded library.
+        symbol (str): Name of the function.
+        sizes (dict, optional): Buffer sizes of the algorithm, e.g. its entry; by
+            default the api.h constants of the symbol's scheme.
+
+    Returns:
+        function: The function; untyped if the symbol is not in the table.
+
+    Raises:
+        ValueError: When the returned function is called with a too short buffer.
+    """
+    function = getattr(library, symbol)
+    prototype = PROTOTYPES.get(symbol)
+    if prototype is None:
+        return function
+    prefix, return_type, parameter_types = prototype
+    function.restype = C_TYPES[return_type]
+    function.argtypes = [C_TYPES[parameter] for parameter in parameter_types]
+
+    if sizes is None:
+        sizes = SCHEMES.get(prefix, {})
+    name = symbol[len(prefix) + 1 :] if prefix else symbol
+    # (argument index, fixed size or None, index of the length argument or None)
+    checks = [
+        (index, None, size) if isinstance(size, int) else (index, sizes[size], None)
+        for index, size in enumerate(BUFFER_SIZES.get(name, ()))
+        if isinstance(size, int) or size in sizes
+    ]
+    if not checks:
+        return function
+
+    def checked(*args):
+        for index, size, length_index in checks:
+            length = buffer_length(args[index])
+            # The length may be passed as an int or as a ctypes.c_size_t
+            required = size if length_index is None else args[length_index]
+            required = getattr(required, "value", required)
+            if length is not None and length < required:
+                raise ValueError(
+                    f"{symbol}: argument {index} has {length} bytes, expected {required}"
+                )
+        return function(*args)
+
+    return checked
+
+
+def resolve_symbols(entry):
+    """
+    Loads the entry's library and resolves every "*_symbol" key to its typed function.
+
+    Args:
+        entry (dict): Algorithm entry with "library_path" and "*_symbol" keys.
+
+    Returns:
+        dict: The entry with an "*_algorithm" function added for every "*_symbol" key.
+
+    Raises:
+        ValueError: If the entry's sizes do not match the api.h of its scheme.
+    """
+    library = load_library(entry["library_path"])
+    for key, symbol in list(entry.items()):
+        if key.endswith(SYMBOL_SUFFIX):
+            check_sizes(entry, symbol)
+            entry[key[: -len(SYMBOL_SUFFIX)] + "_algorithm"] = typed_function(
+                library, symbol, entry
+            )
+    return entry
+
+
+def library_path(type_name, scheme, implementation, profile=DEFAULT_PROFILE):
+    """
+    Args:
+        type_name (str): "crypto_kem" or "crypto_sign".
+        scheme (str): Name of the scheme directory, e.g. "kyber512".
+        implementation (str): Name of the implementation, e.g. "clean" or "avx2".
+        profile (str): Build profile of the library, see `build_profiles.BUILD_PROFILES`.
+
+    Returns:
+        str: Path of the implementation's shared library, e.g.
+            "./build/crypto_kem/libkyber512.so" or
+            "./build/native/crypto_kem/libkyber512_avx2.so".
+    """
+    if implementation == "clean":
+        file_name = f"lib{scheme}.so"
+    else:
+        file_name = f"lib{scheme}_{implementation}.so"
+    return os.path.join(profile_dir(profile), type_name, file_name)
+
+
+def select_implementation(
+    type_name,
+    scheme,
+    implementations,
+    requested="auto",
+    profile=DEFAULT_PROFILE,
+    is_built=None,
+):
+    """
+    Picks the implementation of a scheme to load: among those that were built and that
+    the CPU supports, the requested one if available, otherwise the most preferred one
+    (see `cpu_features.IMPLEMENTATION_PREFERENCE`).
+
+    Args:
+        type_name (str): "crypto_kem" or "crypto_sign".
+        scheme (str): Name of the scheme directory.
+        implementations (tuple of dict): Implementation entries of the algorithm index.
+        requested (str): Name of the preferred implementation, or "auto".
+        profile (str): Build profile the implementations were built with.
+        is_built (function, optional): Called with an implementation entry, returns
+            True if it was built; by default, whether its library file exists.
+
+    Returns:
+        dict: The implementation entry; clean if no implementation was built.
+    """
+    if is_built is None:
+
+        def is_built(implementation):
+            return os.path.isfile(
+                library_path(type_name, scheme, implementation["name"], profile)
+            )
+
+    available = [
+        implementation
+        for implementation in implementations
+        if supports(implementation) and is_built(implementation)
+    ]
+    if not available:
+        return next(i for i in implementations if i["name"] == "clean")
+    return min(
+        available,
+        key=lambda i: (i["name"] != requested, preference(i["name"])),
+    )
+
+
+def pqclean_specs(
+    index,
+    type_name,
+    symbols,
+    implementation="auto",
+    profile=DEFAULT_PROFILE,
+    combined=False,
+):
+    """
+    Builds the specs of all PQClean schemes of one type from the generated algorithm index.
+
+    Args:
+        index (dict): `algorithm_index.KEM_INDEX` or `algorithm_index.SIGNATURE_INDEX`.
+        type_name (str): "crypto_kem" or "crypto_sign".
+        symbols (dict): Spec key of every function the caller needs mapped to its name
+            without the scheme prefix, e.g. {"keypair_symbol": "crypto_kem_keypair"}.
+        implementation (str): Implementation to use where it is available, or "auto" for
+            the fastest one the host supports, see `select_implementation`.
+        profile (str): Build profile to load the libraries from.
+        combined (bool): If True, the schemes contained in the profile's combined
+            library are resolved from it, the others from their own libraries.
+
+    Returns:
+        dict: Identifier mapped to the spec (index entry, selected "implementation",
+            library path and symbol names).
+    """
+    combined_path = combined_library_path(profile)
+    combined_library = None
+    if combined and os.path.isfile(combined_path):
+        combined_library = load_library(combined_path)
+    probe_function = next(iter(symbols.values()))
+
+    def in_combined_library(implementation):
+        return hasattr(combined_library, f"{implementation['namespace']}_{probe_function}")
+
+    specs = {}
+    for name, entry in index.items():
+        identifier = LEGACY_IDENTIFIERS.get(name, name)
+        selected = None
+        if combined_library is not None:
+            selected = select_implementation(
+                type_name,
+                name,
+                entry["implementations"],
+                implementation,
+                profile,
+                in_combined_library,
+            )
+            if not in_combined_library(selected):
+                selected = None
+        if selected is None:
+            selected = select_implementation(
+                type_name, name, entry["implementations"], implementation, profile
+            )
+            path = library_path(type_name, name, selected["name"], profile)
+        else:
+            path = combined_path
+        spec = dict(entry, identifier=identifier, implementation=selected["name"])
+        spec["library_path"] = path
+        for key, function in symbols.items():
+            spec[key] = f"{selected['namespace']}_{function}"
+        specs[identifier] = spec
+    return specs
+
+
+class AlgorithmRegistry(Mapping):
+    """
+    Mapping of algorithm identifiers to entries that are loaded on first use.
+
+    Each entry starts out as a static spec (sizes, library path and symbol names).
+    The first lookup of an identifier opens its library and runs the `load`
+    function, e.g. to create keys; later lookups return the loaded entry.
+    Checking membership or iterating over the identifiers does not load anything.
+
+    Aliases can be used in place of their identifier, but are not iterated over.
+    """
+
+    def __init__(self, specs, load, aliases=None):
+        """
+        Args:
+            specs (dict): Algorithm identifier mapped to its static spec.
+            load (function): Called with a copy of a spec, returns the loaded entry.
+            aliases (dict, optional): Alias mapped to the identifier it stands for.
+        """
+        self._specs = specs
+        self._load = load
+        self._aliases = aliases or {}
+        self._entries = {}
+        self._locks = {name: threading.Lock() for name in specs}
+
+    def __getitem__(self, name):
+        name = self._aliases.get(name, name)
+        entry = self._entries.get(name)
+        if entry is not None:
+            return entry
+        with self._locks[name]:
+            entry = self._entries.get(name)
+            if entry is None:
+                entry = self._load(dict(self._specs[name]))
+                self._entries[name] = entry
+        return entry
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def __contains__(self, name):
+        return self._aliases.get(name, name) in self._specs
+
+    def spec(self, name):
+        """
+        Returns the static spec of an algorithm without loading it.
+
+        Args:
+            name (str): Algorithm identifier.
+
+        Returns:
+            dict: The spec.
+        """
+        return self._specs[self._aliases.get(name, name)]
+
+    def is_loaded(self, name):
+        """
+        Args:
+            name (str): Algorithm identifier.
+
+        Returns:
+            bool: True if the algorithm has already been loaded.
+        """
+        return self._aliases.get(name, name) in self._entries
+
+    def reset(self):
+        """
+        Forgets all loaded entries, so a forked worker loads the algorithms (and
+        generates its own keys) again instead of using those of its parent.
+        """
+        self._entries = {}
+        self._locks = {name: threading.Lock() for name in self._specs}
+
+    def warm_up(self, names, max_workers=None, wait=False):
+        """
+        Loads the given algorithms on a thread pool.
+
+        Args:
+            names (iterable of str): Identifiers to load; unknown identifiers are ignored.
+            max_workers (int, optional): Number of loader threads (default is the CPU count).
+            wait (bool): If False, loading runs in a background thread and this returns immediately;
+                errors are printed instead of raised.
+
+        Returns:
+            threading.Thread or None: The background thread, or None if `wait` is True
+                or there is nothing to load.
+        """
+        names = [self._aliases.get(name, name) for name in names if name in self]
+        if not names:
+            return None
+
+        def load_all():
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for _ in executor.map(self.__getitem__, names):
+                    pass
+
+        def load_all_in_background():
+            try:
+                load_all()
+            except Exception as e:
+                print(f"Error during warm-up: {e}")
+
+        if wait:
+            load_all()
+            return None
+        thread = threading.Thread(
+            target=load_all_in_background, name="algorithm-warm-up", daemon=True
+        )
+        thread.start()
+        return thread
+
+
+def selected_algorithms(variable, default):
+    """
+    Reads the algorithms selected by a configuration variable.
+
+    Args:
+        variable (str): Name of the environment variable, e.g. "KEMS".
+        default (list of str): Identifiers used if the variable is not set.
+
+    Returns:
+        list of str: The selected identifiers.
+    """
+    return parse_algorithm_list(os.getenv(variable)) or list(default)
+
+
+def parse_algorithm_list(value):
+    """
+    Parses a comma-separated list of algorithm identifiers from a configuration value.
+
+    Args:
+        value (str or None): Comma-separated identifiers.
+
+    Returns:
+        list of str: The identifiers, empty if `value` is empty or None.
+    """
+    if not value:
+        return []
+    return [name.strip() for name in value.split(",") if name.strip()]
@@ -0,0 +1,43 @@
+from algorithm_registry import DEFAULT_KEMS, resolve_symbols, selected_algorithms
+from libs_server import KEM_ALGORITHMS, generate_keypair
+import sys
+
+
+def benchmark(iterations):
+    """
+    Generates fresh keypairs for every selected KEM algorithm (`KEMS`) and logs each generation time
+    to "key_generation_times.csv". Only the libraries are loaded; the keystore is
+    neither read nor written, and the generated keys are discarded.
+
+    Args:
+        iterations (int): Number of keypairs to generate per algorithm.
+    """
+    for name in selected_algorithms("KEMS", DEFAULT_KEMS):
+        # Resolve the functions from the spec, the registry would load or store keys
+        algorithm = resolve_symbols(dict(KEM_ALGORITHMS.spec(name)))
+        for _ in range(iterations):
+            generate_keypair(
+                algorithm["public_key_bytes"],
+                algorithm["private_key_bytes"],
+                algorithm["keypair_algorithm"],
+                algorithm["identifier"],
+                algorithm["implementation"],
+            )
+        print(f"Benchmarked key generation for {algorithm['identifier']}")
+
+
+def main():
+    """
+    Entry point for the key generation benchmark.
+
+    Command-Line Usage:
+        python benchmark_keygen.py [ITERATIONS=1]
+    """
+    iterations = 1
+    if len(sys.argv) >= 2:
+        iterations = int(sys.argv[1])
+    benchmark(iterations)
+
+
+if __name__ == "__main__":
+    main()
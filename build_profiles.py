@@ -0,0 +1,79 @@
+import os
+
+# Root of the build trees; the default profile builds directly into it, every other
+# profile into a subdirectory named after the profile
+BUILD_DIR = "./build"
+
+# Profile the libraries are built with and loaded from unless BUILD_PROFILE is set
+DEFAULT_PROFILE = "o3"
+
+# File name of the optional library that combines the selected schemes of a profile
+COMBINED_LIBRARY = "libpqclean.so"
+
+# Compiler settings of each build profile. Profiles with "pgo" are built twice: first
+# instrumented, then, after a training run, with the recorded profile data
+BUILD_PROFILES = {
+    "o3": {"cflags": "-O3", "pgo": False},
+    "native": {"cflags": "-O3 -march=native -mtune=native", "pgo": False},
+    "lto": {"cflags": "-O3 -flto=auto", "pgo": False},
+    "pgo": {"cflags": "-O3", "pgo": True},
+    "os": {"cflags": "-Os", "pgo": False},
+}
+
+
+def profile_settings(profile):
+    """
+    Args:
+        profile (str): Name of a build profile, e.g. "native".
+
+    Returns:
+        dict: The profile's "cflags" and whether it uses profile-guided optimization.
+
+    Raises:
+        ValueError: If the profile is not in `BUILD_PROFILES`.
+    """
+    if profile not in BUILD_PROFILES:
+        raise ValueError(
+            f"Unknown build profile '{profile}', expected one of {', '.join(BUILD_PROFILES)}"
+        )
+    return BUILD_PROFILES[profile]
+
+
+def profile_dir(profile):
+    """
+    Args:
+        profile (str): Name of a build profile.
+
+    Returns:
+        str: Directory the profile's libraries are built into, e.g. "./build" for the
+            default profile and "./build/native" for the native profile.
+
+    Raises:
+        ValueError: If the profile is not in `BUILD_PROFILES`.
+    """
+    profile_settings(profile)
+    if profile == DEFAULT_PROFILE:
+        return BUILD_DIR
+    return os.path.join(BUILD_DIR, profile)
+
+
+def combined_library_path(profile):
+    """
+    Args:
+        profile (str): Name of a build profile.
+
+    Returns:
+        str: Path of the profile's combined library, e.g. "./build/libpqclean.so".
+    """
+    return os.path.join(profile_dir(profile), COMBINED_LIBRARY)
+
+
+def profile_data_dir(profile):
+    """
+    Args:
+        profile (str): Name of a build profile that uses profile-guided optimization.
+
+    Returns:
+        str: Directory the training run writes its profile data (.gcda files) to.
+    """
+    return os.path.join(profile_dir(profile), "profile-data")
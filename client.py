@@ -1,14 +1,43 @@
-from libs_client import KEM_ALGORITHMS, SIGNATURE_ALGORITHMS
-from utils_client import send_data
+from libs_client import BUILD_PROFILE, KEM_ALGORITHMS, SIGNATURE_ALGORITHMS
+from algorithm_registry import DEFAULT_KEMS, DEFAULT_SIGNATURES, selected_algorithms
+from utils_client import TRANSPORT, send_data
+from transport import TransientError
+from load_generator import LOAD_TIMINGS_HEADER, LoadGenerator
+from process_driver import run_workers, shard_path
+from timing_writer import install_signal_handlers, write_header
+import argparse
 import csv
-import time
-import sys
 import requests
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Wire format for messages sent to the server ("binary" or "json")
+WIRE_FORMAT = os.getenv("WIRE_FORMAT", "binary")
+
+# Algorithms to benchmark, e.g. "kyber512,frodokem640shake" (default: DEFAULT_KEMS and
+# DEFAULT_SIGNATURES); any scheme of the registry can be selected
+KEMS = selected_algorithms("KEMS", DEFAULT_KEMS)
+SIGNATURES = selected_algorithms("SIGNATURES", DEFAULT_SIGNATURES)
+
+CLIENT_TIMINGS_FILE = "client_timings.csv"
+CLIENT_TIMINGS_HEADER = [
+    "KEM Algorithm",
+    "Signature Algorithm",
+    "Device Name",
+    "Encapsulation Time",
+    "Encryption Time",
+    "Client Hash Time",
+    "Sign Time",
+    "Data Size",
+    "Worker Id",
+    "KEM Implementation",
+    "Signature Implementation",
+    "Build Profile",
+]
+LOAD_TIMINGS_FILE = "load_timings.csv"
+
 # URL for data fetch
 url = "https://ogcapi.hft-stuttgart.de/sta/udigit4icity/v1.1/Observations"
 
@@ -39,16 +68,14 @@ RAW_DATA = fetch()
 
 def check_and_write_csv(file_name, header):
     """
-    Ensures a CSV file exists with the specified header. Creates the file if it doesn't exist.
+    Ensures a CSV file exists with the specified header. Creates the file if it doesn't
+    exist, and moves a file with a different header to "<file_name>.old" first.
 
     Args:
         file_name (str): The name of the CSV file.
         header (list of str): List of column headers for the CSV file.
     """
-    if not os.path.exists(file_name):
-        with open(file_name, "w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(header)
+    write_header(file_name, header)
 
 
 def file_setup():
@@ -60,25 +87,15 @@ def file_setup():
         - "client_timings.csv" for client operation timings.
         - "key_sizes_client.csv" for logging key sizes.
     """
-    check_and_write_csv(
-        "client_timings.csv",
-        [
-            "KEM Algorithm",
-            "Signature Algorithm",
-            "Device Name",
-            "Encapsulation Time",
-            "Encryption Time",
-            "Client Hash Time",
-            "Sign Time",
-            "Data Size",
-        ],
-    )
+    check_and_write_csv(CLIENT_TIMINGS_FILE, CLIENT_TIMINGS_HEADER)
     with open("key_sizes_client.csv", "w", newline="") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["name", "public_key_size", "secret_key_size"])
 
 
-def write_timings(timings, kem_algorithm, sign_algorithm):
+def write_timings(
+    timings, kem_algorithm, sign_algorithm, file_name=CLIENT_TIMINGS_FILE, worker_id=0
+):
     """
     Writes timing information for client operations to a CSV file.
 
@@ -86,9 +103,11 @@ def write_timings(timings, kem_algorithm, sign_algorithm):
         timings (dict): Timing information from operations.
         kem_algorithm (str): Identifier for the KEM algorithm used.
         sign_algorithm (str): Identifier for the signature algorithm used.
+        file_name (str): The CSV file to append to.
+        worker_id (int): Id of the client process.
     """
     client_device = os.getenv("DEVICE_NAME")
-    with open("client_timings.csv", "a", newline="") as file:
+    with open(file_name, "a", newline="") as file:
         writer = csv.writer(file)
         writer.writerow(
             [
@@ -100,19 +119,27 @@ def write_timings(timings, kem_algorithm, sign_algorithm):
                 timings["client_hash_time"],
                 timings["sign_time"],
                 len(RAW_DATA),
+                worker_id,
+                KEM_ALGORITHMS.spec(kem_algorithm)["implementation"],
+                SIGNATURE_ALGORITHMS.spec(sign_algorithm)["implementation"],
+                BUILD_PROFILE,
             ]
         )
 
 
-def run(url):
+def run(url, timings_file=CLIENT_TIMINGS_FILE, worker_id=0):
     """
-    Iterates over all KEM and signature algorithms, sending data to the server and logging timings.
+    Iterates over the selected KEM and signature algorithms, sending data to the server and logging timings.
 
     Args:
         url (str): Server URL.
+        timings_file (str): The CSV file the timings are appended to.
+        worker_id (int): Id of the client process.
     """
-    for kem_algorithm in KEM_ALGORITHMS.values():
-        for sign_algorithm in SIGNATURE_ALGORITHMS.values():
+    for kem_name in KEMS:
+        kem_algorithm = KEM_ALGORITHMS[kem_name]
+        for sign_name in SIGNATURES:
+            sign_algorithm = SIGNATURE_ALGORITHMS[sign_name]
             try:
                 # Send data and capture response and timings
                 message, timings = send_data(
@@ -127,15 +154,79 @@ def run(url):
                     sign_algorithm["private_key"],
                     sign_algorithm["signature_bytes"],
                     url,
+                    WIRE_FORMAT,
                 )
                 # Log the timings
                 write_timings(
-                    timings, kem_algorithm["identifier"], sign_algorithm["identifier"]
+                    timings,
+                    kem_algorithm["identifier"],
+                    sign_algorithm["identifier"],
+                    timings_file,
+                    worker_id,
                 )
+            except TransientError as e:
+                # The transport already retried with backoff, move on to the next pair
+                print("Server unavailable, maybe Restarting:", str(e))
             except Exception as e:
                 print("Error with", kem_algorithm["identifier"], str(e))
-                print("Server Error, maybe Restarting")
-                time.sleep(5)
+
+
+def run_load(
+    url, rate, concurrency, duration, output_file=LOAD_TIMINGS_FILE, worker_id=0
+):
+    """
+    Sends data for all selected algorithm pairs concurrently for a fixed duration and
+    logs per-request latencies to "load_timings.csv".
+
+    Args:
+        url (str): Server URL.
+        rate (float or None): Target requests per second (open loop); None to send back to back.
+        concurrency (int): Number of requests in flight at most.
+        duration (float): Duration in seconds.
+        output_file (str): The CSV file the latencies are appended to.
+        worker_id (int): Id of the client process.
+    """
+    pairs = [(kem_name, sign_name) for kem_name in KEMS for sign_name in SIGNATURES]
+    generator = LoadGenerator(
+        url, RAW_DATA, pairs, WIRE_FORMAT, rate, concurrency, output_file, worker_id
+    )
+    generator.warm_up()
+    generator.run(duration)
+
+
+def run_worker(worker_id, url, args):
+    """
+    Runs one forked client process with its own signature keys and connections,
+    writing its timings to its own shard of the CSV files.
+
+    Args:
+        worker_id (int): Id of the client process.
+        url (str): Server URL.
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    KEM_ALGORITHMS.reset()
+    SIGNATURE_ALGORITHMS.reset()
+    TRANSPORT.reset()
+    # Stops the worker with SystemExit (after flushing pending load timings)
+    # when the driver forwards a signal
+    install_signal_handlers()
+
+    if args.rate or args.concurrency:
+        # The offered load is split evenly between the processes
+        run_load(
+            url,
+            args.rate / args.processes if args.rate else None,
+            max(1, (args.concurrency or 8) // args.processes),
+            args.duration,
+            shard_path(LOAD_TIMINGS_FILE, worker_id),
+            worker_id,
+        )
+        return
+
+    timings_file = shard_path(CLIENT_TIMINGS_FILE, worker_id)
+    check_and_write_csv(timings_file, CLIENT_TIMINGS_HEADER)
+    while True:
+        run(url, timings_file, worker_id)
 
 
 def main():
@@ -144,24 +235,47 @@ def main():
     and continuously sends data to the server.
 
     Command-Line Usage:
-        python client.py <SERVER_IP> [PORT=5000]
+        python client.py <SERVER_IP> [PORT=5000] [--rate RPS] [--concurrency N] [--duration SECONDS]
+                         [--processes N]
 
     Args:
         SERVER_IP (str): The IP address of the server.
         PORT (int, optional): The port number to use (default is 5000).
+        --rate (float, optional): Load mode: target requests per second, scheduled open-loop.
+        --concurrency (int, optional): Load mode: number of requests in flight at most.
+        --duration (float, optional): Load mode: duration in seconds (default is 60).
+        --processes (int, optional): Number of client processes (default is 1); their timings
+            are merged into the CSV files when they finish or the client is stopped.
     """
-    if len(sys.argv) < 2:
-        print("Usage: python client.py <SERVER_IP> [PORT=5000]")
-        return
-
-    server_ip = sys.argv[1]
-    port = 5000
-    if len(sys.argv) >= 3:
-        port = int(sys.argv[2])
+    parser = argparse.ArgumentParser(description="Send benchmark data to the server.")
+    parser.add_argument("server_ip", metavar="SERVER_IP")
+    parser.add_argument("port", metavar="PORT", nargs="?", type=int, default=5000)
+    parser.add_argument("--rate", type=float, help="target requests per second")
+    parser.add_argument("--concurrency", type=int, help="requests in flight at most")
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--processes", type=int, default=1)
+    args = parser.parse_args()
 
-    url = f"http://{server_ip}:{port}/"
+    url = f"http://{args.server_ip}:{args.port}/"
     file_setup()
 
+    if args.processes > 1:
+        run_workers(
+            lambda worker_id: run_worker(worker_id, url, args),
+            args.processes,
+            [
+                (CLIENT_TIMINGS_FILE, CLIENT_TIMINGS_HEADER),
+                (LOAD_TIMINGS_FILE, LOAD_TIMINGS_HEADER),
+            ],
+        )
+        return
+
+    if args.rate or args.concurrency:
+        # Flushes the pending load timings when the client is stopped with a signal
+        install_signal_handlers()
+        run_load(url, args.rate, args.concurrency or 8, args.duration)
+        return
+
     # Continuously send data to the server
     while True:
         run(url)
@@ -0,0 +1,594 @@
+import argparse
+import csv
+import ctypes
+import glob
+import hashlib
+import os
+import statistics
+import subprocess
+import sys
+import time
+from algorithm_index import KEM_INDEX, SIGNATURE_INDEX
+from build_profiles import BUILD_PROFILES, DEFAULT_PROFILE
+from algorithm_registry import (
+    DEFAULT_KEMS,
+    DEFAULT_SIGNATURES,
+    library_path,
+    load_library,
+    selected_algorithms,
+    typed_function,
+)
+from cpu_features import supports
+from generate_make_files import (
+    BASE_DIR,
+    KECCAK4X_DIR,
+    RUST_SUFFIX,
+    compiler_options,
+    resolve_algorithms,
+    uses_keccak4x,
+)
+from libs_server import DEVICE_NAME, RUST_KEM_SPECS
+
+COMPARISON_FILE = "backend_comparison.csv"
+COMPARISON_HEADER = [
+    "Scheme",
+    "Backend",
+    "Operation",
+    "Median Time",
+    "P99 Time",
+    "Iterations",
+    "Device Name",
+    "Build Profile",
+]
+
+# Libraries built with PQClean's deterministic NIST DRBG instead of the system RNG
+KAT_BUILD_DIR = "./build/kat"
+KAT_RNG_SOURCE = os.path.join(BASE_DIR, "test", "common", "nistkatrng.c")
+
+# Message signed by the speed and cross-verification runs
+MESSAGE = bytes(range(32))
+
+
+def kem_backends(scheme, profile=DEFAULT_PROFILE):
+    """
+    Loads every backend of a KEM that was built and that the CPU supports.
+
+    Args:
+        scheme (str): Name of the scheme directory, e.g. "kyber512".
+        profile (str): Build profile of the PQClean libraries.
+
+    Returns:
+        list of dict: Backends with "name", the library functions "keypair",
+            "encapsulate" and "decapsulate", and for PQClean backends the
+            implementation entry of the algorithm index.
+    """
+    backends = []
+    for implementation in KEM_INDEX[scheme]["implementations"]:
+        path = library_path("crypto_kem", scheme, implementation["name"], profile)
+        if not supports(implementation) or not os.path.isfile(path):
+            continue
+        library = load_library(path)
+        namespace = implementation["namespace"]
+        backends.append(
+            {
+                "name": implementation["name"],
+                "implementation": implementation,
+                "keypair": typed_function(library, f"{namespace}_crypto_kem_keypair"),
+                "encapsulate": typed_function(library, f"{namespace}_crypto_kem_enc"),
+                "decapsulate": typed_function(library, f"{namespace}_crypto_kem_dec"),
+            }
+        )
+    rust = RUST_KEM_SPECS.get(f"{scheme}rust")
+    if rust is not None and os.path.isfile(rust["library_path"]):
+        library = load_library(rust["library_path"])
+        backends.append(
+            {
+                "name": "rust",
+                "implementation": None,
+                "keypair": typed_function(library, rust["keypair_symbol"], rust),
+                "encapsulate": typed_function(library, "encapsulate_key", rust),
+                "decapsulate": typed_function(library, "decapsulate_key", rust),
+            }
+        )
+    return backends
+
+
+def signature_backends(scheme, profile=DEFAULT_PROFILE):
+    """
+    Loads every backend of a signature scheme that was built and that the CPU supports.
+
+    Args:
+        scheme (str): Name of the scheme directory, e.g. "dilithium2".
+        profile (str): Build profile of the libraries.
+
+    Returns:
+        list of dict: Backends with "name", the implementation entry and the library
+            functions "keypair", "sign" and "verify".
+    """
+    backends = []
+    for implementation in SIGNATURE_INDEX[scheme]["implementations"]:
+        path = library_path("crypto_sign", scheme, implementation["name"], profile)
+        if not supports(implementation) or not os.path.isfile(path):
+            continue
+        library = load_library(path)
+        namespace = implementation["namespace"]
+        backends.append(
+            {
+                "name": implementation["name"],
+                "implementation": implementation,
+                "keypair": typed_function(library, f"{namespace}_crypto_sign_keypair"),
+                "sign": typed_function(library, f"{namespace}_crypto_sign_signature"),
+                "verify": typed_function(library, f"{namespace}_crypto_sign_verify"),
+            }
+        )
+    return backends
+
+
+def call(function, *args):
+    """
+    Calls a library function and checks its return code.
+
+    Raises:
+        ValueError: If the function returns a non-zero value.
+    """
+    result = function(*args)
+    if result != 0:
+        raise ValueError(f"{function.__name__} failed with error code {result}")
+
+
+def kem_keypair(backend, sizes):
+    pk = ctypes.create_string_buffer(sizes["public_key_bytes"])
+    sk = ctypes.create_string_buffer(sizes["private_key_bytes"])
+    call(backend["keypair"], pk, sk)
+    return pk.raw, sk.raw
+
+
+def kem_encapsulate(backend, sizes, public_key):
+    ct = ctypes.create_string_buffer(sizes["cipher_text_bytes"])
+    ss = ctypes.create_string_buffer(sizes["shared_secret_bytes"])
+    call(backend["encapsulate"], ct, ss, public_key)
+    return ct.raw, ss.raw
+
+
+def kem_decapsulate(backend, sizes, cipher_text, private_key):
+    ss = ctypes.create_string_buffer(sizes["shared_secret_bytes"])
+    call(backend["decapsulate"], ss, cipher_text, private_key)
+    return ss.raw
+
+
+def sign_keypair(backend, sizes):
+    pk = ctypes.create_string_buffer(sizes["public_key_size"])
+    sk = ctypes.create_string_buffer(sizes["private_key_size"])
+    call(backend["keypair"], pk, sk)
+    return pk.raw, sk.raw
+
+
+def sign(backend, sizes, message, private_key):
+    signature = ctypes.create_string_buffer(sizes["signature_bytes"])
+    signature_length = ctypes.c_size_t()
+    call(
+        backend["sign"],
+        signature,
+        ctypes.byref(signature_length),
+        message,
+        len(message),
+        private_key,
+    )
+    return signature.raw[: signature_length.value]
+
+
+def verify(backend, signature, message, public_key):
+    return backend["verify"](signature, len(signature), message, len(message), public_key) == 0
+
+
+def check_kem(scheme, backends):
+    """
+    Cross-checks all backends of a KEM: the keys of every backend are used to
+    encapsulate with every backend and to decapsulate with every backend.
+
+    Args:
+        scheme (str): Name of the scheme directory.
+        backends (list of dict): Backends from `kem_backends`.
+
+    Returns:
+        list of str: Descriptions of the combinations whose shared secrets differ.
+    """
+    sizes = KEM_INDEX[scheme]
+    failures = []
+    for key_backend in backends:
+        public_key, private_key = kem_keypair(key_backend, sizes)
+        for encapsulation_backend in backends:
+            cipher_text, shared_secret = kem_encapsulate(
+                encapsulation_backend, sizes, public_key
+            )
+            for decapsulation_backend in backends:
+                decapsulated = kem_decapsulate(
+                    decapsulation_backend, sizes, cipher_text, private_key
+                )
+                if decapsulated != shared_secret:
+                    failures.append(
+                        f"keys {key_backend['name']}, encapsulation "
+                        f"{encapsulation_backend['name']}, decapsulation "
+                        f"{decapsulation_backend['name']}: shared secrets differ"
+                    )
+    return failures
+
+
+def check_signature(scheme, backends):
+    """
+    Cross-checks all backends of a signature scheme: the keys of every backend are
+    used to sign with every backend and to verify with every backend.
+
+    Args:
+        scheme (str): Name of the scheme directory.
+        backends (list of dict): Backends from `signature_backends`.
+
+    Returns:
+        list of str: Descriptions of the combinations whose signature was rejected.
+    """
+    sizes = SIGNATURE_INDEX[scheme]
+    failures = []
+    for key_backend in backends:
+        public_key, private_key = sign_keypair(key_backend, sizes)
+        for sign_backend in backends:
+            signature = sign(sign_backend, sizes, MESSAGE, private_key)
+            for verify_backend in backends:
+                if not verify(verify_backend, signature, MESSAGE, public_key):
+                    failures.append(
+                        f"keys {key_backend['name']}, signature {sign_backend['name']}, "
+                        f"verification {verify_backend['name']}: signature rejected"
+                    )
+    return failures
+
+
+def kat_library(type_name, scheme, implementation):
+    """
+    Builds (once) a library of an implementation that draws its randomness from the
+    deterministic NIST DRBG, as PQClean's nistkat test does.
+
+    Args:
+        type_name (str): "crypto_kem" or "crypto_sign".
+        scheme (str): Name of the scheme directory.
+        implementation (dict): Implementation entry of the algorithm index.
+
+    Returns:
+        ctypes.CDLL: The loaded library.
+
+    Raises:
+        subprocess.CalledProcessError: If the library does not compile.
+    """
+    name = implementation["name"]
+    path = os.path.join(KAT_BUILD_DIR, type_name, f"lib{scheme}_{name}.so")
+    if not os.path.isfile(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        implementation_dir = os.path.join(BASE_DIR, type_name, scheme, name)
+        sources = [
+            source
+            for pattern in ("*.c", "*.S", "*.s")
+            for source in glob.glob(os.path.join(implementation_dir, pattern))
+        ]
+        sources += [
+            source
+            for source in glob.glob(os.path.join(BASE_DIR, "common", "*.c"))
+            if os.path.basename(source) != "randombytes.c"
+        ]
+        sources.append(KAT_RNG_SOURCE)
+        options = compiler_options(implementation).split()
+        if uses_keccak4x(implementation_dir):
+            options.append(f"-I{KECCAK4X_DIR}")
+            sources += glob.glob(os.path.join(KECCAK4X_DIR, "*.c"))
+        subprocess.run(
+            ["gcc", "-shared", "-O3", "-fPIC", f"-I{BASE_DIR}/common", *options,
+             f"-Wa,-I{implementation_dir}", "-o", path, *sources],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    library = load_library(path)
+    library.nist_kat_init.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+    library.nist_kat_init.restype = None
+    return library
+
+
+def _hex_line(label, data):
+    # Same format as fprintBstr in PQClean's nistkat.c
+    return f"{label} = {data.hex().upper() or '00'}\n"
+
+
+def _kat_seed(library):
+    # Seeds the DRBG and draws the seed of KAT count 0, as PQClean's nistkat.c does
+    randombytes = library.PQCLEAN_randombytes
+    randombytes.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    randombytes.restype = ctypes.c_int
+    library.nist_kat_init(bytes(range(48)), None, 256)
+    seed = ctypes.create_string_buffer(48)
+    randombytes(seed, 48)
+    return randombytes, seed.raw
+
+
+def kem_kat_hash(scheme, implementation):
+    """
+    Recomputes the output of PQClean's nistkat test for a KEM implementation.
+
+    Args:
+        scheme (str): Name of the scheme directory.
+        implementation (dict): Implementation entry of the algorithm index.
+
+    Returns:
+        str: SHA-256 of the KAT output, comparable to "nistkat-sha256" in META.yml.
+    """
+    library = kat_library("crypto_kem", scheme, implementation)
+    _, seed = _kat_seed(library)
+    library.nist_kat_init(seed, None, 256)
+    namespace = implementation["namespace"]
+    backend = {
+        "keypair": typed_function(library, f"{namespace}_crypto_kem_keypair"),
+        "encapsulate": typed_function(library, f"{namespace}_crypto_kem_enc"),
+    }
+    sizes = KEM_INDEX[scheme]
+    public_key, private_key = kem_keypair(backend, sizes)
+    cipher_text, shared_secret = kem_encapsulate(backend, sizes, public_key)
+    output = (
+        "count = 0\n"
+        + _hex_line("seed", seed)
+        + _hex_line("pk", public_key)
+        + _hex_line("sk", private_key)
+        + _hex_line("ct", cipher_text)
+        + _hex_line("ss", shared_secret)
+    )
+    return hashlib.sha256(output.encode("ascii")).hexdigest()
+
+
+def signature_kat_hash(scheme, implementation):
+    """
+    Recomputes the output of PQClean's nistkat test for a signature implementation.
+
+    Args:
+        scheme (str): Name of the scheme directory.
+        implementation (dict): Implementation entry of the algorithm index.
+
+    Returns:
+        str: SHA-256 of the KAT output, comparable to "nistkat-sha256" in META.yml.
+    """
+    library = kat_library("crypto_sign", scheme, implementation)
+    randombytes, seed = _kat_seed(library)
+    message = ctypes.create_string_buffer(33)
+    randombytes(message, 33)
+    library.nist_kat_init(seed, None, 256)
+    namespace = implementation["namespace"]
+    sizes = SIGNATURE_INDEX[scheme]
+    public_key, private_key = sign_keypair(
+        {"keypair": typed_function(library, f"{namespace}_crypto_sign_keypair")}, sizes
+    )
+    signed_message = ctypes.create_string_buffer(33 + sizes["signature_bytes"])
+    signed_length = ctypes.c_size_t()
+    call(
+        typed_function(library, f"{namespace}_crypto_sign"),
+        signed_message,
+        ctypes.byref(signed_length),
+        message.raw,
+        33,
+        private_key,
+    )
+    output = (
+        "count = 0\n"
+        + _hex_line("seed", seed)
+        + "mlen = 33\n"
+        + _hex_line("msg", message.raw)
+        + _hex_line("pk", public_key)
+        + _hex_line("sk", private_key)
+        + f"smlen = {signed_length.value}\n"
+        + _hex_line("sm", signed_message.raw[: signed_length.value])
+    )
+    return hashlib.sha256(output.encode("ascii")).hexdigest()
+
+
+def measure(operation, iterations):
+    """
+    Args:
+        operation (function): Called without arguments once per iteration.
+        iterations (int): Number of calls.
+
+    Returns:
+        tuple: Median and 99th percentile time per call in nanoseconds.
+    """
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        operation()
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(0.99 * len(samples)))]
+
+
+def time_kem(scheme, backend, iterations):
+    """
+    Returns:
+        dict: Operation ("keygen", "encapsulation", "decapsulation") mapped to
+            (median, p99) in nanoseconds.
+    """
+    sizes = KEM_INDEX[scheme]
+    public_key, private_key = kem_keypair(backend, sizes)
+    cipher_text, _ = kem_encapsulate(backend, sizes, public_key)
+    return {
+        "keygen": measure(lambda: kem_keypair(backend, sizes), iterations),
+        "encapsulation": measure(
+            lambda: kem_encapsulate(backend, sizes, public_key), iterations
+        ),
+        "decapsulation": measure(
+            lambda: kem_decapsulate(backend, sizes, cipher_text, private_key), iterations
+        ),
+    }
+
+
+def time_signature(scheme, backend, iterations):
+    """
+    Returns:
+        dict: Operation ("keygen", "sign", "verify") mapped to (median, p99) in nanoseconds.
+    """
+    sizes = SIGNATURE_INDEX[scheme]
+    public_key, private_key = sign_keypair(backend, sizes)
+    signature = sign(backend, sizes, MESSAGE, private_key)
+    return {
+        "keygen": measure(lambda: sign_keypair(backend, sizes), iterations),
+        "sign": measure(lambda: sign(backend, sizes, MESSAGE, private_key), iterations),
+        "verify": measure(
+            lambda: verify(backend, signature, MESSAGE, public_key), iterations
+        ),
+    }
+
+
+def print_table(scheme, timings):
+    """
+    Prints the median and p99 of every operation with one column per backend.
+
+    Args:
+        scheme (str): Name of the scheme.
+        timings (dict): Backend name mapped to the result of `time_kem` or `time_signature`.
+    """
+    names = list(timings)
+    print(f"{scheme:<28}" + "".join(f"{name:>22}" for name in names))
+    for operation in next(iter(timings.values())):
+        for index, statistic in enumerate(("median", "p99")):
+            cells = "".join(
+                f"{timings[name][operation][index] / 1e6:>19.3f} ms" for name in names
+            )
+            print(f"  {operation:<15}{statistic:<11}" + cells)
+
+
+def compare(type_name, scheme, iterations, kat, writer, profile=DEFAULT_PROFILE):
+    """
+    Checks and times all backends of one scheme.
+
+    Args:
+        type_name (str): "crypto_kem" or "crypto_sign".
+        scheme (str): Name of the scheme directory.
+        iterations (int): Timed calls per operation and backend.
+        kat (bool): If True, the KAT hash of every PQClean backend is checked against META.yml.
+        writer (csv.writer or None): Receives one row per backend and operation; if
+            None, the times are neither printed nor written.
+        profile (str): Build profile of the PQClean libraries.
+
+    Returns:
+        list of str: The failed checks.
+    """
+    if type_name == "crypto_kem":
+        index, backends = KEM_INDEX, kem_backends(scheme, profile)
+        check, time_backend = check_kem, time_kem
+    else:
+        index, backends = SIGNATURE_INDEX, signature_backends(scheme, profile)
+        check, time_backend = check_signature, time_signature
+    if not backends:
+        return [f"{scheme}: no backend was built"]
+
+    failures = [f"{scheme}: {failure}" for failure in check(scheme, backends)]
+    if kat:
+        kat_hash = kem_kat_hash if type_name == "crypto_kem" else signature_kat_hash
+        for backend in backends:
+            if backend["implementation"] is None:
+                # The Rust backend draws from the OS RNG and cannot be seeded
+                continue
+            actual = kat_hash(scheme, backend["implementation"])
+            if actual != index[scheme]["nistkat_sha256"]:
+                failures.append(f"{scheme}: {backend['name']} does not match the NIST KAT")
+
+    timings = {
+        backend["name"]: time_backend(scheme, backend, iterations) for backend in backends
+    }
+    if writer is None:
+        return failures
+    print_table(scheme, timings)
+    for backend_name, operations in timings.items():
+        for operation, (median, p99) in operations.items():
+            writer.writerow(
+                [
+                    scheme,
+                    backend_name,
+                    operation,
+                    median,
+                    p99,
+                    iterations,
+                    DEVICE_NAME,
+                    profile,
+                ]
+            )
+    return failures
+
+
+def main():
+    """
+    Entry point for the backend comparison. Checks that all backends of each scheme
+    (PQClean implementations and, for Kyber, the Rust library) interoperate and
+    match the NIST KAT, then prints their median and p99 times side by side and
+    appends them to `COMPARISON_FILE`. Exits with status 1 if a check failed.
+
+    With --train, every built scheme is only exercised, without the KAT check and
+    without output; run_make_files.py uses this as the training run of PGO builds.
+
+    Command-Line Usage:
+        python compare_backends.py [SCHEME ...] [--iterations 100] [--no-kat]
+            [--profile o3] [--train]
+
+    Args:
+        SCHEME (str, optional): KEM or signature schemes to compare (default: the
+            selected `KEMS` and `SIGNATURES`, or all schemes with --train).
+    """
+    parser = argparse.ArgumentParser(description="Compare the backends of each scheme.")
+    parser.add_argument("schemes", nargs="*", help="KEM or signature schemes")
+    parser.add_argument("--iterations", type=int, default=100, help="Timed calls per operation")
+    parser.add_argument(
+        "--no-kat", dest="kat", action="store_false", help="Skip the NIST KAT check"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=BUILD_PROFILES,
+        default=DEFAULT_PROFILE,
+        help="Build profile of the libraries (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--train", action="store_true", help="Only exercise the libraries, e.g. for PGO"
+    )
+    args = parser.parse_args()
+
+    if args.schemes:
+        names = args.schemes
+    elif args.train:
+        names = list(KEM_INDEX) + list(SIGNATURE_INDEX)
+    else:
+        names = selected_algorithms("KEMS", DEFAULT_KEMS) + selected_algorithms(
+            "SIGNATURES", DEFAULT_SIGNATURES
+        )
+    schemes, rust, unknown = resolve_algorithms(names)
+    if unknown:
+        parser.error(f"unknown schemes {', '.join(unknown)}")
+    # The Rust libraries are compared as a backend of the PQClean scheme
+    for name in rust:
+        scheme = ("crypto_kem", name[: -len(RUST_SUFFIX)])
+        if scheme not in schemes:
+            schemes.append(scheme)
+
+    if args.train:
+        # Schemes the profile did not build are skipped, the run only records profile data
+        for type_name, scheme in schemes:
+            compare(type_name, scheme, args.iterations, False, None, args.profile)
+        return
+
+    file_exists = os.path.isfile(COMPARISON_FILE)
+    failures = []
+    with open(COMPARISON_FILE, "a", newline="") as file:
+        writer = csv.writer(file)
+        if not file_exists:
+            writer.writerow(COMPARISON_HEADER)
+        for type_name, scheme in schemes:
+            failures += compare(
+                type_name, scheme, args.iterations, args.kat, writer, args.profile
+            )
+
+    for failure in failures:
+        print(f"FAILED {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -92,6 +92,13 @@ def setup(pi_info):
     # Check if the installation succeeded
     if "Installation completed" in out:
         print("Installation succeeded.")
+        # Key generation is benchmarked explicitly; the server reuses its stored keys
+        print("Running benchmark_keygen.py...")
+        command = (
+            "cd /home/jonas/git-repos/raspi_server && "
+            ".venv/bin/python benchmark_keygen.py"
+        )
+        ssh_command(pi_info, command)
         return True
 
     print("Installation failed.")
@@ -0,0 +1,293 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PoolFullError(Exception):
+    """
+    Raised when a task is rejected because its pool's queue or its algorithm pair's
+    in-flight limit is full.
+
+    Attributes:
+        retry_after (float): Estimated seconds until the queued work has been processed.
+    """
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _percentile(sorted_samples, fraction):
+    if not sorted_samples:
+        return None
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index] / 1e6
+
+
+class CostClassPool:
+    """
+    Thread pool for one cost class with a bounded queue and latency statistics.
+
+    At most `max_workers` tasks run at a time and at most `max_queue` wait for a
+    thread; further submissions are rejected with `PoolFullError` instead of
+    queueing without bound.
+    """
+
+    def __init__(
+        self, name, max_workers, max_queue, samples=1024, default_service_time_ms=0
+    ):
+        """
+        Args:
+            name (str): Name of the cost class.
+            max_workers (int): Number of threads.
+            max_queue (int): Maximum number of tasks waiting for a thread.
+            samples (int): Number of recent tasks the latency percentiles are computed from.
+            default_service_time_ms (float): Service time assumed for the retry estimate
+                before any task has finished.
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.default_service_time_ns = default_service_time_ms * 1e6
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-pool"
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._queue_times = deque(maxlen=samples)
+        self._service_times = deque(maxlen=samples)
+
+    def submit(self, fn, /, *args, **kwargs):
+        """
+        Schedules `fn(*args, **kwargs)` on the pool.
+
+        Returns:
+            concurrent.futures.Future: The future of the call.
+
+        Raises:
+            PoolFullError: If `max_queue` tasks are already waiting.
+        """
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise PoolFullError(
+                    f"The {self.name} pool is full.", self._estimated_wait()
+                )
+            self.queued += 1
+        submitted = time.monotonic_ns()
+
+        def run():
+            started = time.monotonic_ns()
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finished = time.monotonic_ns()
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+                    self._queue_times.append(started - submitted)
+                    self._service_times.append(finished - started)
+
+        return self._executor.submit(run)
+
+    def _mean_service_time(self, fallback=None):
+        if not self._service_times:
+            return self.default_service_time_ns if fallback is None else fallback
+        return sum(self._service_times) / len(self._service_times)
+
+    def _estimated_wait(self, fallback=None):
+        # Called with the lock held
+        return (
+            (self.queued + self.running)
+            * self._mean_service_time(fallback)
+            / self.max_workers
+            / 1e9
+        )
+
+    def estimated_wait(self, service_time_ns=None):
+        """
+        Args:
+            service_time_ns (float, optional): Service time to assume if no task has
+                finished yet, instead of the pool's default.
+
+        Returns:
+            float: Estimated seconds until the queued and running tasks are done.
+        """
+        with self._lock:
+            return self._estimated_wait(service_time_ns)
+
+    def stats(self):
+        """
+        Returns:
+            dict: Configuration, current queue and task counters, and the p50/p99
+                queue wait and service times in milliseconds over the recent tasks.
+        """
+        with self._lock:
+            queue_times = sorted(self._queue_times)
+            service_times = sorted(self._service_times)
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "queue_time_p50_ms": _percentile(queue_times, 0.5),
+                "queue_time_p99_ms": _percentile(queue_times, 0.99),
+                "service_time_p50_ms": _percentile(service_times, 0.5),
+                "service_time_p99_ms": _percentile(service_times, 0.99),
+            }
+
+    def shutdown(self, wait=True):
+        """
+        Stops the pool after the submitted tasks, see `ThreadPoolExecutor.shutdown`.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class CostClassRouter:
+    """
+    Routes the messages of each KEM / signature algorithm pair to a cheap or a heavy pool.
+
+    The cost of a pair is the exponentially weighted moving average of the time its
+    messages took to handle. Pairs whose cost exceeds `heavy_threshold_ms` go to the
+    heavy pool, so a burst of e.g. McEliece or Rainbow messages only queues behind
+    itself while Kyber and Falcon messages keep their own threads. Pairs that were
+    not measured yet start in the heavy pool: their first message may load the
+    libraries and generate the keys, e.g. a McEliece keypair, which must not block the
+    cheap pool. For the same reason the first measurement of a pair is discarded.
+
+    With `max_in_flight`, a pair with that many messages queued or running is
+    rejected before it can fill its pool's queue and crowd out the other pairs.
+
+    The retry estimate of a rejection uses the pool's recent service times, else the
+    pair's cost, else the pool's default service time.
+    """
+
+    def __init__(
+        self, cheap, heavy, heavy_threshold_ms, max_in_flight=0, smoothing=0.2
+    ):
+        """
+        Args:
+            cheap (CostClassPool): Pool for cheap algorithm pairs.
+            heavy (CostClassPool): Pool for expensive algorithm pairs.
+            heavy_threshold_ms (float): Cost in milliseconds above which a pair is heavy.
+            max_in_flight (int): Maximum number of queued or running messages per algorithm
+                pair; 0 for no limit.
+            smoothing (float): Weight of the latest measurement in the moving average.
+        """
+        self.cheap = cheap
+        self.heavy = heavy
+        self.heavy_threshold_ns = heavy_threshold_ms * 1e6
+        self.max_in_flight = max_in_flight
+        self.smoothing = smoothing
+        self._costs = {}
+        # Pairs whose first measurement has been discarded
+        self._seen = set()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def pool_for(self, kem_algo_name, sign_algorithm_name):
+        """
+        Args:
+            kem_algo_name (str): Name of the KEM algorithm.
+            sign_algorithm_name (str): Name of the signature algorithm.
+
+        Returns:
+            CostClassPool: The pool for the algorithm pair.
+        """
+        cost = self._costs.get((kem_algo_name, sign_algorithm_name))
+        if cost is None or cost > self.heavy_threshold_ns:
+            return self.heavy
+        return self.cheap
+
+    def submit(self, kem_algo_name, sign_algorithm_name, fn, /, *args, **kwargs):
+        """
+        Schedules `fn(*args, **kwargs)` on the pool of the algorithm pair and records its cost.
+
+        Returns:
+            concurrent.futures.Future: The future of the call.
+
+        Raises:
+            PoolFullError: If the pair's in-flight limit or the pool's queue is full.
+        """
+        pair = (kem_algo_name, sign_algorithm_name)
+        pool = self.pool_for(*pair)
+        with self._lock:
+            in_flight = self._in_flight.get(pair, 0)
+            if self.max_in_flight and in_flight >= self.max_in_flight:
+                raise PoolFullError(
+                    f"Too many {kem_algo_name}+{sign_algorithm_name} messages in flight.",
+                    in_flight
+                    * self._costs.get(pair, pool.default_service_time_ns)
+                    / pool.max_workers
+                    / 1e9,
+                )
+            self._in_flight[pair] = in_flight + 1
+
+        def measured():
+            start = time.monotonic_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(pair, time.monotonic_ns() - start)
+
+        try:
+            return pool.submit(measured)
+        except PoolFullError as error:
+            self._record(pair, None)
+            # A pool that has not finished a task yet has no service times of its own
+            error.retry_after = pool.estimated_wait(self._costs.get(pair))
+            raise
+
+    def _record(self, pair, elapsed):
+        # Called once per submitted message when it finished or was rejected (elapsed None)
+        with self._lock:
+            self._in_flight[pair] -= 1
+            if elapsed is None:
+                return
+            if pair not in self._seen:
+                # The first message includes the lazy library load and key generation
+                self._seen.add(pair)
+                return
+            cost = self._costs.get(pair)
+            if cost is None:
+                self._costs[pair] = elapsed
+            else:
+                self._costs[pair] = cost + self.smoothing * (elapsed - cost)
+
+    def stats(self):
+        """
+        Returns:
+            dict: "pools" with the statistics of each pool and "algorithms" with the
+                measured cost in milliseconds, the pool and the number of messages in
+                flight of every algorithm pair.
+        """
+        with self._lock:
+            costs = dict(self._costs)
+            in_flight = dict(self._in_flight)
+        return {
+            "pools": {pool.name: pool.stats() for pool in (self.cheap, self.heavy)},
+            "algorithms": {
+                f"{kem}+{sign}": {
+                    "cost_ms": cost / 1e6,
+                    "pool": self.pool_for(kem, sign).name,
+                    "in_flight": in_flight.get((kem, sign), 0),
+                }
+                for (kem, sign), cost in sorted(costs.items())
+            },
+        }
+
+    def shutdown(self, wait=True):
+        """
+        Stops both pools, see `CostClassPool.shutdown`.
+        """
+        self.cheap.shutdown(wait)
+        self.heavy.shutdown(wait)
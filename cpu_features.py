@@ -0,0 +1,84 @@
+import platform
+
+# platform.machine() values mapped to the architecture names used in PQClean's META.yml
+ARCHITECTURES = {
+    "x86_64": "x86_64",
+    "amd64": "x86_64",
+    "aarch64": "arm_8",
+    "arm64": "arm_8",
+}
+
+# Implementations in the order they are preferred when the host supports several;
+# vectorized implementations first, the portable reference implementation last
+IMPLEMENTATION_PREFERENCE = ["avx2", "avx", "aarch64", "aesni", "sse", "vec", "opt", "clean"]
+
+_host_flags = None
+
+
+def host_architecture():
+    """
+    Returns:
+        str or None: The host's architecture as named in META.yml, or None if PQClean
+            has no optimized implementations for it.
+    """
+    return ARCHITECTURES.get(platform.machine().lower())
+
+
+def host_flags():
+    """
+    Reads the CPU feature flags of the host once, from the "flags" (x86) or
+    "Features" (ARM) line of /proc/cpuinfo.
+
+    Returns:
+        set of str: The flags, e.g. {"avx2", "bmi2", ...} or {"asimd", ...}; empty if
+            /proc/cpuinfo is not available.
+    """
+    global _host_flags
+    if _host_flags is None:
+        flags = set()
+        try:
+            with open("/proc/cpuinfo") as cpuinfo:
+                for line in cpuinfo:
+                    name, _, value = line.partition(":")
+                    if name.strip() in ("flags", "Features"):
+                        flags.update(value.split())
+        except OSError:
+            pass
+        _host_flags = flags
+    return _host_flags
+
+
+def supports(implementation):
+    """
+    Checks whether the host can run an implementation.
+
+    Args:
+        implementation (dict): Implementation entry of the algorithm index, with the
+            "platforms" it supports.
+
+    Returns:
+        bool: True if the implementation is portable or one of its platforms matches
+            the host's architecture and CPU flags.
+    """
+    if not implementation["platforms"]:
+        return True
+    architecture = host_architecture()
+    flags = host_flags()
+    return any(
+        platform_entry["architecture"] == architecture
+        and set(platform_entry["required_flags"]) <= flags
+        for platform_entry in implementation["platforms"]
+    )
+
+
+def preference(implementation_name):
+    """
+    Args:
+        implementation_name (str): Name of an implementation, e.g. "avx2".
+
+    Returns:
+        int: Rank of the implementation in `IMPLEMENTATION_PREFERENCE`, lower is preferred.
+    """
+    if implementation_name in IMPLEMENTATION_PREFERENCE:
+        return IMPLEMENTATION_PREFERENCE.index(implementation_name)
+    return len(IMPLEMENTATION_PREFERENCE)
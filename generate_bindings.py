@@ -0,0 +1,209 @@
+import os
+import re
+from generate_make_files import BASE_DIR, KEM_DIR, SIGN_DIR, find_libraries
+
+# Module the prototype table is written to
+OUTPUT_FILE = "./pqclean_bindings.py"
+
+# api.h size constants mapped to the size keys of the algorithm entries
+SIZE_CONSTANTS = {
+    "crypto_kem": {
+        "CRYPTO_PUBLICKEYBYTES": "public_key_bytes",
+        "CRYPTO_SECRETKEYBYTES": "private_key_bytes",
+        "CRYPTO_CIPHERTEXTBYTES": "cipher_text_bytes",
+        "CRYPTO_BYTES": "shared_secret_bytes",
+    },
+    "crypto_sign": {
+        "CRYPTO_PUBLICKEYBYTES": "public_key_size",
+        "CRYPTO_SECRETKEYBYTES": "private_key_size",
+        "CRYPTO_BYTES": "signature_bytes",
+        "CRYPTO_SEEDBYTES": "seed_bytes",
+    },
+}
+
+# C types that may appear in a prototype, with `unsigned char` spelled as `uint8_t`
+C_TYPES = {"int", "size_t", "size_t *", "uint8_t *", "const uint8_t *"}
+
+# The Rust Kyber libraries (rust/src/lib.rs) have no api.h; they export the
+# PQClean KEM functions under unprefixed names
+RUST_PROTOTYPES = {
+    "generate_keypair": (None, "int", ("uint8_t *", "uint8_t *")),
+    "encapsulate_key": (None, "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "decapsulate_key": (None, "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+}
+
+DEFINE_PATTERN = re.compile(r"#define\s+(PQCLEAN_\w+?)_(CRYPTO_[A-Z]+)\s+(\S.*)")
+PROTOTYPE_PATTERN = re.compile(r"\b(int|size_t)\s+(PQCLEAN_\w+)\s*\(([^)]*)\)\s*;")
+PARAMETER_PATTERN = re.compile(r"^(.*?)\s*\b\w+\s*(\[\s*\])?$")
+
+
+def strip_comments(source):
+    """
+    Removes C comments.
+
+    Args:
+        source (str): C source code.
+
+    Returns:
+        str: The source without comments.
+    """
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    return re.sub(r"//[^\n]*", "", source)
+
+
+def parameter_type(parameter):
+    """
+    Extracts the type of a C parameter declaration.
+
+    Args:
+        parameter (str): Parameter declaration, e.g. "const uint8_t *sk" or "size_t mlen".
+
+    Returns:
+        str: The normalized type, e.g. "const uint8_t *" or "size_t".
+
+    Raises:
+        ValueError: If the type is not in `C_TYPES`.
+    """
+    parameter = re.sub(r"\s+", " ", parameter.strip())
+    match = PARAMETER_PATTERN.match(parameter)
+    if match is None:
+        raise ValueError(f"Cannot parse parameter '{parameter}'")
+    type_name = match.group(1).replace("unsigned char", "uint8_t")
+    type_name = re.sub(r"\s*\*\s*", " *", type_name).strip()
+    if match.group(2):
+        type_name += " *"
+    if type_name not in C_TYPES:
+        raise ValueError(f"Unsupported parameter type '{type_name}' in '{parameter}'")
+    return type_name
+
+
+def parse_api_header(path, type_name):
+    """
+    Reads the size constants and function prototypes of a scheme's api.h.
+
+    Args:
+        path (str): Path of the api.h file.
+        type_name (str): "crypto_kem" or "crypto_sign".
+
+    Returns:
+        tuple: (namespace, sizes, prototypes), where:
+            - namespace (str): Symbol prefix of the scheme, e.g. "PQCLEAN_KYBER512_CLEAN".
+            - sizes (dict): Size keys of `SIZE_CONSTANTS` mapped to their values in bytes.
+            - prototypes (dict): Symbol mapped to (return type, tuple of parameter types).
+
+    Raises:
+        ValueError: If the header has no size constants or uses unsupported types.
+    """
+    with open(path) as header:
+        source = strip_comments(header.read())
+
+    namespace = None
+    sizes = {}
+    for match in DEFINE_PATTERN.finditer(source):
+        namespace, constant, value = match.groups()
+        if constant in SIZE_CONSTANTS[type_name]:
+            sizes[SIZE_CONSTANTS[type_name][constant]] = int(value.strip())
+    if namespace is None:
+        raise ValueError(f"No size constants in {path}")
+
+    prototypes = {}
+    for match in PROTOTYPE_PATTERN.finditer(source):
+        return_type, symbol, parameters = match.groups()
+        if parameters.strip() == "void":
+            parameters = ""
+        prototypes[symbol] = (
+            return_type,
+            tuple(parameter_type(p) for p in parameters.split(",") if p.strip()),
+        )
+    return namespace, sizes, prototypes
+
+
+def literal(value):
+    """
+    Args:
+        value (str, int, tuple, dict or None): Value of a generated table.
+
+    Returns:
+        str: The value as a Python literal with double-quoted strings.
+    """
+    if isinstance(value, str):
+        return f'"{value}"'
+    if isinstance(value, tuple):
+        items = [literal(item) for item in value]
+        return f"({', '.join(items)}{',' if len(items) == 1 else ''})"
+    if isinstance(value, dict):
+        items = [f"{literal(key)}: {literal(item)}" for key, item in value.items()]
+        return f"{{{', '.join(items)}}}"
+    return repr(value)
+
+
+def render(schemes, prototypes):
+    """
+    Renders the prototype table as Python source.
+
+    Args:
+        schemes (dict): Namespace mapped to the scheme's name and sizes.
+        prototypes (dict): Symbol mapped to (namespace, return type, parameter types).
+
+    Returns:
+        str: Source of the bindings module.
+    """
+    lines = [
+        "# Generated by generate_bindings.py from PQClean/crypto_*/*/*/api.h, do not edit.",
+        "",
+        "# Symbol prefix mapped to the scheme, implementation and buffer sizes in bytes",
+        "SCHEMES = {",
+    ]
+    for namespace, scheme in sorted(schemes.items()):
+        lines.append(f"    {literal(namespace)}: {{")
+        for key, value in scheme.items():
+            lines.append(f"        {literal(key)}: {literal(value)},")
+        lines.append("    },")
+    lines += [
+        "}",
+        "",
+        "# Symbol mapped to (symbol prefix or None, return type, parameter types)",
+        "PROTOTYPES = {",
+    ]
+    for symbol, (namespace, return_type, parameters) in sorted(prototypes.items()):
+        lines.append(
+            f"    {literal(symbol)}: {literal((namespace, return_type, parameters))},"
+        )
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def main():
+    """
+    Parses the api.h of every implementation (clean, avx2, aarch64, ...) and writes
+    the prototype table to `OUTPUT_FILE`.
+    """
+    schemes = {}
+    prototypes = dict(RUST_PROTOTYPES)
+    for type_name, library_name in find_libraries(KEM_DIR) + find_libraries(SIGN_DIR):
+        library_dir = os.path.join(BASE_DIR, type_name, library_name)
+        for implementation in sorted(os.listdir(library_dir)):
+            path = os.path.join(library_dir, implementation, "api.h")
+            if not os.path.isfile(path):
+                continue
+            namespace, sizes, scheme_prototypes = parse_api_header(path, type_name)
+            schemes[namespace] = {
+                "scheme": f"{type_name}/{library_name}",
+                "implementation": implementation,
+                **sizes,
+            }
+            for symbol, (return_type, parameters) in scheme_prototypes.items():
+                prototypes[symbol] = (namespace, return_type, parameters)
+
+    with open(OUTPUT_FILE, "w") as output:
+        output.write(render(schemes, prototypes))
+    print(
+        f"Wrote {len(prototypes)} prototypes of {len(schemes)} implementations to {OUTPUT_FILE}"
+    )
+
+
+if __name__ == "__main__":
+    """
+    Entry point for the script. Regenerate the bindings whenever PQClean is updated.
+    """
+    main()
@@ -1,32 +1,130 @@
+import argparse
 import os
+from algorithm_index import KEM_INDEX, SIGNATURE_INDEX
+from algorithm_registry import LEGACY_IDENTIFIERS, library_path
+from build_profiles import (
+    BUILD_PROFILES,
+    DEFAULT_PROFILE,
+    combined_library_path,
+    profile_data_dir,
+    profile_dir,
+    profile_settings,
+)
+from cpu_features import host_architecture, supports
 
 # Paths to the directories containing the libraries
 BASE_DIR = "./PQClean"
 KEM_DIR = os.path.join(BASE_DIR, "crypto_kem")
 SIGN_DIR = os.path.join(BASE_DIR, "crypto_sign")
 
-# Template for the Makefile
-MAKEFILE_TEMPLATE = """CC = gcc
-CFLAGS = -Wall -Wextra -O3 -fPIC -I./PQClean/common
-TARGET = ./build/{type}/lib{target}
-COMMON_SRCS = ./PQClean/common/*.c
+# Compiler options for the CPU flags an implementation requires (as named in META.yml)
+FLAG_OPTIONS = {
+    "aes": "-maes",
+    "avx2": "-mavx2",
+    "bmi1": "-mbmi",
+    "bmi2": "-mbmi2",
+    "pclmulqdq": "-mpclmul",
+    "popcnt": "-mpopcnt",
+    "sse4_1": "-msse4.1",
+    "asimd": "",
+}
 
-IMPL_SRCS = ./PQClean/{type}/{library}/clean/*.c
+# Four-way Keccak used by the AVX2 implementations, linked in when their Makefile needs it
+KECCAK4X_DIR = "./PQClean/common/keccak4x"
+KECCAK4X_OPTIONS = FLAG_OPTIONS["avx2"]
 
-all: $(TARGET)
+# Template for the main Makefile of a profile. It compiles PQClean/common once into a
+# static archive, includes the Makefile of every library and builds each source file
+# into its own object, with the headers it includes tracked in a .d file
+MAIN_MAKEFILE_TEMPLATE = """CC = gcc
+AR = gcc-ar
+CFLAGS = -Wall -Wextra {optimization} -fPIC -I{common_dir}
+OBJ_DIR = {obj_dir}
+{pgo}
+COMMON_DIR = {common_dir}
+COMMON_OBJS = $(patsubst $(COMMON_DIR)/%,$(OBJ_DIR)/common/%.o,$(wildcard $(COMMON_DIR)/*.c))
+COMMON_LIB = $(OBJ_DIR)/libpqclean_common.a
 
-$(TARGET): $(IMPL_SRCS) $(COMMON_SRCS)
-\t$(CC) -shared $(CFLAGS) -o $@ $(IMPL_SRCS) $(COMMON_SRCS)
+KECCAK4X_DIR = {keccak4x_dir}
+KECCAK4X_OBJS = $(patsubst $(KECCAK4X_DIR)/%,$(OBJ_DIR)/keccak4x/%.o,$(wildcard $(KECCAK4X_DIR)/*.c))
+KECCAK4X_LIB = $(OBJ_DIR)/libkeccak4x.a
+
+.DEFAULT_GOAL := all
+LIBRARIES =
+include $(wildcard {makefile_dir}/Makefile.*)
+
+all: $(LIBRARIES)
+
+# Optional single library with the objects of the libraries named in COMBINED_NAMES,
+# which run_make_files.py --combined writes to combined.mk; the common code is linked once
+COMBINED_LIB = {combined_lib}
+COMBINED_LIST = {makefile_dir}/combined.mk
+-include $(COMBINED_LIST)
+
+$(COMBINED_LIB): $(foreach name,$(COMBINED_NAMES),$($(name)_OBJS)) $(KECCAK4X_LIB) $(COMMON_LIB) $(COMBINED_LIST)
+\t@mkdir -p $(@D)
+\t$(CC) -shared $(CFLAGS) $(PGO_FLAGS) -o $@ $(filter-out $(COMBINED_LIST),$^)
+
+$(COMMON_LIB): $(COMMON_OBJS)
+\trm -f $@
+\t$(AR) rcs $@ $^
+
+$(KECCAK4X_LIB): $(KECCAK4X_OBJS)
+\trm -f $@
+\t$(AR) rcs $@ $^
+
+$(OBJ_DIR)/common/%.o: $(COMMON_DIR)/% {makefile}
+\t@mkdir -p $(@D)
+\t$(CC) $(CFLAGS) $(PGO_FLAGS) -MMD -MP -c $< -o $@
+
+$(OBJ_DIR)/keccak4x/%.o: $(KECCAK4X_DIR)/% {makefile}
+\t@mkdir -p $(@D)
+\t$(CC) $(CFLAGS) $(PGO_FLAGS) {keccak4x_options} -MMD -MP -c $< -o $@
+
+-include $(COMMON_OBJS:.o=.d) $(KECCAK4X_OBJS:.o=.d)
 
 clean:
-\trm -f $(TARGET)
+\trm -rf $(OBJ_DIR) $(LIBRARIES) $(COMBINED_LIB)
+
+.PHONY: all clean
+"""
+
+# Template for the Makefile of one library, included by the main Makefile
+MAKEFILE_TEMPLATE = """# {type}/{library}/{implementation}
+{name}_DIR = {implementation_dir}
+{name}_OBJ = $(OBJ_DIR)/{type}/{library}/{implementation}
+{name}_SRCS = $(wildcard $({name}_DIR)/*.c $({name}_DIR)/*.S $({name}_DIR)/*.s)
+{name}_OBJS = $(patsubst $({name}_DIR)/%,$({name}_OBJ)/%.o,$({name}_SRCS))
+LIBRARIES += {target}
+
+{target}: $({name}_OBJS){archives}
+\t@mkdir -p $(@D)
+\t$(CC) -shared $(CFLAGS) $(PGO_FLAGS){options} -o $@ $^
+
+$({name}_OBJ)/%.o: $({name}_DIR)/% {makefile}
+\t@mkdir -p $(@D)
+\t$(CC) $(CFLAGS) $(PGO_FLAGS){options} -Wa,-I$({name}_DIR) -MMD -MP -c $< -o $@
+
+-include $({name}_OBJS:.o=.d)
+"""
+
+# Makefile section of profiles with profile-guided optimization. `make PGO_PHASE=generate`
+# builds an instrumented library, the default phase rebuilds it with the training data
+PGO_TEMPLATE = """
+PROFILE_DATA = $(abspath {profile_data})
+PGO_PHASE ?= use
+ifeq ($(PGO_PHASE),generate)
+PGO_FLAGS = -fprofile-generate=$(PROFILE_DATA)
+else
+PGO_FLAGS = -fprofile-use=$(PROFILE_DATA) -fprofile-partial-training -Wno-missing-profile
+endif
 """
 
 # Output directory for the Makefiles
 OUTPUT_DIR = "./Makefiles"
 
-# Ensure the output directory exists
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Suffix of the identifiers of the Rust Kyber libraries, e.g. "kyber512rust"
+RUST_SUFFIX = "rust"
 
 def find_libraries(base_dir):
     """
@@ -51,41 +149,244 @@ def find_libraries(base_dir):
                 libraries.append((type_name, library_name))
     return libraries
 
-def create_makefile(type_name, library_name):
+def resolve_algorithms(names):
+    """
+    Maps algorithm identifiers to the libraries they are built from.
+
+    Args:
+        names (list of str): Identifiers of the registries, e.g. "kyber512", "falcon512"
+            or "kyber512rust"; the scheme directory names (e.g. "falcon-512") work as well.
+
+    Returns:
+        tuple: (schemes, rust, unknown), where:
+            - schemes (list): (type, library_name) of every PQClean scheme, without duplicates.
+            - rust (list of str): Identifiers of Rust Kyber libraries, built by rust/build.sh.
+            - unknown (list of str): Identifiers that match no library.
+    """
+    scheme_names = {identifier: name for name, identifier in LEGACY_IDENTIFIERS.items()}
+    schemes, rust, unknown = [], [], []
+    for name in names:
+        library_name = scheme_names.get(name, name)
+        if library_name in KEM_INDEX:
+            scheme = ("crypto_kem", library_name)
+        elif library_name in SIGNATURE_INDEX:
+            scheme = ("crypto_sign", library_name)
+        elif name.endswith(RUST_SUFFIX) and name[: -len(RUST_SUFFIX)] in KEM_INDEX:
+            rust.append(name)
+            continue
+        else:
+            unknown.append(name)
+            continue
+        if scheme not in schemes:
+            schemes.append(scheme)
+    return schemes, rust, unknown
+
+def makefile_suffix(library_name, implementation_name):
+    """
+    Args:
+        library_name (str): The name of the library.
+        implementation_name (str): The name of the implementation, e.g. "avx2".
+
+    Returns:
+        str: Suffix of the library's Makefile and prefix of its Makefile variables,
+            e.g. "kyber512" for clean and "kyber512_avx2" for avx2.
+    """
+    if implementation_name == "clean":
+        return library_name
+    return f"{library_name}_{implementation_name}"
+
+def library_targets(type_name, library_name, profile=DEFAULT_PROFILE):
+    """
+    Args:
+        type_name (str): The type of library (e.g., "crypto_kem" or "crypto_sign").
+        library_name (str): The name of the library.
+        profile (str): Build profile.
+
+    Returns:
+        list of str: The Makefile targets of the implementations the host supports,
+            e.g. ["build/crypto_kem/libkyber512.so", "build/crypto_kem/libkyber512_avx2.so"].
+    """
+    return [
+        os.path.normpath(library_path(type_name, library_name, implementation["name"], profile))
+        for implementation in host_implementations(type_name, library_name)
+    ]
+
+def write_makefile(makefile_path, content):
+    """
+    Writes a Makefile unless it already has the given content. The objects depend on
+    their Makefile, so rewriting an unchanged one would rebuild them.
+
+    Args:
+        makefile_path (str): Path of the Makefile.
+        content (str): Content of the Makefile.
+
+    Returns:
+        bool: True if the Makefile was written.
+    """
+    if os.path.isfile(makefile_path):
+        with open(makefile_path) as makefile:
+            if makefile.read() == content:
+                return False
+    with open(makefile_path, "w") as makefile:
+        makefile.write(content)
+    return True
+
+def makefile_dir(profile):
+    """
+    Args:
+        profile (str): Name of a build profile.
+
+    Returns:
+        str: Directory of the profile's Makefiles, e.g. "./Makefiles" for the default
+            profile and "./Makefiles/native" for the native profile.
+    """
+    if profile == DEFAULT_PROFILE:
+        return OUTPUT_DIR
+    return os.path.join(OUTPUT_DIR, profile)
+
+def host_implementations(type_name, library_name):
+    """
+    Lists the implementations of a scheme that the build host can run.
+
+    Args:
+        type_name (str): The type of library (e.g., "crypto_kem" or "crypto_sign").
+        library_name (str): The name of the library.
+
+    Returns:
+        list: The implementation entries of the algorithm index, e.g. clean, avx2 and aarch64.
+    """
+    index = KEM_INDEX if type_name == "crypto_kem" else SIGNATURE_INDEX
+    return [
+        implementation
+        for implementation in index[library_name]["implementations"]
+        if supports(implementation)
+    ]
+
+
+def compiler_options(implementation):
+    """
+    Args:
+        implementation (dict): Implementation entry of the algorithm index.
+
+    Returns:
+        str: The options enabling the CPU flags of the implementation's host platform,
+            e.g. " -mavx2 -mbmi2"; empty for portable implementations.
+    """
+    options = []
+    for platform in implementation["platforms"]:
+        if platform["architecture"] == host_architecture():
+            options += [FLAG_OPTIONS[flag] for flag in platform["required_flags"]]
+    return "".join(f" {option}" for option in options if option)
+
+
+def uses_keccak4x(implementation_dir):
+    """
+    Args:
+        implementation_dir (str): Directory of an implementation.
+
+    Returns:
+        bool: True if the implementation's upstream Makefile links the four-way Keccak.
+    """
+    with open(os.path.join(implementation_dir, "Makefile")) as upstream_makefile:
+        return "keccak4x" in upstream_makefile.read()
+
+
+def create_main_makefile(profile=DEFAULT_PROFILE):
+    """
+    Generate the main Makefile of a build profile, which builds the common archives and
+    includes the Makefiles of all libraries.
+
+    Args:
+        profile (str): Build profile, see `build_profiles.BUILD_PROFILES`.
+
+    Side Effects:
+        Creates `Makefile` in the profile's Makefile directory.
+    """
+    settings = profile_settings(profile)
+    pgo = ""
+    if settings["pgo"]:
+        pgo = PGO_TEMPLATE.format(profile_data=profile_data_dir(profile))
+    makefile_path = os.path.join(makefile_dir(profile), "Makefile")
+    makefile_content = MAIN_MAKEFILE_TEMPLATE.format(
+        optimization=settings["cflags"],
+        pgo=pgo,
+        obj_dir=os.path.normpath(os.path.join(profile_dir(profile), "obj")),
+        common_dir=os.path.normpath(os.path.join(BASE_DIR, "common")),
+        keccak4x_dir=os.path.normpath(KECCAK4X_DIR),
+        keccak4x_options=KECCAK4X_OPTIONS,
+        makefile_dir=os.path.normpath(makefile_dir(profile)),
+        makefile=os.path.normpath(makefile_path),
+        combined_lib=os.path.normpath(combined_library_path(profile)),
+    )
+    if write_makefile(makefile_path, makefile_content):
+        print(f"Main Makefile created for the {profile} profile: {makefile_path}")
+
+def create_makefile(type_name, library_name, implementation, profile=DEFAULT_PROFILE):
     """
     Generate a Makefile for the given library using the template.
 
     Args:
         type_name (str): The type of library (e.g., "crypto_kem" or "crypto_sign").
         library_name (str): The name of the library.
+        implementation (dict): Implementation entry of the algorithm index.
+        profile (str): Build profile, see `build_profiles.BUILD_PROFILES`.
 
     Side Effects:
         Creates a Makefile for the specified library in the output directory.
     """
-    # Define the target shared library name
-    target_name = f"{library_name}.so"
+    name = implementation["name"]
+    implementation_dir = os.path.join(BASE_DIR, type_name, library_name, name)
+    options = compiler_options(implementation)
+    archives = " $(COMMON_LIB)"
+    if uses_keccak4x(implementation_dir):
+        options += f" -I{os.path.normpath(KECCAK4X_DIR)}"
+        archives = " $(KECCAK4X_LIB)" + archives
+
+    # Save the generated Makefile to the output directory
+    suffix = makefile_suffix(library_name, name)
+    makefile_path = os.path.join(makefile_dir(profile), f"Makefile.{suffix}")
 
     # Populate the Makefile template with the library details
     makefile_content = MAKEFILE_TEMPLATE.format(
-        target=target_name,
+        name=suffix,
+        target=os.path.normpath(library_path(type_name, library_name, name, profile)),
         type=type_name,
-        library=library_name
+        library=library_name,
+        implementation=name,
+        implementation_dir=os.path.normpath(implementation_dir),
+        options=options,
+        archives=archives,
+        makefile=os.path.normpath(makefile_path),
     )
-    
-    # Save the generated Makefile to the output directory
-    makefile_path = os.path.join(OUTPUT_DIR, f"Makefile.{library_name}")
-    with open(makefile_path, "w") as makefile:
-        makefile.write(makefile_content)
-
-    print(f"Makefile created for {type_name}/{library_name}: {makefile_path}")
+    if write_makefile(makefile_path, makefile_content):
+        print(f"Makefile created for {type_name}/{library_name}/{name}: {makefile_path}")
 
 def main():
     """
     Main script logic to find libraries and generate Makefiles.
 
     - Collects libraries from `crypto_kem` and `crypto_sign` directories.
-    - Creates a Makefile for each library in the output directory.
+    - Creates the main Makefile of the profile, which `run_make_files.py` runs.
+    - Creates a Makefile for each implementation of a library that the host
+      supports (clean everywhere, e.g. avx2 on x86_64 and aarch64 on 64-bit ARM).
+    - Leaves unchanged Makefiles untouched, so up-to-date objects are not rebuilt.
+
+    Command-Line Usage:
+        python generate_make_files.py [--profile o3]
     """
+    parser = argparse.ArgumentParser(description="Generate the library Makefiles.")
+    parser.add_argument(
+        "--profile",
+        choices=BUILD_PROFILES,
+        default=DEFAULT_PROFILE,
+        help="Build profile (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    # Ensure the output directory exists
+    os.makedirs(makefile_dir(args.profile), exist_ok=True)
+    create_main_makefile(args.profile)
+
     # Collect libraries from the KEM and SIGN directories
     kem_libraries = find_libraries(KEM_DIR)
     sign_libraries = find_libraries(SIGN_DIR)
@@ -93,9 +394,10 @@ def main():
     # Combine all libraries into a single list
     all_libraries = kem_libraries + sign_libraries
 
-    # Generate Makefiles for each library
+    # Generate Makefiles for each implementation the host supports
     for type_name, library_name in all_libraries:
-        create_makefile(type_name, library_name)
+        for implementation in host_implementations(type_name, library_name):
+            create_makefile(type_name, library_name, implementation, args.profile)
 
 if __name__ == "__main__":
     """
@@ -0,0 +1,130 @@
+import os
+import yaml
+from generate_make_files import BASE_DIR, KEM_DIR, SIGN_DIR, find_libraries
+from generate_bindings import literal
+from pqclean_bindings import SCHEMES
+
+# Module the algorithm index is written to
+OUTPUT_FILE = "./algorithm_index.py"
+
+# META.yml lengths mapped to the size keys of the algorithm entries
+META_LENGTHS = {
+    "crypto_kem": {
+        "length-public-key": "public_key_bytes",
+        "length-secret-key": "private_key_bytes",
+        "length-ciphertext": "cipher_text_bytes",
+        "length-shared-secret": "shared_secret_bytes",
+    },
+    "crypto_sign": {
+        "length-public-key": "public_key_size",
+        "length-secret-key": "private_key_size",
+        "length-signature": "signature_bytes",
+    },
+}
+
+
+def read_meta(type_name, library_name, namespaces):
+    """
+    Builds the index entry of a scheme from its META.yml.
+
+    Args:
+        type_name (str): "crypto_kem" or "crypto_sign".
+        library_name (str): Name of the scheme directory, e.g. "kyber512".
+        namespaces (dict): (scheme path, implementation), e.g. ("crypto_kem/kyber512",
+            "avx2"), mapped to the symbol prefix of the implementation.
+
+    Returns:
+        dict: Identifier, name, NIST level, KAT hash, sizes and the implementations
+            with their symbol prefix and the platforms they support.
+
+    Raises:
+        ValueError: If a length in META.yml differs from the api.h of an implementation.
+    """
+    scheme = f"{type_name}/{library_name}"
+    with open(os.path.join(BASE_DIR, scheme, "META.yml")) as meta_file:
+        meta = yaml.safe_load(meta_file)
+
+    entry = {
+        "identifier": library_name,
+        "name": meta["name"],
+        "nist_level": meta["claimed-nist-level"],
+        "nistkat_sha256": meta["nistkat-sha256"],
+    }
+    for length, key in META_LENGTHS[type_name].items():
+        for implementation in meta["implementations"]:
+            namespace = namespaces[(scheme, implementation["name"])]
+            if meta[length] != SCHEMES[namespace][key]:
+                raise ValueError(
+                    f"{scheme}: {length} is {meta[length]} in META.yml, "
+                    f"but {SCHEMES[namespace][key]} in {implementation['name']}/api.h"
+                )
+        entry[key] = meta[length]
+    entry["implementations"] = tuple(
+        {
+            "name": implementation["name"],
+            "namespace": namespaces[(scheme, implementation["name"])],
+            "platforms": tuple(
+                {
+                    "architecture": platform["architecture"],
+                    "required_flags": tuple(platform.get("required_flags", ())),
+                }
+                for platform in implementation.get("supported_platforms", ())
+            ),
+        }
+        for implementation in meta["implementations"]
+    )
+    return entry
+
+
+def render(kem_index, signature_index):
+    """
+    Renders the algorithm index as Python source.
+
+    Args:
+        kem_index (dict): Identifier mapped to the index entry of every KEM.
+        signature_index (dict): Identifier mapped to the index entry of every signature scheme.
+
+    Returns:
+        str: Source of the index module.
+    """
+    lines = [
+        "# Generated by generate_registry.py from PQClean/crypto_*/*/META.yml, do not edit.",
+    ]
+    for variable, index in (("KEM_INDEX", kem_index), ("SIGNATURE_INDEX", signature_index)):
+        lines += ["", f"{variable} = {{"]
+        for identifier, entry in sorted(index.items()):
+            lines.append(f"    {literal(identifier)}: {{")
+            for key, value in entry.items():
+                lines.append(f"        {literal(key)}: {literal(value)},")
+            lines.append("    },")
+        lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    """
+    Reads the META.yml of every scheme and writes the algorithm index to `OUTPUT_FILE`.
+    Run `generate_bindings.py` first, the lengths are checked against its api.h table.
+    """
+    namespaces = {
+        (scheme["scheme"], scheme["implementation"]): namespace
+        for namespace, scheme in SCHEMES.items()
+    }
+    indexes = {"crypto_kem": {}, "crypto_sign": {}}
+    for type_name, library_name in find_libraries(KEM_DIR) + find_libraries(SIGN_DIR):
+        indexes[type_name][library_name] = read_meta(type_name, library_name, namespaces)
+
+    with open(OUTPUT_FILE, "w") as output:
+        output.write(render(indexes["crypto_kem"], indexes["crypto_sign"]))
+    print(
+        f"Wrote {len(indexes['crypto_kem'])} KEMs and "
+        f"{len(indexes['crypto_sign'])} signature schemes to {OUTPUT_FILE}"
+    )
+
+
+if __name__ == "__main__":
+    """
+    Entry point for the script. Regenerate the index whenever PQClean is updated.
+    """
+    main()
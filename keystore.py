@@ -0,0 +1,173 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+# Keystore layout: magic | index offset (u64) | index length (u32) | key blobs | JSON index.
+# The index maps each algorithm to the hash of the library that generated its keys
+# and to the (offset, length) of its public and private key in the file.
+MAGIC = b"PQCKEYS1"
+_HEADER = struct.Struct(">8sQI")
+
+_library_hashes = {}
+
+# Serializes keystore rewrites; caches the current keystore contents per path
+_keystore_lock = threading.Lock()
+_keystores = {}
+
+
+def library_hash(library_path):
+    """
+    Computes the SHA-256 hash of a shared library, identifying the build that generates the keys.
+
+    Args:
+        library_path (str): Path to the shared library.
+
+    Returns:
+        str: Hex-encoded hash of the library file.
+    """
+    if library_path not in _library_hashes:
+        hash_obj = hashlib.sha256()
+        with open(library_path, "rb") as library:
+            for chunk in iter(lambda: library.read(1 << 20), b""):
+                hash_obj.update(chunk)
+        _library_hashes[library_path] = hash_obj.hexdigest()
+    return _library_hashes[library_path]
+
+
+def read_keystore(path):
+    """
+    Memory-maps a keystore file and returns views of the stored keys.
+
+    The file is mapped copy-on-write: the views are writable, so ctypes arrays can be
+    created on top of them without copying, but writes never reach the file. Pages
+    that are only read stay shared with the page cache and with forked processes.
+
+    Args:
+        path (str): Path to the keystore file.
+
+    Returns:
+        dict: Algorithm name mapped to a dict with "library_hash", "public_key" and
+            "private_key" (memoryview slices of the mapped file). Empty if the file
+            does not exist or is not a valid keystore.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) < _HEADER.size:
+        return {}
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    magic, index_offset, index_length = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC or index_offset + index_length > len(view):
+        return {}
+    try:
+        index = json.loads(bytes(view[index_offset : index_offset + index_length]))
+    except ValueError:
+        return {}
+    if not isinstance(index, dict):
+        return {}
+
+    entries = {}
+    for name, entry in index.items():
+        # A malformed entry is skipped, so its keys are generated again
+        try:
+            public_offset, public_length = entry["public_key"]
+            private_offset, private_length = entry["private_key"]
+            ranges = (public_offset, public_length, private_offset, private_length)
+            if min(ranges) < 0 or max(
+                public_offset + public_length, private_offset + private_length
+            ) > len(view):
+                continue
+            entries[name] = {
+                "library_hash": entry["library_hash"],
+                "public_key": view[public_offset : public_offset + public_length],
+                "private_key": view[private_offset : private_offset + private_length],
+            }
+        except (KeyError, TypeError, ValueError):
+            continue
+    return entries
+
+
+def write_keystore(path, entries):
+    """
+    Atomically writes keys to a keystore file readable only by the current user.
+
+    Args:
+        path (str): Path to the keystore file.
+        entries (dict): Algorithm name mapped to a dict with "library_hash",
+            "public_key" and "private_key".
+    """
+    index = {}
+    offset = _HEADER.size
+    for name, entry in entries.items():
+        public_length = len(entry["public_key"])
+        private_length = len(entry["private_key"])
+        index[name] = {
+            "library_hash": entry["library_hash"],
+            "public_key": [offset, public_length],
+            "private_key": [offset + public_length, private_length],
+        }
+        offset += public_length + private_length
+    index_bytes = json.dumps(index).encode("utf-8")
+
+    temp_path = f"{path}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, offset, len(index_bytes)))
+        for entry in entries.values():
+            file.write(entry["public_key"])
+            file.write(entry["private_key"])
+        file.write(index_bytes)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def load_or_generate_keypair(algorithm, path, generate_keypair):
+    """
+    Returns the keypair of a KEM algorithm from the keystore, generating it if it is missing or outdated.
+
+    A stored keypair is reused if it was generated by a library with the same build
+    hash and has the expected sizes. A newly generated keypair is written back to the
+    keystore. Keys are returned as views into the memory-mapped keystore file.
+
+    Args:
+        algorithm (dict): Algorithm entry with "identifier", "library_path", "keypair_algorithm",
+            "public_key_bytes" and "private_key_bytes".
+        path (str): Path to the keystore file.
+        generate_keypair (function): Key generation function with the signature of
+            `libs_server.generate_keypair`.
+
+    Returns:
+        dict: "public_key" and "private_key" of the algorithm.
+    """
+    name = algorithm["identifier"]
+    expected_hash = library_hash(algorithm["library_path"])
+    with _keystore_lock:
+        if path not in _keystores:
+            _keystores[path] = read_keystore(path)
+        entry = _keystores[path].get(name)
+
+    if (
+        entry is None
+        or entry["library_hash"] != expected_hash
+        or len(entry["public_key"]) != algorithm["public_key_bytes"]
+        or len(entry["private_key"]) != algorithm["private_key_bytes"]
+    ):
+        # Generate outside the lock so keypairs of different algorithms are created in parallel
+        keypair = generate_keypair(
+            algorithm["public_key_bytes"],
+            algorithm["private_key_bytes"],
+            algorithm["keypair_algorithm"],
+            name,
+            algorithm["implementation"],
+        )
+        with _keystore_lock:
+            stored = read_keystore(path)
+            stored[name] = {"library_hash": expected_hash, **keypair}
+            write_keystore(path, stored)
+            _keystores[path] = read_keystore(path)
+            entry = _keystores[path][name]
+
+    return {"public_key": entry["public_key"], "private_key": entry["private_key"]}
@@ -2,81 +2,53 @@ import ctypes
 import csv
 import os
 import time
+import threading
 from dotenv import load_dotenv
+from algorithm_index import KEM_INDEX, SIGNATURE_INDEX
+from build_profiles import DEFAULT_PROFILE
+from timing_writer import write_header
+from algorithm_registry import (
+    LEGACY_IDENTIFIERS,
+    AlgorithmRegistry,
+    parse_algorithm_list,
+    pqclean_specs,
+    resolve_symbols,
+)
 
 load_dotenv()
 
 DEVICE_NAME = os.getenv("DEVICE_NAME", "Unknown Device")
-
-kyber512rust_lib = ctypes.CDLL("./build/crypto_kem/libkyber512rust.so")
-kyber768rust_lib = ctypes.CDLL("./build/crypto_kem/libkyber768rust.so")
-kyber1024rust_lib = ctypes.CDLL("./build/crypto_kem/libkyber1024rust.so")
-kyber512_lib = ctypes.CDLL("./build/crypto_kem/libkyber512.so")
-kyber768_lib = ctypes.CDLL("./build/crypto_kem/libkyber768.so")
-kyber1024_lib = ctypes.CDLL("./build/crypto_kem/libkyber1024.so")
-hqcrmrs128_lib = ctypes.CDLL("./build/crypto_kem/libhqc-rmrs-128.so")
-hqcrmrs192_lib = ctypes.CDLL("./build/crypto_kem/libhqc-rmrs-192.so")
-hqcrmrs256_lib = ctypes.CDLL("./build/crypto_kem/libhqc-rmrs-256.so")
-
-mceliece348864_lib = ctypes.CDLL("./build/crypto_kem/libmceliece348864.so")
-mceliece460896_lib = ctypes.CDLL("./build/crypto_kem/libmceliece460896.so")
-mceliece6688128_lib = ctypes.CDLL("./build/crypto_kem/libmceliece6688128.so")
-mceliece6960119_lib = ctypes.CDLL("./build/crypto_kem/libmceliece6960119.so")
-mceliece8192128_lib = ctypes.CDLL("./build/crypto_kem/libmceliece8192128.so")
-
-dilithium2_lib = ctypes.CDLL("./build/crypto_sign/libdilithium2.so")
-dilithium3_lib = ctypes.CDLL("./build/crypto_sign/libdilithium3.so")
-dilithium5_lib = ctypes.CDLL("./build/crypto_sign/libdilithium5.so")
-falcon512_lib = ctypes.CDLL("./build/crypto_sign/libfalcon-512.so")
-falcon1024_lib = ctypes.CDLL("./build/crypto_sign/libfalcon-1024.so")
-rainbowIclassic_lib = ctypes.CDLL("./build/crypto_sign/librainbowI-classic.so")
-rainbowIIIclassic_lib = ctypes.CDLL("./build/crypto_sign/librainbowIII-classic.so")
-rainbowVclassic_lib = ctypes.CDLL("./build/crypto_sign/librainbowV-classic.so")
-
-KEM_ALGORITHMS = {
-    "mceliece348864": {
-        "identifier": "mceliece348864",
-        "encapsulation_algorithm": mceliece348864_lib.PQCLEAN_MCELIECE348864_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 128,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 261120,
-        "private_key_bytes": 6452,
-    },
-    "mceliece460896": {
-        "identifier": "mceliece460896",
-        "encapsulation_algorithm": mceliece460896_lib.PQCLEAN_MCELIECE460896_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 188,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 524160,
-        "private_key_bytes": 13568,
-    },
-    "mceliece6688128": {
-        "identifier": "mceliece6688128",
-        "encapsulation_algorithm": mceliece6688128_lib.PQCLEAN_MCELIECE6688128_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 240,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 1044992,
-        "private_key_bytes": 13892,
-    },
-    "mceliece6960119": {
-        "identifier": "mceliece6960119",
-        "encapsulation_algorithm": mceliece6960119_lib.PQCLEAN_MCELIECE6960119_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 226,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 1047319,
-        "private_key_bytes": 13908,
-    },
-    "mceliece8192128": {
-        "identifier": "mceliece8192128",
-        "encapsulation_algorithm": mceliece8192128_lib.PQCLEAN_MCELIECE8192128_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 240,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 1357824,
-        "private_key_bytes": 14080,
-    },
+KEYGEN_WORKERS = int(os.getenv("KEYGEN_WORKERS", os.cpu_count() or 1))
+# Algorithms loaded in the background at import, e.g. "kyber512,dilithium2"
+WARMUP_ALGORITHMS = parse_algorithm_list(os.getenv("WARMUP_ALGORITHMS"))
+# Implementation loaded where it was built, e.g. "clean"; "auto" picks the fastest one
+# the CPU supports
+IMPLEMENTATION = os.getenv("IMPLEMENTATION", "auto")
+# Build profile the PQClean libraries are loaded from, e.g. "native" for ./build/native
+BUILD_PROFILE = os.getenv("BUILD_PROFILE", DEFAULT_PROFILE)
+# "combined" resolves the schemes built into the profile's combined library from it
+# (see run_make_files.py --combined); "separate" (default) loads one library per scheme
+LIBRARY_MODE = os.getenv("LIBRARY_MODE", "separate")
+
+# Columns of "key_generation_times.csv"
+KEY_GENERATION_HEADER = [
+    "Name",
+    "Key Generation Time",
+    "Device Name",
+    "Implementation",
+    "Build Profile",
+]
+
+# Serializes CSV appends from parallel key generation threads
+_csv_lock = threading.Lock()
+
+# Kyber through the Rust pqc_kyber crate (rust/src/lib.rs), which is not part of PQClean
+RUST_KEM_SPECS = {
     "kyber512rust": {
         "identifier": "kyber512rust",
-        "encapsulation_algorithm": kyber512rust_lib.encapsulate_key,
+        "implementation": "rust",
+        "library_path": "./build/crypto_kem/libkyber512rust.so",
+        "encapsulation_symbol": "encapsulate_key",
         "cipher_text_bytes": 768,
         "shared_secret_bytes": 32,
         "public_key_bytes": 800,
@@ -84,87 +56,58 @@ KEM_ALGORITHMS = {
     },
     "kyber768rust": {
         "identifier": "kyber768rust",
-        "encapsulation_algorithm": kyber768rust_lib.encapsulate_key,
+        "implementation": "rust",
+        "library_path": "./build/crypto_kem/libkyber768rust.so",
+        "encapsulation_symbol": "encapsulate_key",
         "cipher_text_bytes": 1088,
         "shared_secret_bytes": 32,
-        "public_key_bytes": 2400,
-        "private_key_bytes": 1184,
+        "public_key_bytes": 1184,
+        "private_key_bytes": 2400,
     },
     "kyber1024rust": {
         "identifier": "kyber1024rust",
-        "encapsulation_algorithm": kyber1024rust_lib.encapsulate_key,
-        "cipher_text_bytes": 1568,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 1568,
-        "private_key_bytes": 3168,
-    },
-    "kyber512": {
-        "identifier": "kyber512",
-        "encapsulation_algorithm": kyber512_lib.PQCLEAN_KYBER512_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 768,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 800,
-        "private_key_bytes": 1632,
-    },
-    "kyber768": {
-        "identifier": "kyber768",
-        "encapsulation_algorithm": kyber768_lib.PQCLEAN_KYBER768_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 1088,
-        "shared_secret_bytes": 32,
-        "public_key_bytes": 2400,
-        "private_key_bytes": 1184,
-    },
-    "kyber1024": {
-        "identifier": "kyber1024",
-        "encapsulation_algorithm": kyber1024_lib.PQCLEAN_KYBER1024_CLEAN_crypto_kem_enc,
+        "implementation": "rust",
+        "library_path": "./build/crypto_kem/libkyber1024rust.so",
+        "encapsulation_symbol": "encapsulate_key",
         "cipher_text_bytes": 1568,
         "shared_secret_bytes": 32,
         "public_key_bytes": 1568,
         "private_key_bytes": 3168,
     },
-    "hqc-rmrs-128": {
-        "identifier": "hqc-rmrs-128",
-        "encapsulation_algorithm": hqcrmrs128_lib.PQCLEAN_HQCRMRS128_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 4481,
-        "shared_secret_bytes": 64,
-        "public_key_bytes": 2249,
-        "private_key_bytes": 2289,
-    },
-    "hqc-rmrs-192": {
-        "identifier": "hqc-rmrs-192",
-        "encapsulation_algorithm": hqcrmrs192_lib.PQCLEAN_HQCRMRS192_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 9026,
-        "shared_secret_bytes": 64,
-        "public_key_bytes": 4522,
-        "private_key_bytes": 4562,
-    },
-    "hqc-rmrs-256": {
-        "identifier": "hqc-rmrs-256",
-        "encapsulation_algorithm": hqcrmrs256_lib.PQCLEAN_HQCRMRS256_CLEAN_crypto_kem_enc,
-        "cipher_text_bytes": 14469,
-        "shared_secret_bytes": 64,
-        "public_key_bytes": 2249,
-        "private_key_bytes": 7285,
-    },
 }
 
+# Every PQClean KEM from the index generated by generate_registry.py, and the Rust Kyber libraries
+KEM_SPECS = {
+    **pqclean_specs(
+        KEM_INDEX,
+        "crypto_kem",
+        {"encapsulation_symbol": "crypto_kem_enc"},
+        IMPLEMENTATION,
+        BUILD_PROFILE,
+        LIBRARY_MODE == "combined",
+    ),
+    **RUST_KEM_SPECS,
+}
 
-def write_key_generation_time(name, elapsed_time):
-    filename = "key_generation_times.csv"
-    file_exists = os.path.isfile(filename)
 
-    with open(filename, "a", newline="") as csvfile:
-        writer = csv.writer(csvfile)
+def write_key_generation_time(name, elapsed_time, implementation=None):
+    filename = "key_generation_times.csv"
+    with _csv_lock:
+        # Creates the file, or rotates one with an outdated header
+        write_header(filename, KEY_GENERATION_HEADER)
 
-        # Write header if file does not exist
-        if not file_exists:
-            writer.writerow(["Name", "Key Generation Time", "Device Name"])
+        with open(filename, "a", newline="") as csvfile:
+            writer = csv.writer(csvfile)
 
-        # Write data row
-        writer.writerow([name, elapsed_time, DEVICE_NAME])
+            # Write data row
+            writer.writerow(
+                [name, elapsed_time, DEVICE_NAME, implementation, BUILD_PROFILE]
+            )
 
 
-def generate_keypair(public_key_size, secret_key_size, algo, name):
+def generate_keypair(
+    public_key_size, secret_key_size, algo, name, implementation=None
+):
     """
     Generates a key pair for a given algorithm and logs performance metrics.
 
@@ -173,6 +116,7 @@ def generate_keypair(public_key_size, secret_key_size, algo, name):
         secret_key_size (int): Size of the private key in bytes.
         algo (function): Function pointer to the key generation algorithm.
         name (str): Name of the algorithm (used for logging).
+        implementation (str, optional): The implementation that generates the keys, e.g. "avx2".
 
     Returns:
         dict: Generated public and private keys.
@@ -186,125 +130,56 @@ def generate_keypair(public_key_size, secret_key_size, algo, name):
         raise ValueError("Key generation failed")
     elapsed_time = time.time() - t
 
-    write_key_generation_time(name, elapsed_time)
+    write_key_generation_time(name, elapsed_time, implementation)
 
-    with open("key_sizes.csv", "a", newline="") as csvfile:
+    with _csv_lock, open("key_sizes.csv", "a", newline="") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow([name, public_key_size, secret_key_size])
     return {"public_key": pk.raw, "private_key": sk.raw}
 
 
-SIGNATURE_ALGORITHMS = {
-    "dilithium2": {
-        "identifier": "dilithium2",
-        "public_key_size": 1312,
-        "private_key_size": 2528,
-        "signature_bytes": 2420,
-        **generate_keypair(
-            1312,
-            2528,
-            dilithium2_lib.PQCLEAN_DILITHIUM2_CLEAN_crypto_sign_keypair,
-            "dilithium2",
-        ),
-        "keypair_algorithm": dilithium2_lib.PQCLEAN_DILITHIUM2_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": dilithium2_lib.PQCLEAN_DILITHIUM2_CLEAN_crypto_sign_signature,
-    },
-    "dilithium3": {
-        "identifier": "dilithium3",
-        "public_key_size": 1952,
-        "private_key_size": 4000,
-        "signature_bytes": 3293,
-        **generate_keypair(
-            1952,
-            4000,
-            dilithium3_lib.PQCLEAN_DILITHIUM3_CLEAN_crypto_sign_keypair,
-            "dilithium3",
-        ),
-        "keypair_algorithm": dilithium3_lib.PQCLEAN_DILITHIUM3_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": dilithium3_lib.PQCLEAN_DILITHIUM3_CLEAN_crypto_sign_signature,
-    },
-    "dilithium5": {
-        "identifier": "dilithium5",
-        "public_key_size": 2592,
-        "private_key_size": 4864,
-        "signature_bytes": 4595,
-        **generate_keypair(
-            2592,
-            4864,
-            dilithium5_lib.PQCLEAN_DILITHIUM5_CLEAN_crypto_sign_keypair,
-            "dilithium5",
-        ),
-        "keypair_algorithm": dilithium5_lib.PQCLEAN_DILITHIUM5_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": dilithium5_lib.PQCLEAN_DILITHIUM5_CLEAN_crypto_sign_signature,
-    },
-    "falcon512": {
-        "identifier": "falcon512",
-        "public_key_size": 897,
-        "private_key_size": 1281,
-        "signature_bytes": 690,
-        **generate_keypair(
-            897,
-            1281,
-            falcon512_lib.PQCLEAN_FALCON512_CLEAN_crypto_sign_keypair,
-            "falcon512",
-        ),
-        "keypair_algorithm": falcon512_lib.PQCLEAN_FALCON512_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": falcon512_lib.PQCLEAN_FALCON512_CLEAN_crypto_sign_signature,
-    },
-    "falcon1024": {
-        "identifier": "falcon1024",
-        "public_key_size": 1793,
-        "private_key_size": 2305,
-        "signature_bytes": 1330,
-        **generate_keypair(
-            1793,
-            2305,
-            falcon1024_lib.PQCLEAN_FALCON1024_CLEAN_crypto_sign_keypair,
-            "falcon1024",
-        ),
-        "keypair_algorithm": falcon1024_lib.PQCLEAN_FALCON1024_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": falcon1024_lib.PQCLEAN_FALCON1024_CLEAN_crypto_sign_signature,
+# Every PQClean signature scheme from the index generated by generate_registry.py
+SIGNATURE_SPECS = pqclean_specs(
+    SIGNATURE_INDEX,
+    "crypto_sign",
+    {
+        "keypair_symbol": "crypto_sign_keypair",
+        "sign_symbol": "crypto_sign_signature",
     },
-    "rainbowIclassic": {
-        "identifier": "rainbowIclassic",
-        "public_key_size": 161600,
-        "private_key_size": 103648,
-        "signature_bytes": 66,
-        **generate_keypair(
-            161600,
-            103648,
-            rainbowIclassic_lib.PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign_keypair,
-            "rainbowIclassic",
-        ),
-        "keypair_algorithm": rainbowIclassic_lib.PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": rainbowIclassic_lib.PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign_signature,
-    },
-    "rainbowIIIclassic": {
-        "identifier": "rainbowIIIclassic",
-        "public_key_size": 882080,
-        "private_key_size": 626048,
-        "signature_bytes": 164,
-        **generate_keypair(
-            882080,
-            626048,
-            rainbowIIIclassic_lib.PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign_keypair,
-            "rainbowIIIclassic",
-        ),
-        "keypair_algorithm": rainbowIIIclassic_lib.PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": rainbowIIIclassic_lib.PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign_signature,
-    },
-    "rainbowVclassic": {
-        "identifier": "rainbowVclassic",
-        "public_key_size": 1930600,
-        "private_key_size": 1408736,
-        "signature_bytes": 212,
-        **generate_keypair(
-            1930600,
-            1408736,
-            rainbowVclassic_lib.PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign_keypair,
-            "rainbowVclassic",
-        ),
-        "keypair_algorithm": rainbowVclassic_lib.PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign_keypair,
-        "sign_algorithm": rainbowVclassic_lib.PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign_signature,
-    },
-}
+    IMPLEMENTATION,
+    BUILD_PROFILE,
+    LIBRARY_MODE == "combined",
+)
+
+
+def load_signature_algorithm(entry):
+    """
+    Loads the library of a signature algorithm and generates its keypair.
+
+    Args:
+        entry (dict): The algorithm spec.
+
+    Returns:
+        dict: The entry with its functions, "public_key" and "private_key".
+    """
+    resolve_symbols(entry)
+    entry.update(
+        generate_keypair(
+            entry["public_key_size"],
+            entry["private_key_size"],
+            entry["keypair_algorithm"],
+            entry["identifier"],
+            entry["implementation"],
+        )
+    )
+    return entry
+
+
+# Libraries are opened and keys generated on the first lookup of an identifier
+KEM_ALGORITHMS = AlgorithmRegistry(KEM_SPECS, resolve_symbols, LEGACY_IDENTIFIERS)
+SIGNATURE_ALGORITHMS = AlgorithmRegistry(
+    SIGNATURE_SPECS, load_signature_algorithm, LEGACY_IDENTIFIERS
+)
+
+KEM_ALGORITHMS.warm_up(WARMUP_ALGORITHMS, KEYGEN_WORKERS)
+SIGNATURE_ALGORITHMS.warm_up(WARMUP_ALGORITHMS, KEYGEN_WORKERS)
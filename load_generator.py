@@ -0,0 +1,195 @@
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from libs_client import BUILD_PROFILE, KEM_ALGORITHMS, SIGNATURE_ALGORITHMS
+from timing_writer import TimingWriter
+from utils_client import TRANSPORT, send_data
+
+LOAD_TIMINGS_HEADER = [
+    "KEM Algorithm",
+    "Signature Algorithm",
+    "Device Name",
+    "Intended Send Time",
+    "Actual Send Time",
+    "Completion Time",
+    "Latency",
+    "Service Time",
+    "Status",
+    "Worker Id",
+    "KEM Implementation",
+    "Signature Implementation",
+    "Build Profile",
+]
+
+
+def send_pair(raw_data, kem_name, sign_name, url, wire_format):
+    """
+    Sends one message for a KEM / signature algorithm pair.
+
+    Args:
+        raw_data (bytes): The raw data to send.
+        kem_name (str): Name of the KEM algorithm.
+        sign_name (str): Name of the signature algorithm.
+        url (str): Server URL.
+        wire_format (str): Wire format passed on to `send_data`.
+    """
+    kem_algorithm = KEM_ALGORITHMS[kem_name]
+    sign_algorithm = SIGNATURE_ALGORITHMS[sign_name]
+    send_data(
+        raw_data,
+        kem_algorithm["identifier"],
+        kem_algorithm["encapsulation_algorithm"],
+        kem_algorithm["cipher_text_bytes"],
+        kem_algorithm["shared_secret_bytes"],
+        sign_algorithm["identifier"],
+        sign_algorithm["sign_algorithm"],
+        sign_algorithm["public_key"],
+        sign_algorithm["private_key"],
+        sign_algorithm["signature_bytes"],
+        url,
+        wire_format,
+    )
+
+
+class LoadGenerator:
+    """
+    Sends messages for a list of algorithm pairs, round robin, from a pool of worker threads.
+
+    With a target `rate` the requests are scheduled open-loop: request i is due at
+    start + i / rate regardless of how long earlier requests take, and its latency
+    is measured from that intended send time. Time spent waiting for a free worker
+    therefore counts as latency instead of silently lowering the offered load
+    (coordinated omission). Without a rate, `concurrency` workers send back to back
+    (closed loop) and the intended send time equals the actual one.
+    """
+
+    def __init__(
+        self,
+        url,
+        raw_data,
+        pairs,
+        wire_format,
+        rate=None,
+        concurrency=8,
+        output_file="load_timings.csv",
+        worker_id=0,
+    ):
+        """
+        Args:
+            url (str): Server URL.
+            raw_data (bytes): The raw data to send.
+            pairs (list of tuple): (KEM name, signature name) pairs to cycle through.
+            wire_format (str): Wire format passed on to `send_data`.
+            rate (float, optional): Target requests per second; None for closed-loop mode.
+            concurrency (int): Number of worker threads (maximum requests in flight).
+            output_file (str): CSV file for the per-request timings.
+            worker_id (int): Id of the client process, recorded in every row.
+        """
+        self.url = url
+        self.raw_data = raw_data
+        self.pairs = pairs
+        self.wire_format = wire_format
+        self.rate = rate
+        self.concurrency = concurrency
+        self.device_name = os.getenv("DEVICE_NAME")
+        self.worker_id = worker_id
+        self.writer = TimingWriter(output_file, LOAD_TIMINGS_HEADER)
+        # Offset converting time.monotonic_ns() readings to wall-clock nanoseconds
+        self._wall_offset = time.time_ns() - time.monotonic_ns()
+
+    def warm_up(self):
+        """
+        Loads every algorithm, registers the signing keys and fetches the server keys
+        by sending one unrecorded message per pair.
+        """
+        TRANSPORT.set_pool_size(self.concurrency)
+        for kem_name, sign_name in self.pairs:
+            send_pair(self.raw_data, kem_name, sign_name, self.url, self.wire_format)
+
+    def _send(self, kem_name, sign_name, intended):
+        actual = time.monotonic_ns()
+        status = "ok"
+        try:
+            send_pair(self.raw_data, kem_name, sign_name, self.url, self.wire_format)
+        except Exception as e:
+            status = type(e).__name__
+        completed = time.monotonic_ns()
+        self.writer.write(
+            [
+                kem_name,
+                sign_name,
+                self.device_name,
+                intended + self._wall_offset,
+                actual + self._wall_offset,
+                completed + self._wall_offset,
+                completed - intended,
+                completed - actual,
+                status,
+                self.worker_id,
+                KEM_ALGORITHMS.spec(kem_name)["implementation"],
+                SIGNATURE_ALGORITHMS.spec(sign_name)["implementation"],
+                BUILD_PROFILE,
+            ]
+        )
+
+    def run(self, duration):
+        """
+        Generates load for a fixed duration and waits for the outstanding requests.
+
+        Args:
+            duration (float): Duration in seconds.
+        """
+        try:
+            if self.rate:
+                self._run_open_loop(duration)
+            else:
+                self._run_closed_loop(duration)
+        finally:
+            self.writer.flush()
+
+    def _run_open_loop(self, duration):
+        interval_ns = int(1e9 / self.rate)
+        pairs = itertools.cycle(self.pairs)
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            start = time.monotonic_ns()
+            end = start + int(duration * 1e9)
+            for i in itertools.count():
+                intended = start + i * interval_ns
+                if intended >= end:
+                    break
+                delay = intended - time.monotonic_ns()
+                if delay > 0:
+                    time.sleep(delay / 1e9)
+                kem_name, sign_name = next(pairs)
+                executor.submit(self._send, kem_name, sign_name, intended)
+        except BaseException:
+            # Stopped early: finish the requests in flight, drop the queued ones
+            executor.shutdown(cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    def _run_closed_loop(self, duration):
+        pairs = itertools.cycle(self.pairs)
+        pairs_lock = threading.Lock()
+        stopped = threading.Event()
+        end = time.monotonic_ns() + int(duration * 1e9)
+
+        def worker():
+            while not stopped.is_set() and time.monotonic_ns() < end:
+                with pairs_lock:
+                    kem_name, sign_name = next(pairs)
+                self._send(kem_name, sign_name, time.monotonic_ns())
+
+        threads = [threading.Thread(target=worker) for _ in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            stopped.set()
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,2920 @@
+# Generated by generate_bindings.py from PQClean/crypto_*/*/*/api.h, do not edit.
+
+# Symbol prefix mapped to the scheme, implementation and buffer sizes in bytes
+SCHEMES = {
+    "PQCLEAN_DILITHIUM2AES_AVX2": {
+        "scheme": "crypto_sign/dilithium2aes",
+        "implementation": "avx2",
+        "public_key_size": 1312,
+        "private_key_size": 2528,
+        "signature_bytes": 2420,
+    },
+    "PQCLEAN_DILITHIUM2AES_CLEAN": {
+        "scheme": "crypto_sign/dilithium2aes",
+        "implementation": "clean",
+        "public_key_size": 1312,
+        "private_key_size": 2528,
+        "signature_bytes": 2420,
+    },
+    "PQCLEAN_DILITHIUM2_AARCH64": {
+        "scheme": "crypto_sign/dilithium2",
+        "implementation": "aarch64",
+        "public_key_size": 1312,
+        "private_key_size": 2528,
+        "signature_bytes": 2420,
+    },
+    "PQCLEAN_DILITHIUM2_AVX2": {
+        "scheme": "crypto_sign/dilithium2",
+        "implementation": "avx2",
+        "public_key_size": 1312,
+        "private_key_size": 2528,
+        "signature_bytes": 2420,
+    },
+    "PQCLEAN_DILITHIUM2_CLEAN": {
+        "scheme": "crypto_sign/dilithium2",
+        "implementation": "clean",
+        "public_key_size": 1312,
+        "private_key_size": 2528,
+        "signature_bytes": 2420,
+    },
+    "PQCLEAN_DILITHIUM3AES_AVX2": {
+        "scheme": "crypto_sign/dilithium3aes",
+        "implementation": "avx2",
+        "public_key_size": 1952,
+        "private_key_size": 4000,
+        "signature_bytes": 3293,
+    },
+    "PQCLEAN_DILITHIUM3AES_CLEAN": {
+        "scheme": "crypto_sign/dilithium3aes",
+        "implementation": "clean",
+        "public_key_size": 1952,
+        "private_key_size": 4000,
+        "signature_bytes": 3293,
+    },
+    "PQCLEAN_DILITHIUM3_AARCH64": {
+        "scheme": "crypto_sign/dilithium3",
+        "implementation": "aarch64",
+        "public_key_size": 1952,
+        "private_key_size": 4000,
+        "signature_bytes": 3293,
+    },
+    "PQCLEAN_DILITHIUM3_AVX2": {
+        "scheme": "crypto_sign/dilithium3",
+        "implementation": "avx2",
+        "public_key_size": 1952,
+        "private_key_size": 4000,
+        "signature_bytes": 3293,
+    },
+    "PQCLEAN_DILITHIUM3_CLEAN": {
+        "scheme": "crypto_sign/dilithium3",
+        "implementation": "clean",
+        "public_key_size": 1952,
+        "private_key_size": 4000,
+        "signature_bytes": 3293,
+    },
+    "PQCLEAN_DILITHIUM5AES_AVX2": {
+        "scheme": "crypto_sign/dilithium5aes",
+        "implementation": "avx2",
+        "public_key_size": 2592,
+        "private_key_size": 4864,
+        "signature_bytes": 4595,
+    },
+    "PQCLEAN_DILITHIUM5AES_CLEAN": {
+        "scheme": "crypto_sign/dilithium5aes",
+        "implementation": "clean",
+        "public_key_size": 2592,
+        "private_key_size": 4864,
+        "signature_bytes": 4595,
+    },
+    "PQCLEAN_DILITHIUM5_AARCH64": {
+        "scheme": "crypto_sign/dilithium5",
+        "implementation": "aarch64",
+        "public_key_size": 2592,
+        "private_key_size": 4864,
+        "signature_bytes": 4595,
+    },
+    "PQCLEAN_DILITHIUM5_AVX2": {
+        "scheme": "crypto_sign/dilithium5",
+        "implementation": "avx2",
+        "public_key_size": 2592,
+        "private_key_size": 4864,
+        "signature_bytes": 4595,
+    },
+    "PQCLEAN_DILITHIUM5_CLEAN": {
+        "scheme": "crypto_sign/dilithium5",
+        "implementation": "clean",
+        "public_key_size": 2592,
+        "private_key_size": 4864,
+        "signature_bytes": 4595,
+    },
+    "PQCLEAN_FALCON1024_AVX2": {
+        "scheme": "crypto_sign/falcon-1024",
+        "implementation": "avx2",
+        "private_key_size": 2305,
+        "public_key_size": 1793,
+        "signature_bytes": 1330,
+    },
+    "PQCLEAN_FALCON1024_CLEAN": {
+        "scheme": "crypto_sign/falcon-1024",
+        "implementation": "clean",
+        "private_key_size": 2305,
+        "public_key_size": 1793,
+        "signature_bytes": 1330,
+    },
+    "PQCLEAN_FALCON512_AVX2": {
+        "scheme": "crypto_sign/falcon-512",
+        "implementation": "avx2",
+        "private_key_size": 1281,
+        "public_key_size": 897,
+        "signature_bytes": 690,
+    },
+    "PQCLEAN_FALCON512_CLEAN": {
+        "scheme": "crypto_sign/falcon-512",
+        "implementation": "clean",
+        "private_key_size": 1281,
+        "public_key_size": 897,
+        "signature_bytes": 690,
+    },
+    "PQCLEAN_FIRESABER_AARCH64": {
+        "scheme": "crypto_kem/firesaber",
+        "implementation": "aarch64",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 1472,
+        "public_key_bytes": 1312,
+        "private_key_bytes": 3040,
+    },
+    "PQCLEAN_FIRESABER_AVX2": {
+        "scheme": "crypto_kem/firesaber",
+        "implementation": "avx2",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 1472,
+        "public_key_bytes": 1312,
+        "private_key_bytes": 3040,
+    },
+    "PQCLEAN_FIRESABER_CLEAN": {
+        "scheme": "crypto_kem/firesaber",
+        "implementation": "clean",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 1472,
+        "public_key_bytes": 1312,
+        "private_key_bytes": 3040,
+    },
+    "PQCLEAN_FRODOKEM1344AES_CLEAN": {
+        "scheme": "crypto_kem/frodokem1344aes",
+        "implementation": "clean",
+        "private_key_bytes": 43088,
+        "public_key_bytes": 21520,
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 21632,
+    },
+    "PQCLEAN_FRODOKEM1344AES_OPT": {
+        "scheme": "crypto_kem/frodokem1344aes",
+        "implementation": "opt",
+        "private_key_bytes": 43088,
+        "public_key_bytes": 21520,
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 21632,
+    },
+    "PQCLEAN_FRODOKEM1344SHAKE_CLEAN": {
+        "scheme": "crypto_kem/frodokem1344shake",
+        "implementation": "clean",
+        "private_key_bytes": 43088,
+        "public_key_bytes": 21520,
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 21632,
+    },
+    "PQCLEAN_FRODOKEM1344SHAKE_OPT": {
+        "scheme": "crypto_kem/frodokem1344shake",
+        "implementation": "opt",
+        "private_key_bytes": 43088,
+        "public_key_bytes": 21520,
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 21632,
+    },
+    "PQCLEAN_FRODOKEM640AES_CLEAN": {
+        "scheme": "crypto_kem/frodokem640aes",
+        "implementation": "clean",
+        "private_key_bytes": 19888,
+        "public_key_bytes": 9616,
+        "shared_secret_bytes": 16,
+        "cipher_text_bytes": 9720,
+    },
+    "PQCLEAN_FRODOKEM640AES_OPT": {
+        "scheme": "crypto_kem/frodokem640aes",
+        "implementation": "opt",
+        "private_key_bytes": 19888,
+        "public_key_bytes": 9616,
+        "shared_secret_bytes": 16,
+        "cipher_text_bytes": 9720,
+    },
+    "PQCLEAN_FRODOKEM640SHAKE_CLEAN": {
+        "scheme": "crypto_kem/frodokem640shake",
+        "implementation": "clean",
+        "private_key_bytes": 19888,
+        "public_key_bytes": 9616,
+        "shared_secret_bytes": 16,
+        "cipher_text_bytes": 9720,
+    },
+    "PQCLEAN_FRODOKEM640SHAKE_OPT": {
+        "scheme": "crypto_kem/frodokem640shake",
+        "implementation": "opt",
+        "private_key_bytes": 19888,
+        "public_key_bytes": 9616,
+        "shared_secret_bytes": 16,
+        "cipher_text_bytes": 9720,
+    },
+    "PQCLEAN_FRODOKEM976AES_CLEAN": {
+        "scheme": "crypto_kem/frodokem976aes",
+        "implementation": "clean",
+        "private_key_bytes": 31296,
+        "public_key_bytes": 15632,
+        "shared_secret_bytes": 24,
+        "cipher_text_bytes": 15744,
+    },
+    "PQCLEAN_FRODOKEM976AES_OPT": {
+        "scheme": "crypto_kem/frodokem976aes",
+        "implementation": "opt",
+        "private_key_bytes": 31296,
+        "public_key_bytes": 15632,
+        "shared_secret_bytes": 24,
+        "cipher_text_bytes": 15744,
+    },
+    "PQCLEAN_FRODOKEM976SHAKE_CLEAN": {
+        "scheme": "crypto_kem/frodokem976shake",
+        "implementation": "clean",
+        "private_key_bytes": 31296,
+        "public_key_bytes": 15632,
+        "shared_secret_bytes": 24,
+        "cipher_text_bytes": 15744,
+    },
+    "PQCLEAN_FRODOKEM976SHAKE_OPT": {
+        "scheme": "crypto_kem/frodokem976shake",
+        "implementation": "opt",
+        "private_key_bytes": 31296,
+        "public_key_bytes": 15632,
+        "shared_secret_bytes": 24,
+        "cipher_text_bytes": 15744,
+    },
+    "PQCLEAN_HQCRMRS128_AVX2": {
+        "scheme": "crypto_kem/hqc-rmrs-128",
+        "implementation": "avx2",
+        "private_key_bytes": 2289,
+        "public_key_bytes": 2249,
+        "shared_secret_bytes": 64,
+        "cipher_text_bytes": 4481,
+    },
+    "PQCLEAN_HQCRMRS128_CLEAN": {
+        "scheme": "crypto_kem/hqc-rmrs-128",
+        "implementation": "clean",
+        "private_key_bytes": 2289,
+        "public_key_bytes": 2249,
+        "shared_secret_bytes": 64,
+        "cipher_text_bytes": 4481,
+    },
+    "PQCLEAN_HQCRMRS192_AVX2": {
+        "scheme": "crypto_kem/hqc-rmrs-192",
+        "implementation": "avx2",
+        "private_key_bytes": 4562,
+        "public_key_bytes": 4522,
+        "shared_secret_bytes": 64,
+        "cipher_text_bytes": 9026,
+    },
+    "PQCLEAN_HQCRMRS192_CLEAN": {
+        "scheme": "crypto_kem/hqc-rmrs-192",
+        "implementation": "clean",
+        "private_key_bytes": 4562,
+        "public_key_bytes": 4522,
+        "shared_secret_bytes": 64,
+        "cipher_text_bytes": 9026,
+    },
+    "PQCLEAN_HQCRMRS256_AVX2": {
+        "scheme": "crypto_kem/hqc-rmrs-256",
+        "implementation": "avx2",
+        "private_key_bytes": 7285,
+        "public_key_bytes": 7245,
+        "shared_secret_bytes": 64,
+        "cipher_text_bytes": 14469,
+    },
+    "PQCLEAN_HQCRMRS256_CLEAN": {
+        "scheme": "crypto_kem/hqc-rmrs-256",
+        "implementation": "clean",
+        "private_key_bytes": 7285,
+        "public_key_bytes": 7245,
+        "shared_secret_bytes": 64,
+        "cipher_text_bytes": 14469,
+    },
+    "PQCLEAN_KYBER102490S_AVX2": {
+        "scheme": "crypto_kem/kyber1024-90s",
+        "implementation": "avx2",
+        "private_key_bytes": 3168,
+        "public_key_bytes": 1568,
+        "cipher_text_bytes": 1568,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER102490S_CLEAN": {
+        "scheme": "crypto_kem/kyber1024-90s",
+        "implementation": "clean",
+        "private_key_bytes": 3168,
+        "public_key_bytes": 1568,
+        "cipher_text_bytes": 1568,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER1024_AARCH64": {
+        "scheme": "crypto_kem/kyber1024",
+        "implementation": "aarch64",
+        "private_key_bytes": 3168,
+        "public_key_bytes": 1568,
+        "cipher_text_bytes": 1568,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER1024_AVX2": {
+        "scheme": "crypto_kem/kyber1024",
+        "implementation": "avx2",
+        "private_key_bytes": 3168,
+        "public_key_bytes": 1568,
+        "cipher_text_bytes": 1568,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER1024_CLEAN": {
+        "scheme": "crypto_kem/kyber1024",
+        "implementation": "clean",
+        "private_key_bytes": 3168,
+        "public_key_bytes": 1568,
+        "cipher_text_bytes": 1568,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER51290S_AVX2": {
+        "scheme": "crypto_kem/kyber512-90s",
+        "implementation": "avx2",
+        "private_key_bytes": 1632,
+        "public_key_bytes": 800,
+        "cipher_text_bytes": 768,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER51290S_CLEAN": {
+        "scheme": "crypto_kem/kyber512-90s",
+        "implementation": "clean",
+        "private_key_bytes": 1632,
+        "public_key_bytes": 800,
+        "cipher_text_bytes": 768,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER512_AARCH64": {
+        "scheme": "crypto_kem/kyber512",
+        "implementation": "aarch64",
+        "private_key_bytes": 1632,
+        "public_key_bytes": 800,
+        "cipher_text_bytes": 768,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER512_AVX2": {
+        "scheme": "crypto_kem/kyber512",
+        "implementation": "avx2",
+        "private_key_bytes": 1632,
+        "public_key_bytes": 800,
+        "cipher_text_bytes": 768,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER512_CLEAN": {
+        "scheme": "crypto_kem/kyber512",
+        "implementation": "clean",
+        "private_key_bytes": 1632,
+        "public_key_bytes": 800,
+        "cipher_text_bytes": 768,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER76890S_AVX2": {
+        "scheme": "crypto_kem/kyber768-90s",
+        "implementation": "avx2",
+        "private_key_bytes": 2400,
+        "public_key_bytes": 1184,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER76890S_CLEAN": {
+        "scheme": "crypto_kem/kyber768-90s",
+        "implementation": "clean",
+        "private_key_bytes": 2400,
+        "public_key_bytes": 1184,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER768_AARCH64": {
+        "scheme": "crypto_kem/kyber768",
+        "implementation": "aarch64",
+        "private_key_bytes": 2400,
+        "public_key_bytes": 1184,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER768_AVX2": {
+        "scheme": "crypto_kem/kyber768",
+        "implementation": "avx2",
+        "private_key_bytes": 2400,
+        "public_key_bytes": 1184,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_KYBER768_CLEAN": {
+        "scheme": "crypto_kem/kyber768",
+        "implementation": "clean",
+        "private_key_bytes": 2400,
+        "public_key_bytes": 1184,
+        "cipher_text_bytes": 1088,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_LIGHTSABER_AARCH64": {
+        "scheme": "crypto_kem/lightsaber",
+        "implementation": "aarch64",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 736,
+        "public_key_bytes": 672,
+        "private_key_bytes": 1568,
+    },
+    "PQCLEAN_LIGHTSABER_AVX2": {
+        "scheme": "crypto_kem/lightsaber",
+        "implementation": "avx2",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 736,
+        "public_key_bytes": 672,
+        "private_key_bytes": 1568,
+    },
+    "PQCLEAN_LIGHTSABER_CLEAN": {
+        "scheme": "crypto_kem/lightsaber",
+        "implementation": "clean",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 736,
+        "public_key_bytes": 672,
+        "private_key_bytes": 1568,
+    },
+    "PQCLEAN_MCELIECE348864F_AVX": {
+        "scheme": "crypto_kem/mceliece348864f",
+        "implementation": "avx",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE348864F_CLEAN": {
+        "scheme": "crypto_kem/mceliece348864f",
+        "implementation": "clean",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE348864F_SSE": {
+        "scheme": "crypto_kem/mceliece348864f",
+        "implementation": "sse",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE348864F_VEC": {
+        "scheme": "crypto_kem/mceliece348864f",
+        "implementation": "vec",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE348864_AVX": {
+        "scheme": "crypto_kem/mceliece348864",
+        "implementation": "avx",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE348864_CLEAN": {
+        "scheme": "crypto_kem/mceliece348864",
+        "implementation": "clean",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE348864_SSE": {
+        "scheme": "crypto_kem/mceliece348864",
+        "implementation": "sse",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE348864_VEC": {
+        "scheme": "crypto_kem/mceliece348864",
+        "implementation": "vec",
+        "public_key_bytes": 261120,
+        "private_key_bytes": 6452,
+        "cipher_text_bytes": 128,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896F_AVX": {
+        "scheme": "crypto_kem/mceliece460896f",
+        "implementation": "avx",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896F_CLEAN": {
+        "scheme": "crypto_kem/mceliece460896f",
+        "implementation": "clean",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896F_SSE": {
+        "scheme": "crypto_kem/mceliece460896f",
+        "implementation": "sse",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896F_VEC": {
+        "scheme": "crypto_kem/mceliece460896f",
+        "implementation": "vec",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896_AVX": {
+        "scheme": "crypto_kem/mceliece460896",
+        "implementation": "avx",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896_CLEAN": {
+        "scheme": "crypto_kem/mceliece460896",
+        "implementation": "clean",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896_SSE": {
+        "scheme": "crypto_kem/mceliece460896",
+        "implementation": "sse",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE460896_VEC": {
+        "scheme": "crypto_kem/mceliece460896",
+        "implementation": "vec",
+        "public_key_bytes": 524160,
+        "private_key_bytes": 13568,
+        "cipher_text_bytes": 188,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128F_AVX": {
+        "scheme": "crypto_kem/mceliece6688128f",
+        "implementation": "avx",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128F_CLEAN": {
+        "scheme": "crypto_kem/mceliece6688128f",
+        "implementation": "clean",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128F_SSE": {
+        "scheme": "crypto_kem/mceliece6688128f",
+        "implementation": "sse",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128F_VEC": {
+        "scheme": "crypto_kem/mceliece6688128f",
+        "implementation": "vec",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128_AVX": {
+        "scheme": "crypto_kem/mceliece6688128",
+        "implementation": "avx",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128_CLEAN": {
+        "scheme": "crypto_kem/mceliece6688128",
+        "implementation": "clean",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128_SSE": {
+        "scheme": "crypto_kem/mceliece6688128",
+        "implementation": "sse",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6688128_VEC": {
+        "scheme": "crypto_kem/mceliece6688128",
+        "implementation": "vec",
+        "public_key_bytes": 1044992,
+        "private_key_bytes": 13892,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119F_AVX": {
+        "scheme": "crypto_kem/mceliece6960119f",
+        "implementation": "avx",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119F_CLEAN": {
+        "scheme": "crypto_kem/mceliece6960119f",
+        "implementation": "clean",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119F_SSE": {
+        "scheme": "crypto_kem/mceliece6960119f",
+        "implementation": "sse",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119F_VEC": {
+        "scheme": "crypto_kem/mceliece6960119f",
+        "implementation": "vec",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119_AVX": {
+        "scheme": "crypto_kem/mceliece6960119",
+        "implementation": "avx",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119_CLEAN": {
+        "scheme": "crypto_kem/mceliece6960119",
+        "implementation": "clean",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119_SSE": {
+        "scheme": "crypto_kem/mceliece6960119",
+        "implementation": "sse",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE6960119_VEC": {
+        "scheme": "crypto_kem/mceliece6960119",
+        "implementation": "vec",
+        "public_key_bytes": 1047319,
+        "private_key_bytes": 13908,
+        "cipher_text_bytes": 226,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128F_AVX": {
+        "scheme": "crypto_kem/mceliece8192128f",
+        "implementation": "avx",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128F_CLEAN": {
+        "scheme": "crypto_kem/mceliece8192128f",
+        "implementation": "clean",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128F_SSE": {
+        "scheme": "crypto_kem/mceliece8192128f",
+        "implementation": "sse",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128F_VEC": {
+        "scheme": "crypto_kem/mceliece8192128f",
+        "implementation": "vec",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128_AVX": {
+        "scheme": "crypto_kem/mceliece8192128",
+        "implementation": "avx",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128_CLEAN": {
+        "scheme": "crypto_kem/mceliece8192128",
+        "implementation": "clean",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128_SSE": {
+        "scheme": "crypto_kem/mceliece8192128",
+        "implementation": "sse",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_MCELIECE8192128_VEC": {
+        "scheme": "crypto_kem/mceliece8192128",
+        "implementation": "vec",
+        "public_key_bytes": 1357824,
+        "private_key_bytes": 14080,
+        "cipher_text_bytes": 240,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHPS2048509_AVX2": {
+        "scheme": "crypto_kem/ntruhps2048509",
+        "implementation": "avx2",
+        "private_key_bytes": 935,
+        "public_key_bytes": 699,
+        "cipher_text_bytes": 699,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHPS2048509_CLEAN": {
+        "scheme": "crypto_kem/ntruhps2048509",
+        "implementation": "clean",
+        "private_key_bytes": 935,
+        "public_key_bytes": 699,
+        "cipher_text_bytes": 699,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHPS2048677_AVX2": {
+        "scheme": "crypto_kem/ntruhps2048677",
+        "implementation": "avx2",
+        "private_key_bytes": 1234,
+        "public_key_bytes": 930,
+        "cipher_text_bytes": 930,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHPS2048677_CLEAN": {
+        "scheme": "crypto_kem/ntruhps2048677",
+        "implementation": "clean",
+        "private_key_bytes": 1234,
+        "public_key_bytes": 930,
+        "cipher_text_bytes": 930,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHPS40961229_CLEAN": {
+        "scheme": "crypto_kem/ntruhps40961229",
+        "implementation": "clean",
+        "private_key_bytes": 2366,
+        "public_key_bytes": 1842,
+        "cipher_text_bytes": 1842,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHPS4096821_AVX2": {
+        "scheme": "crypto_kem/ntruhps4096821",
+        "implementation": "avx2",
+        "private_key_bytes": 1590,
+        "public_key_bytes": 1230,
+        "cipher_text_bytes": 1230,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHPS4096821_CLEAN": {
+        "scheme": "crypto_kem/ntruhps4096821",
+        "implementation": "clean",
+        "private_key_bytes": 1590,
+        "public_key_bytes": 1230,
+        "cipher_text_bytes": 1230,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHRSS1373_CLEAN": {
+        "scheme": "crypto_kem/ntruhrss1373",
+        "implementation": "clean",
+        "private_key_bytes": 2983,
+        "public_key_bytes": 2401,
+        "cipher_text_bytes": 2401,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHRSS701_AVX2": {
+        "scheme": "crypto_kem/ntruhrss701",
+        "implementation": "avx2",
+        "private_key_bytes": 1450,
+        "public_key_bytes": 1138,
+        "cipher_text_bytes": 1138,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRUHRSS701_CLEAN": {
+        "scheme": "crypto_kem/ntruhrss701",
+        "implementation": "clean",
+        "private_key_bytes": 1450,
+        "public_key_bytes": 1138,
+        "cipher_text_bytes": 1138,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR1013_AVX2": {
+        "scheme": "crypto_kem/ntrulpr1013",
+        "implementation": "avx2",
+        "private_key_bytes": 1773,
+        "public_key_bytes": 1455,
+        "cipher_text_bytes": 1583,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR1013_CLEAN": {
+        "scheme": "crypto_kem/ntrulpr1013",
+        "implementation": "clean",
+        "private_key_bytes": 1773,
+        "public_key_bytes": 1455,
+        "cipher_text_bytes": 1583,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR1277_AVX2": {
+        "scheme": "crypto_kem/ntrulpr1277",
+        "implementation": "avx2",
+        "private_key_bytes": 2231,
+        "public_key_bytes": 1847,
+        "cipher_text_bytes": 1975,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR1277_CLEAN": {
+        "scheme": "crypto_kem/ntrulpr1277",
+        "implementation": "clean",
+        "private_key_bytes": 2231,
+        "public_key_bytes": 1847,
+        "cipher_text_bytes": 1975,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR653_AVX2": {
+        "scheme": "crypto_kem/ntrulpr653",
+        "implementation": "avx2",
+        "private_key_bytes": 1125,
+        "public_key_bytes": 897,
+        "cipher_text_bytes": 1025,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR653_CLEAN": {
+        "scheme": "crypto_kem/ntrulpr653",
+        "implementation": "clean",
+        "private_key_bytes": 1125,
+        "public_key_bytes": 897,
+        "cipher_text_bytes": 1025,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR761_AVX2": {
+        "scheme": "crypto_kem/ntrulpr761",
+        "implementation": "avx2",
+        "private_key_bytes": 1294,
+        "public_key_bytes": 1039,
+        "cipher_text_bytes": 1167,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR761_CLEAN": {
+        "scheme": "crypto_kem/ntrulpr761",
+        "implementation": "clean",
+        "private_key_bytes": 1294,
+        "public_key_bytes": 1039,
+        "cipher_text_bytes": 1167,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR857_AVX2": {
+        "scheme": "crypto_kem/ntrulpr857",
+        "implementation": "avx2",
+        "private_key_bytes": 1463,
+        "public_key_bytes": 1184,
+        "cipher_text_bytes": 1312,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR857_CLEAN": {
+        "scheme": "crypto_kem/ntrulpr857",
+        "implementation": "clean",
+        "private_key_bytes": 1463,
+        "public_key_bytes": 1184,
+        "cipher_text_bytes": 1312,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR953_AVX2": {
+        "scheme": "crypto_kem/ntrulpr953",
+        "implementation": "avx2",
+        "private_key_bytes": 1652,
+        "public_key_bytes": 1349,
+        "cipher_text_bytes": 1477,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_NTRULPR953_CLEAN": {
+        "scheme": "crypto_kem/ntrulpr953",
+        "implementation": "clean",
+        "private_key_bytes": 1652,
+        "public_key_bytes": 1349,
+        "cipher_text_bytes": 1477,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN": {
+        "scheme": "crypto_sign/rainbowI-circumzenithal",
+        "implementation": "clean",
+        "private_key_size": 103648,
+        "public_key_size": 60192,
+        "signature_bytes": 66,
+    },
+    "PQCLEAN_RAINBOWICLASSIC_CLEAN": {
+        "scheme": "crypto_sign/rainbowI-classic",
+        "implementation": "clean",
+        "private_key_size": 103648,
+        "public_key_size": 161600,
+        "signature_bytes": 66,
+    },
+    "PQCLEAN_RAINBOWICOMPRESSED_CLEAN": {
+        "scheme": "crypto_sign/rainbowI-compressed",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 60192,
+        "signature_bytes": 66,
+    },
+    "PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN": {
+        "scheme": "crypto_sign/rainbowIII-circumzenithal",
+        "implementation": "clean",
+        "private_key_size": 626048,
+        "public_key_size": 264608,
+        "signature_bytes": 164,
+    },
+    "PQCLEAN_RAINBOWIIICLASSIC_CLEAN": {
+        "scheme": "crypto_sign/rainbowIII-classic",
+        "implementation": "clean",
+        "private_key_size": 626048,
+        "public_key_size": 882080,
+        "signature_bytes": 164,
+    },
+    "PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN": {
+        "scheme": "crypto_sign/rainbowIII-compressed",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 264608,
+        "signature_bytes": 164,
+    },
+    "PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN": {
+        "scheme": "crypto_sign/rainbowV-circumzenithal",
+        "implementation": "clean",
+        "private_key_size": 1408736,
+        "public_key_size": 536136,
+        "signature_bytes": 212,
+    },
+    "PQCLEAN_RAINBOWVCLASSIC_CLEAN": {
+        "scheme": "crypto_sign/rainbowV-classic",
+        "implementation": "clean",
+        "private_key_size": 1408736,
+        "public_key_size": 1930600,
+        "signature_bytes": 212,
+    },
+    "PQCLEAN_RAINBOWVCOMPRESSED_CLEAN": {
+        "scheme": "crypto_sign/rainbowV-compressed",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 536136,
+        "signature_bytes": 212,
+    },
+    "PQCLEAN_SABER_AARCH64": {
+        "scheme": "crypto_kem/saber",
+        "implementation": "aarch64",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 1088,
+        "public_key_bytes": 992,
+        "private_key_bytes": 2304,
+    },
+    "PQCLEAN_SABER_AVX2": {
+        "scheme": "crypto_kem/saber",
+        "implementation": "avx2",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 1088,
+        "public_key_bytes": 992,
+        "private_key_bytes": 2304,
+    },
+    "PQCLEAN_SABER_CLEAN": {
+        "scheme": "crypto_kem/saber",
+        "implementation": "clean",
+        "shared_secret_bytes": 32,
+        "cipher_text_bytes": 1088,
+        "public_key_bytes": 992,
+        "private_key_bytes": 2304,
+    },
+    "PQCLEAN_SNTRUP1013_AVX2": {
+        "scheme": "crypto_kem/sntrup1013",
+        "implementation": "avx2",
+        "private_key_bytes": 2417,
+        "public_key_bytes": 1623,
+        "cipher_text_bytes": 1455,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP1013_CLEAN": {
+        "scheme": "crypto_kem/sntrup1013",
+        "implementation": "clean",
+        "private_key_bytes": 2417,
+        "public_key_bytes": 1623,
+        "cipher_text_bytes": 1455,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP1277_AVX2": {
+        "scheme": "crypto_kem/sntrup1277",
+        "implementation": "avx2",
+        "private_key_bytes": 3059,
+        "public_key_bytes": 2067,
+        "cipher_text_bytes": 1847,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP1277_CLEAN": {
+        "scheme": "crypto_kem/sntrup1277",
+        "implementation": "clean",
+        "private_key_bytes": 3059,
+        "public_key_bytes": 2067,
+        "cipher_text_bytes": 1847,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP653_AVX2": {
+        "scheme": "crypto_kem/sntrup653",
+        "implementation": "avx2",
+        "private_key_bytes": 1518,
+        "public_key_bytes": 994,
+        "cipher_text_bytes": 897,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP653_CLEAN": {
+        "scheme": "crypto_kem/sntrup653",
+        "implementation": "clean",
+        "private_key_bytes": 1518,
+        "public_key_bytes": 994,
+        "cipher_text_bytes": 897,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP761_AVX2": {
+        "scheme": "crypto_kem/sntrup761",
+        "implementation": "avx2",
+        "private_key_bytes": 1763,
+        "public_key_bytes": 1158,
+        "cipher_text_bytes": 1039,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP761_CLEAN": {
+        "scheme": "crypto_kem/sntrup761",
+        "implementation": "clean",
+        "private_key_bytes": 1763,
+        "public_key_bytes": 1158,
+        "cipher_text_bytes": 1039,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP857_AVX2": {
+        "scheme": "crypto_kem/sntrup857",
+        "implementation": "avx2",
+        "private_key_bytes": 1999,
+        "public_key_bytes": 1322,
+        "cipher_text_bytes": 1184,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP857_CLEAN": {
+        "scheme": "crypto_kem/sntrup857",
+        "implementation": "clean",
+        "private_key_bytes": 1999,
+        "public_key_bytes": 1322,
+        "cipher_text_bytes": 1184,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP953_AVX2": {
+        "scheme": "crypto_kem/sntrup953",
+        "implementation": "avx2",
+        "private_key_bytes": 2254,
+        "public_key_bytes": 1505,
+        "cipher_text_bytes": 1349,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SNTRUP953_CLEAN": {
+        "scheme": "crypto_kem/sntrup953",
+        "implementation": "clean",
+        "private_key_bytes": 2254,
+        "public_key_bytes": 1505,
+        "cipher_text_bytes": 1349,
+        "shared_secret_bytes": 32,
+    },
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-128f-robust",
+        "implementation": "aesni",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-128f-robust",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-128f-simple",
+        "implementation": "aesni",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-128f-simple",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-128s-robust",
+        "implementation": "aesni",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-128s-robust",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-128s-simple",
+        "implementation": "aesni",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-128s-simple",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-192f-robust",
+        "implementation": "aesni",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-192f-robust",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-192f-simple",
+        "implementation": "aesni",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-192f-simple",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-192s-robust",
+        "implementation": "aesni",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-192s-robust",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-192s-simple",
+        "implementation": "aesni",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-192s-simple",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-256f-robust",
+        "implementation": "aesni",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-256f-robust",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-256f-simple",
+        "implementation": "aesni",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-256f-simple",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-256s-robust",
+        "implementation": "aesni",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-256s-robust",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI": {
+        "scheme": "crypto_sign/sphincs-haraka-256s-simple",
+        "implementation": "aesni",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-haraka-256s-simple",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-128f-robust",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-128f-robust",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-128f-simple",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-128f-simple",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-128s-robust",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-128s-robust",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-128s-simple",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-128s-simple",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-192f-robust",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-192f-robust",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-192f-simple",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-192f-simple",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-192s-robust",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-192s-robust",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-192s-simple",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-192s-simple",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-256f-robust",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-256f-robust",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-256f-simple",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-256f-simple",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-256s-robust",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-256s-robust",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-sha256-256s-simple",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-sha256-256s-simple",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-128f-robust",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-128f-robust",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-128f-simple",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-128f-simple",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 17088,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-128s-robust",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-128s-robust",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-128s-simple",
+        "implementation": "avx2",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-128s-simple",
+        "implementation": "clean",
+        "private_key_size": 64,
+        "public_key_size": 32,
+        "signature_bytes": 7856,
+        "seed_bytes": 48,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-192f-robust",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-192f-robust",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-192f-simple",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-192f-simple",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 35664,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-192s-robust",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-192s-robust",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-192s-simple",
+        "implementation": "avx2",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-192s-simple",
+        "implementation": "clean",
+        "private_key_size": 96,
+        "public_key_size": 48,
+        "signature_bytes": 16224,
+        "seed_bytes": 72,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-256f-robust",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-256f-robust",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-256f-simple",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-256f-simple",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 49856,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-256s-robust",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-256s-robust",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2": {
+        "scheme": "crypto_sign/sphincs-shake256-256s-simple",
+        "implementation": "avx2",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN": {
+        "scheme": "crypto_sign/sphincs-shake256-256s-simple",
+        "implementation": "clean",
+        "private_key_size": 128,
+        "public_key_size": 64,
+        "signature_bytes": 29792,
+        "seed_bytes": 96,
+    },
+}
+
+# Symbol mapped to (symbol prefix or None, return type, parameter types)
+PROTOTYPES = {
+    "PQCLEAN_DILITHIUM2AES_AVX2_crypto_sign": ("PQCLEAN_DILITHIUM2AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_AVX2_crypto_sign_keypair": ("PQCLEAN_DILITHIUM2AES_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_AVX2_crypto_sign_open": ("PQCLEAN_DILITHIUM2AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_AVX2_crypto_sign_signature": ("PQCLEAN_DILITHIUM2AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_AVX2_crypto_sign_verify": ("PQCLEAN_DILITHIUM2AES_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_CLEAN_crypto_sign": ("PQCLEAN_DILITHIUM2AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_CLEAN_crypto_sign_keypair": ("PQCLEAN_DILITHIUM2AES_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_CLEAN_crypto_sign_open": ("PQCLEAN_DILITHIUM2AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_CLEAN_crypto_sign_signature": ("PQCLEAN_DILITHIUM2AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2AES_CLEAN_crypto_sign_verify": ("PQCLEAN_DILITHIUM2AES_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AARCH64_crypto_sign": ("PQCLEAN_DILITHIUM2_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AARCH64_crypto_sign_keypair": ("PQCLEAN_DILITHIUM2_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AARCH64_crypto_sign_open": ("PQCLEAN_DILITHIUM2_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AARCH64_crypto_sign_signature": ("PQCLEAN_DILITHIUM2_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AARCH64_crypto_sign_verify": ("PQCLEAN_DILITHIUM2_AARCH64", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AVX2_crypto_sign": ("PQCLEAN_DILITHIUM2_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AVX2_crypto_sign_keypair": ("PQCLEAN_DILITHIUM2_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AVX2_crypto_sign_open": ("PQCLEAN_DILITHIUM2_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AVX2_crypto_sign_signature": ("PQCLEAN_DILITHIUM2_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_AVX2_crypto_sign_verify": ("PQCLEAN_DILITHIUM2_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_CLEAN_crypto_sign": ("PQCLEAN_DILITHIUM2_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_CLEAN_crypto_sign_keypair": ("PQCLEAN_DILITHIUM2_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM2_CLEAN_crypto_sign_open": ("PQCLEAN_DILITHIUM2_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_CLEAN_crypto_sign_signature": ("PQCLEAN_DILITHIUM2_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM2_CLEAN_crypto_sign_verify": ("PQCLEAN_DILITHIUM2_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_AVX2_crypto_sign": ("PQCLEAN_DILITHIUM3AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_AVX2_crypto_sign_keypair": ("PQCLEAN_DILITHIUM3AES_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_AVX2_crypto_sign_open": ("PQCLEAN_DILITHIUM3AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_AVX2_crypto_sign_signature": ("PQCLEAN_DILITHIUM3AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_AVX2_crypto_sign_verify": ("PQCLEAN_DILITHIUM3AES_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_CLEAN_crypto_sign": ("PQCLEAN_DILITHIUM3AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_CLEAN_crypto_sign_keypair": ("PQCLEAN_DILITHIUM3AES_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_CLEAN_crypto_sign_open": ("PQCLEAN_DILITHIUM3AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_CLEAN_crypto_sign_signature": ("PQCLEAN_DILITHIUM3AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3AES_CLEAN_crypto_sign_verify": ("PQCLEAN_DILITHIUM3AES_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AARCH64_crypto_sign": ("PQCLEAN_DILITHIUM3_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AARCH64_crypto_sign_keypair": ("PQCLEAN_DILITHIUM3_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AARCH64_crypto_sign_open": ("PQCLEAN_DILITHIUM3_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AARCH64_crypto_sign_signature": ("PQCLEAN_DILITHIUM3_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AARCH64_crypto_sign_verify": ("PQCLEAN_DILITHIUM3_AARCH64", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AVX2_crypto_sign": ("PQCLEAN_DILITHIUM3_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AVX2_crypto_sign_keypair": ("PQCLEAN_DILITHIUM3_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AVX2_crypto_sign_open": ("PQCLEAN_DILITHIUM3_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AVX2_crypto_sign_signature": ("PQCLEAN_DILITHIUM3_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_AVX2_crypto_sign_verify": ("PQCLEAN_DILITHIUM3_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_CLEAN_crypto_sign": ("PQCLEAN_DILITHIUM3_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_CLEAN_crypto_sign_keypair": ("PQCLEAN_DILITHIUM3_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM3_CLEAN_crypto_sign_open": ("PQCLEAN_DILITHIUM3_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_CLEAN_crypto_sign_signature": ("PQCLEAN_DILITHIUM3_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM3_CLEAN_crypto_sign_verify": ("PQCLEAN_DILITHIUM3_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_AVX2_crypto_sign": ("PQCLEAN_DILITHIUM5AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_AVX2_crypto_sign_keypair": ("PQCLEAN_DILITHIUM5AES_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_AVX2_crypto_sign_open": ("PQCLEAN_DILITHIUM5AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_AVX2_crypto_sign_signature": ("PQCLEAN_DILITHIUM5AES_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_AVX2_crypto_sign_verify": ("PQCLEAN_DILITHIUM5AES_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_CLEAN_crypto_sign": ("PQCLEAN_DILITHIUM5AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_CLEAN_crypto_sign_keypair": ("PQCLEAN_DILITHIUM5AES_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_CLEAN_crypto_sign_open": ("PQCLEAN_DILITHIUM5AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_CLEAN_crypto_sign_signature": ("PQCLEAN_DILITHIUM5AES_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5AES_CLEAN_crypto_sign_verify": ("PQCLEAN_DILITHIUM5AES_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AARCH64_crypto_sign": ("PQCLEAN_DILITHIUM5_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AARCH64_crypto_sign_keypair": ("PQCLEAN_DILITHIUM5_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AARCH64_crypto_sign_open": ("PQCLEAN_DILITHIUM5_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AARCH64_crypto_sign_signature": ("PQCLEAN_DILITHIUM5_AARCH64", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AARCH64_crypto_sign_verify": ("PQCLEAN_DILITHIUM5_AARCH64", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AVX2_crypto_sign": ("PQCLEAN_DILITHIUM5_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AVX2_crypto_sign_keypair": ("PQCLEAN_DILITHIUM5_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AVX2_crypto_sign_open": ("PQCLEAN_DILITHIUM5_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AVX2_crypto_sign_signature": ("PQCLEAN_DILITHIUM5_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_AVX2_crypto_sign_verify": ("PQCLEAN_DILITHIUM5_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_CLEAN_crypto_sign": ("PQCLEAN_DILITHIUM5_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_CLEAN_crypto_sign_keypair": ("PQCLEAN_DILITHIUM5_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_DILITHIUM5_CLEAN_crypto_sign_open": ("PQCLEAN_DILITHIUM5_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_CLEAN_crypto_sign_signature": ("PQCLEAN_DILITHIUM5_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_DILITHIUM5_CLEAN_crypto_sign_verify": ("PQCLEAN_DILITHIUM5_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_AVX2_crypto_sign": ("PQCLEAN_FALCON1024_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_AVX2_crypto_sign_keypair": ("PQCLEAN_FALCON1024_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FALCON1024_AVX2_crypto_sign_open": ("PQCLEAN_FALCON1024_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_AVX2_crypto_sign_signature": ("PQCLEAN_FALCON1024_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_AVX2_crypto_sign_verify": ("PQCLEAN_FALCON1024_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_CLEAN_crypto_sign": ("PQCLEAN_FALCON1024_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_CLEAN_crypto_sign_keypair": ("PQCLEAN_FALCON1024_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FALCON1024_CLEAN_crypto_sign_open": ("PQCLEAN_FALCON1024_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_CLEAN_crypto_sign_signature": ("PQCLEAN_FALCON1024_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON1024_CLEAN_crypto_sign_verify": ("PQCLEAN_FALCON1024_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_AVX2_crypto_sign": ("PQCLEAN_FALCON512_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_AVX2_crypto_sign_keypair": ("PQCLEAN_FALCON512_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FALCON512_AVX2_crypto_sign_open": ("PQCLEAN_FALCON512_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_AVX2_crypto_sign_signature": ("PQCLEAN_FALCON512_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_AVX2_crypto_sign_verify": ("PQCLEAN_FALCON512_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_CLEAN_crypto_sign": ("PQCLEAN_FALCON512_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_CLEAN_crypto_sign_keypair": ("PQCLEAN_FALCON512_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FALCON512_CLEAN_crypto_sign_open": ("PQCLEAN_FALCON512_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_CLEAN_crypto_sign_signature": ("PQCLEAN_FALCON512_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FALCON512_CLEAN_crypto_sign_verify": ("PQCLEAN_FALCON512_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_FIRESABER_AARCH64_crypto_kem_dec": ("PQCLEAN_FIRESABER_AARCH64", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FIRESABER_AARCH64_crypto_kem_enc": ("PQCLEAN_FIRESABER_AARCH64", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FIRESABER_AARCH64_crypto_kem_keypair": ("PQCLEAN_FIRESABER_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FIRESABER_AVX2_crypto_kem_dec": ("PQCLEAN_FIRESABER_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FIRESABER_AVX2_crypto_kem_enc": ("PQCLEAN_FIRESABER_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FIRESABER_AVX2_crypto_kem_keypair": ("PQCLEAN_FIRESABER_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FIRESABER_CLEAN_crypto_kem_dec": ("PQCLEAN_FIRESABER_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FIRESABER_CLEAN_crypto_kem_enc": ("PQCLEAN_FIRESABER_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FIRESABER_CLEAN_crypto_kem_keypair": ("PQCLEAN_FIRESABER_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM1344AES_CLEAN_crypto_kem_dec": ("PQCLEAN_FRODOKEM1344AES_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344AES_CLEAN_crypto_kem_enc": ("PQCLEAN_FRODOKEM1344AES_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344AES_CLEAN_crypto_kem_keypair": ("PQCLEAN_FRODOKEM1344AES_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM1344AES_OPT_crypto_kem_dec": ("PQCLEAN_FRODOKEM1344AES_OPT", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344AES_OPT_crypto_kem_enc": ("PQCLEAN_FRODOKEM1344AES_OPT", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344AES_OPT_crypto_kem_keypair": ("PQCLEAN_FRODOKEM1344AES_OPT", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM1344SHAKE_CLEAN_crypto_kem_dec": ("PQCLEAN_FRODOKEM1344SHAKE_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344SHAKE_CLEAN_crypto_kem_enc": ("PQCLEAN_FRODOKEM1344SHAKE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344SHAKE_CLEAN_crypto_kem_keypair": ("PQCLEAN_FRODOKEM1344SHAKE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM1344SHAKE_OPT_crypto_kem_dec": ("PQCLEAN_FRODOKEM1344SHAKE_OPT", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344SHAKE_OPT_crypto_kem_enc": ("PQCLEAN_FRODOKEM1344SHAKE_OPT", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM1344SHAKE_OPT_crypto_kem_keypair": ("PQCLEAN_FRODOKEM1344SHAKE_OPT", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM640AES_CLEAN_crypto_kem_dec": ("PQCLEAN_FRODOKEM640AES_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640AES_CLEAN_crypto_kem_enc": ("PQCLEAN_FRODOKEM640AES_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640AES_CLEAN_crypto_kem_keypair": ("PQCLEAN_FRODOKEM640AES_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM640AES_OPT_crypto_kem_dec": ("PQCLEAN_FRODOKEM640AES_OPT", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640AES_OPT_crypto_kem_enc": ("PQCLEAN_FRODOKEM640AES_OPT", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640AES_OPT_crypto_kem_keypair": ("PQCLEAN_FRODOKEM640AES_OPT", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM640SHAKE_CLEAN_crypto_kem_dec": ("PQCLEAN_FRODOKEM640SHAKE_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640SHAKE_CLEAN_crypto_kem_enc": ("PQCLEAN_FRODOKEM640SHAKE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640SHAKE_CLEAN_crypto_kem_keypair": ("PQCLEAN_FRODOKEM640SHAKE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM640SHAKE_OPT_crypto_kem_dec": ("PQCLEAN_FRODOKEM640SHAKE_OPT", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640SHAKE_OPT_crypto_kem_enc": ("PQCLEAN_FRODOKEM640SHAKE_OPT", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM640SHAKE_OPT_crypto_kem_keypair": ("PQCLEAN_FRODOKEM640SHAKE_OPT", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM976AES_CLEAN_crypto_kem_dec": ("PQCLEAN_FRODOKEM976AES_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976AES_CLEAN_crypto_kem_enc": ("PQCLEAN_FRODOKEM976AES_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976AES_CLEAN_crypto_kem_keypair": ("PQCLEAN_FRODOKEM976AES_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM976AES_OPT_crypto_kem_dec": ("PQCLEAN_FRODOKEM976AES_OPT", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976AES_OPT_crypto_kem_enc": ("PQCLEAN_FRODOKEM976AES_OPT", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976AES_OPT_crypto_kem_keypair": ("PQCLEAN_FRODOKEM976AES_OPT", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM976SHAKE_CLEAN_crypto_kem_dec": ("PQCLEAN_FRODOKEM976SHAKE_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976SHAKE_CLEAN_crypto_kem_enc": ("PQCLEAN_FRODOKEM976SHAKE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976SHAKE_CLEAN_crypto_kem_keypair": ("PQCLEAN_FRODOKEM976SHAKE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_FRODOKEM976SHAKE_OPT_crypto_kem_dec": ("PQCLEAN_FRODOKEM976SHAKE_OPT", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976SHAKE_OPT_crypto_kem_enc": ("PQCLEAN_FRODOKEM976SHAKE_OPT", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_FRODOKEM976SHAKE_OPT_crypto_kem_keypair": ("PQCLEAN_FRODOKEM976SHAKE_OPT", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_HQCRMRS128_AVX2_crypto_kem_dec": ("PQCLEAN_HQCRMRS128_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS128_AVX2_crypto_kem_enc": ("PQCLEAN_HQCRMRS128_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS128_AVX2_crypto_kem_keypair": ("PQCLEAN_HQCRMRS128_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_HQCRMRS128_CLEAN_crypto_kem_dec": ("PQCLEAN_HQCRMRS128_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS128_CLEAN_crypto_kem_enc": ("PQCLEAN_HQCRMRS128_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS128_CLEAN_crypto_kem_keypair": ("PQCLEAN_HQCRMRS128_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_HQCRMRS192_AVX2_crypto_kem_dec": ("PQCLEAN_HQCRMRS192_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS192_AVX2_crypto_kem_enc": ("PQCLEAN_HQCRMRS192_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS192_AVX2_crypto_kem_keypair": ("PQCLEAN_HQCRMRS192_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_HQCRMRS192_CLEAN_crypto_kem_dec": ("PQCLEAN_HQCRMRS192_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS192_CLEAN_crypto_kem_enc": ("PQCLEAN_HQCRMRS192_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS192_CLEAN_crypto_kem_keypair": ("PQCLEAN_HQCRMRS192_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_HQCRMRS256_AVX2_crypto_kem_dec": ("PQCLEAN_HQCRMRS256_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS256_AVX2_crypto_kem_enc": ("PQCLEAN_HQCRMRS256_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS256_AVX2_crypto_kem_keypair": ("PQCLEAN_HQCRMRS256_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_HQCRMRS256_CLEAN_crypto_kem_dec": ("PQCLEAN_HQCRMRS256_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS256_CLEAN_crypto_kem_enc": ("PQCLEAN_HQCRMRS256_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_HQCRMRS256_CLEAN_crypto_kem_keypair": ("PQCLEAN_HQCRMRS256_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER102490S_AVX2_crypto_kem_dec": ("PQCLEAN_KYBER102490S_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER102490S_AVX2_crypto_kem_enc": ("PQCLEAN_KYBER102490S_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER102490S_AVX2_crypto_kem_keypair": ("PQCLEAN_KYBER102490S_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER102490S_CLEAN_crypto_kem_dec": ("PQCLEAN_KYBER102490S_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER102490S_CLEAN_crypto_kem_enc": ("PQCLEAN_KYBER102490S_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER102490S_CLEAN_crypto_kem_keypair": ("PQCLEAN_KYBER102490S_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER1024_AARCH64_crypto_kem_dec": ("PQCLEAN_KYBER1024_AARCH64", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER1024_AARCH64_crypto_kem_enc": ("PQCLEAN_KYBER1024_AARCH64", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER1024_AARCH64_crypto_kem_keypair": ("PQCLEAN_KYBER1024_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER1024_AVX2_crypto_kem_dec": ("PQCLEAN_KYBER1024_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER1024_AVX2_crypto_kem_enc": ("PQCLEAN_KYBER1024_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER1024_AVX2_crypto_kem_keypair": ("PQCLEAN_KYBER1024_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER1024_CLEAN_crypto_kem_dec": ("PQCLEAN_KYBER1024_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER1024_CLEAN_crypto_kem_enc": ("PQCLEAN_KYBER1024_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER1024_CLEAN_crypto_kem_keypair": ("PQCLEAN_KYBER1024_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER51290S_AVX2_crypto_kem_dec": ("PQCLEAN_KYBER51290S_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER51290S_AVX2_crypto_kem_enc": ("PQCLEAN_KYBER51290S_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER51290S_AVX2_crypto_kem_keypair": ("PQCLEAN_KYBER51290S_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER51290S_CLEAN_crypto_kem_dec": ("PQCLEAN_KYBER51290S_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER51290S_CLEAN_crypto_kem_enc": ("PQCLEAN_KYBER51290S_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER51290S_CLEAN_crypto_kem_keypair": ("PQCLEAN_KYBER51290S_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER512_AARCH64_crypto_kem_dec": ("PQCLEAN_KYBER512_AARCH64", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER512_AARCH64_crypto_kem_enc": ("PQCLEAN_KYBER512_AARCH64", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER512_AARCH64_crypto_kem_keypair": ("PQCLEAN_KYBER512_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER512_AVX2_crypto_kem_dec": ("PQCLEAN_KYBER512_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER512_AVX2_crypto_kem_enc": ("PQCLEAN_KYBER512_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER512_AVX2_crypto_kem_keypair": ("PQCLEAN_KYBER512_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER512_CLEAN_crypto_kem_dec": ("PQCLEAN_KYBER512_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER512_CLEAN_crypto_kem_enc": ("PQCLEAN_KYBER512_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER512_CLEAN_crypto_kem_keypair": ("PQCLEAN_KYBER512_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER76890S_AVX2_crypto_kem_dec": ("PQCLEAN_KYBER76890S_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER76890S_AVX2_crypto_kem_enc": ("PQCLEAN_KYBER76890S_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER76890S_AVX2_crypto_kem_keypair": ("PQCLEAN_KYBER76890S_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER76890S_CLEAN_crypto_kem_dec": ("PQCLEAN_KYBER76890S_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER76890S_CLEAN_crypto_kem_enc": ("PQCLEAN_KYBER76890S_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER76890S_CLEAN_crypto_kem_keypair": ("PQCLEAN_KYBER76890S_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER768_AARCH64_crypto_kem_dec": ("PQCLEAN_KYBER768_AARCH64", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER768_AARCH64_crypto_kem_enc": ("PQCLEAN_KYBER768_AARCH64", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER768_AARCH64_crypto_kem_keypair": ("PQCLEAN_KYBER768_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER768_AVX2_crypto_kem_dec": ("PQCLEAN_KYBER768_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER768_AVX2_crypto_kem_enc": ("PQCLEAN_KYBER768_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER768_AVX2_crypto_kem_keypair": ("PQCLEAN_KYBER768_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_KYBER768_CLEAN_crypto_kem_dec": ("PQCLEAN_KYBER768_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER768_CLEAN_crypto_kem_enc": ("PQCLEAN_KYBER768_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_KYBER768_CLEAN_crypto_kem_keypair": ("PQCLEAN_KYBER768_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_LIGHTSABER_AARCH64_crypto_kem_dec": ("PQCLEAN_LIGHTSABER_AARCH64", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_LIGHTSABER_AARCH64_crypto_kem_enc": ("PQCLEAN_LIGHTSABER_AARCH64", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_LIGHTSABER_AARCH64_crypto_kem_keypair": ("PQCLEAN_LIGHTSABER_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_LIGHTSABER_AVX2_crypto_kem_dec": ("PQCLEAN_LIGHTSABER_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_LIGHTSABER_AVX2_crypto_kem_enc": ("PQCLEAN_LIGHTSABER_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_LIGHTSABER_AVX2_crypto_kem_keypair": ("PQCLEAN_LIGHTSABER_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_LIGHTSABER_CLEAN_crypto_kem_dec": ("PQCLEAN_LIGHTSABER_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_LIGHTSABER_CLEAN_crypto_kem_enc": ("PQCLEAN_LIGHTSABER_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_LIGHTSABER_CLEAN_crypto_kem_keypair": ("PQCLEAN_LIGHTSABER_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE348864F_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE348864F_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864F_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE348864F_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE348864F_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864F_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE348864F_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE348864F_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864F_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE348864F_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE348864F_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864F_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864F_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE348864_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE348864_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE348864_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE348864_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE348864_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE348864_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE348864_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE348864_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE348864_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE348864_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE348864_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE460896F_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE460896F_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896F_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE460896F_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE460896F_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896F_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE460896F_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE460896F_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896F_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE460896F_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE460896F_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896F_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896F_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE460896_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE460896_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE460896_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE460896_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE460896_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE460896_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE460896_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE460896_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE460896_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE460896_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE460896_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128F_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128F_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128F_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128F_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128F_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128F_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128F_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128F_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128F_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128F_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128F_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128F_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128F_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE6688128_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE6688128_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6688128_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE6688128_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119F_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119F_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119F_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119F_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119F_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119F_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119F_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119F_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119F_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119F_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119F_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119F_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119F_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE6960119_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE6960119_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE6960119_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE6960119_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128F_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128F_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128F_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128F_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128F_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128F_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128F_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128F_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128F_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128F_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128F_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128F_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128F_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_AVX_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128_AVX", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_AVX_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128_AVX", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_AVX_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128_AVX", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_CLEAN_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_CLEAN_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_CLEAN_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_SSE_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128_SSE", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_SSE_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128_SSE", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_SSE_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128_SSE", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_VEC_crypto_kem_dec": ("PQCLEAN_MCELIECE8192128_VEC", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_VEC_crypto_kem_enc": ("PQCLEAN_MCELIECE8192128_VEC", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_MCELIECE8192128_VEC_crypto_kem_keypair": ("PQCLEAN_MCELIECE8192128_VEC", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHPS2048509_AVX2_crypto_kem_dec": ("PQCLEAN_NTRUHPS2048509_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048509_AVX2_crypto_kem_enc": ("PQCLEAN_NTRUHPS2048509_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048509_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRUHPS2048509_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHPS2048509_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRUHPS2048509_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048509_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRUHPS2048509_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048509_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRUHPS2048509_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHPS2048677_AVX2_crypto_kem_dec": ("PQCLEAN_NTRUHPS2048677_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048677_AVX2_crypto_kem_enc": ("PQCLEAN_NTRUHPS2048677_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048677_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRUHPS2048677_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHPS2048677_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRUHPS2048677_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048677_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRUHPS2048677_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS2048677_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRUHPS2048677_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHPS40961229_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRUHPS40961229_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS40961229_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRUHPS40961229_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS40961229_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRUHPS40961229_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHPS4096821_AVX2_crypto_kem_dec": ("PQCLEAN_NTRUHPS4096821_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS4096821_AVX2_crypto_kem_enc": ("PQCLEAN_NTRUHPS4096821_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS4096821_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRUHPS4096821_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHPS4096821_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRUHPS4096821_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS4096821_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRUHPS4096821_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHPS4096821_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRUHPS4096821_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHRSS1373_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRUHRSS1373_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHRSS1373_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRUHRSS1373_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHRSS1373_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRUHRSS1373_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHRSS701_AVX2_crypto_kem_dec": ("PQCLEAN_NTRUHRSS701_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHRSS701_AVX2_crypto_kem_enc": ("PQCLEAN_NTRUHRSS701_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHRSS701_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRUHRSS701_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRUHRSS701_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRUHRSS701_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHRSS701_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRUHRSS701_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRUHRSS701_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRUHRSS701_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR1013_AVX2_crypto_kem_dec": ("PQCLEAN_NTRULPR1013_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1013_AVX2_crypto_kem_enc": ("PQCLEAN_NTRULPR1013_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1013_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRULPR1013_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR1013_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRULPR1013_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1013_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRULPR1013_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1013_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRULPR1013_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR1277_AVX2_crypto_kem_dec": ("PQCLEAN_NTRULPR1277_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1277_AVX2_crypto_kem_enc": ("PQCLEAN_NTRULPR1277_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1277_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRULPR1277_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR1277_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRULPR1277_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1277_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRULPR1277_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR1277_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRULPR1277_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR653_AVX2_crypto_kem_dec": ("PQCLEAN_NTRULPR653_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR653_AVX2_crypto_kem_enc": ("PQCLEAN_NTRULPR653_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR653_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRULPR653_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR653_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRULPR653_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR653_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRULPR653_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR653_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRULPR653_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR761_AVX2_crypto_kem_dec": ("PQCLEAN_NTRULPR761_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR761_AVX2_crypto_kem_enc": ("PQCLEAN_NTRULPR761_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR761_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRULPR761_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR761_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRULPR761_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR761_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRULPR761_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR761_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRULPR761_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR857_AVX2_crypto_kem_dec": ("PQCLEAN_NTRULPR857_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR857_AVX2_crypto_kem_enc": ("PQCLEAN_NTRULPR857_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR857_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRULPR857_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR857_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRULPR857_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR857_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRULPR857_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR857_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRULPR857_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR953_AVX2_crypto_kem_dec": ("PQCLEAN_NTRULPR953_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR953_AVX2_crypto_kem_enc": ("PQCLEAN_NTRULPR953_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR953_AVX2_crypto_kem_keypair": ("PQCLEAN_NTRULPR953_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_NTRULPR953_CLEAN_crypto_kem_dec": ("PQCLEAN_NTRULPR953_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR953_CLEAN_crypto_kem_enc": ("PQCLEAN_NTRULPR953_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_NTRULPR953_CLEAN_crypto_kem_keypair": ("PQCLEAN_NTRULPR953_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWICIRCUMZENITHAL_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWICLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWICLASSIC_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWICLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWICLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICLASSIC_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWICLASSIC_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICOMPRESSED_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWICOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICOMPRESSED_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWICOMPRESSED_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWICOMPRESSED_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWICOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICOMPRESSED_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWICOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWICOMPRESSED_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWICOMPRESSED_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWIIICIRCUMZENITHAL_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWIIICLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWIIICLASSIC_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWIIICLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWIIICLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICLASSIC_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWIIICLASSIC_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWIIICOMPRESSED_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWVCIRCUMZENITHAL_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWVCLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWVCLASSIC_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWVCLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWVCLASSIC_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCLASSIC_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWVCLASSIC_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCOMPRESSED_CLEAN_crypto_sign": ("PQCLEAN_RAINBOWVCOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCOMPRESSED_CLEAN_crypto_sign_keypair": ("PQCLEAN_RAINBOWVCOMPRESSED_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_RAINBOWVCOMPRESSED_CLEAN_crypto_sign_open": ("PQCLEAN_RAINBOWVCOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCOMPRESSED_CLEAN_crypto_sign_signature": ("PQCLEAN_RAINBOWVCOMPRESSED_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_RAINBOWVCOMPRESSED_CLEAN_crypto_sign_verify": ("PQCLEAN_RAINBOWVCOMPRESSED_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SABER_AARCH64_crypto_kem_dec": ("PQCLEAN_SABER_AARCH64", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SABER_AARCH64_crypto_kem_enc": ("PQCLEAN_SABER_AARCH64", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SABER_AARCH64_crypto_kem_keypair": ("PQCLEAN_SABER_AARCH64", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SABER_AVX2_crypto_kem_dec": ("PQCLEAN_SABER_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SABER_AVX2_crypto_kem_enc": ("PQCLEAN_SABER_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SABER_AVX2_crypto_kem_keypair": ("PQCLEAN_SABER_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SABER_CLEAN_crypto_kem_dec": ("PQCLEAN_SABER_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SABER_CLEAN_crypto_kem_enc": ("PQCLEAN_SABER_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SABER_CLEAN_crypto_kem_keypair": ("PQCLEAN_SABER_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP1013_AVX2_crypto_kem_dec": ("PQCLEAN_SNTRUP1013_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1013_AVX2_crypto_kem_enc": ("PQCLEAN_SNTRUP1013_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1013_AVX2_crypto_kem_keypair": ("PQCLEAN_SNTRUP1013_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP1013_CLEAN_crypto_kem_dec": ("PQCLEAN_SNTRUP1013_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1013_CLEAN_crypto_kem_enc": ("PQCLEAN_SNTRUP1013_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1013_CLEAN_crypto_kem_keypair": ("PQCLEAN_SNTRUP1013_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP1277_AVX2_crypto_kem_dec": ("PQCLEAN_SNTRUP1277_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1277_AVX2_crypto_kem_enc": ("PQCLEAN_SNTRUP1277_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1277_AVX2_crypto_kem_keypair": ("PQCLEAN_SNTRUP1277_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP1277_CLEAN_crypto_kem_dec": ("PQCLEAN_SNTRUP1277_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1277_CLEAN_crypto_kem_enc": ("PQCLEAN_SNTRUP1277_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP1277_CLEAN_crypto_kem_keypair": ("PQCLEAN_SNTRUP1277_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP653_AVX2_crypto_kem_dec": ("PQCLEAN_SNTRUP653_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP653_AVX2_crypto_kem_enc": ("PQCLEAN_SNTRUP653_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP653_AVX2_crypto_kem_keypair": ("PQCLEAN_SNTRUP653_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP653_CLEAN_crypto_kem_dec": ("PQCLEAN_SNTRUP653_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP653_CLEAN_crypto_kem_enc": ("PQCLEAN_SNTRUP653_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP653_CLEAN_crypto_kem_keypair": ("PQCLEAN_SNTRUP653_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP761_AVX2_crypto_kem_dec": ("PQCLEAN_SNTRUP761_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP761_AVX2_crypto_kem_enc": ("PQCLEAN_SNTRUP761_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP761_AVX2_crypto_kem_keypair": ("PQCLEAN_SNTRUP761_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP761_CLEAN_crypto_kem_dec": ("PQCLEAN_SNTRUP761_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP761_CLEAN_crypto_kem_enc": ("PQCLEAN_SNTRUP761_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP761_CLEAN_crypto_kem_keypair": ("PQCLEAN_SNTRUP761_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP857_AVX2_crypto_kem_dec": ("PQCLEAN_SNTRUP857_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP857_AVX2_crypto_kem_enc": ("PQCLEAN_SNTRUP857_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP857_AVX2_crypto_kem_keypair": ("PQCLEAN_SNTRUP857_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP857_CLEAN_crypto_kem_dec": ("PQCLEAN_SNTRUP857_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP857_CLEAN_crypto_kem_enc": ("PQCLEAN_SNTRUP857_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP857_CLEAN_crypto_kem_keypair": ("PQCLEAN_SNTRUP857_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP953_AVX2_crypto_kem_dec": ("PQCLEAN_SNTRUP953_AVX2", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP953_AVX2_crypto_kem_enc": ("PQCLEAN_SNTRUP953_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP953_AVX2_crypto_kem_keypair": ("PQCLEAN_SNTRUP953_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SNTRUP953_CLEAN_crypto_kem_dec": ("PQCLEAN_SNTRUP953_CLEAN", "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP953_CLEAN_crypto_kem_enc": ("PQCLEAN_SNTRUP953_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SNTRUP953_CLEAN_crypto_kem_keypair": ("PQCLEAN_SNTRUP953_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128FROBUST_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128SROBUST_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA128SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192FROBUST_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192SROBUST_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA192SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256FROBUST_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256SROBUST_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_AESNI", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSHARAKA256SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128FROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128SROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256128SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192FROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192SROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256192SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256FROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256SROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHA256256SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256128SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256192SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256FROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256FSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256SROBUST_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_AVX2", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_bytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_keypair": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_open": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_publickeybytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_secretkeybytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_seed_keypair": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_seedbytes": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "size_t", ()),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_signature": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "int", ("uint8_t *", "size_t *", "const uint8_t *", "size_t", "const uint8_t *")),
+    "PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN_crypto_sign_verify": ("PQCLEAN_SPHINCSSHAKE256256SSIMPLE_CLEAN", "int", ("const uint8_t *", "size_t", "const uint8_t *", "size_t", "const uint8_t *")),
+    "decapsulate_key": (None, "int", ("uint8_t *", "const uint8_t *", "const uint8_t *")),
+    "encapsulate_key": (None, "int", ("uint8_t *", "uint8_t *", "const uint8_t *")),
+    "generate_keypair": (None, "int", ("uint8_t *", "uint8_t *")),
+}
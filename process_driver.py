@@ -0,0 +1,89 @@
+import multiprocessing
+import os
+import shutil
+import signal
+from timing_writer import write_header
+
+# Signals that stop the workers; the shards are merged before the driver exits
+STOP_SIGNALS = [signal.SIGTERM, signal.SIGINT, getattr(signal, "SIGHUP", None)]
+
+
+def shard_path(path, worker_id):
+    """
+    Args:
+        path (str): Path of the merged CSV file, e.g. "client_timings.csv".
+        worker_id (int): Id of the worker writing the shard.
+
+    Returns:
+        str: Path of the worker's shard, e.g. "client_timings.worker3.csv".
+    """
+    root, extension = os.path.splitext(path)
+    return f"{root}.worker{worker_id}{extension}"
+
+
+def merge_shards(path, header, worker_ids):
+    """
+    Appends the rows of every worker's shard to a CSV file and removes the shards.
+
+    Args:
+        path (str): Path of the merged CSV file; created with `header` if it does not
+            exist or has a different header, see `timing_writer.write_header`.
+        header (list of str): Header row of the merged file and of every shard.
+        worker_ids (iterable of int): Ids of the workers whose shards are merged.
+    """
+    shards = [shard_path(path, worker_id) for worker_id in worker_ids]
+    shards = [shard for shard in shards if os.path.exists(shard)]
+    if not shards:
+        return
+    write_header(path, header)
+    with open(path, "a", newline="") as merged:
+        for shard in shards:
+            with open(shard, newline="") as file:
+                file.readline()  # Skip the shard's header
+                shutil.copyfileobj(file, merged)
+            os.remove(shard)
+
+
+def run_workers(target, processes, outputs):
+    """
+    Runs `target(worker_id)` in `processes` forked worker processes and merges their output.
+
+    SIGTERM, SIGINT and SIGHUP received by the driver are forwarded to the workers
+    as SIGTERM; once every worker has exited, the shards are merged and the driver
+    exits as well.
+
+    Args:
+        target (function): Called in each worker with its id (0 to processes - 1).
+            Must write its rows to `shard_path(path, worker_id)` for every output.
+        processes (int): Number of worker processes.
+        outputs (list of tuple): (path, header) of every CSV file the workers write to.
+    """
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=target, args=(worker_id,), name=f"worker-{worker_id}")
+        for worker_id in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    received = []
+
+    def stop(signum, frame):
+        received.append(signum)
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+    previous_handlers = {
+        signum: signal.signal(signum, stop) for signum in STOP_SIGNALS if signum
+    }
+    try:
+        for worker in workers:
+            worker.join()
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        for path, header in outputs:
+            merge_shards(path, header, range(processes))
+    if received:
+        raise SystemExit(128 + received[0])
@@ -1,24 +1,61 @@
+import argparse
 import os
+import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
+import sys
+from dotenv import dotenv_values, load_dotenv
+from algorithm_registry import (
+    DEFAULT_KEMS,
+    DEFAULT_SIGNATURES,
+    parse_algorithm_list,
+    selected_algorithms,
+)
+from build_profiles import (
+    BUILD_DIR,
+    BUILD_PROFILES,
+    DEFAULT_PROFILE,
+    combined_library_path,
+    profile_data_dir,
+    profile_settings,
+)
+from generate_make_files import (
+    KEM_DIR,
+    SIGN_DIR,
+    find_libraries,
+    host_implementations,
+    library_targets,
+    makefile_dir,
+    makefile_suffix,
+    resolve_algorithms,
+    write_makefile,
+)
 
-# Directory where all the Makefiles are stored
-MAKEFILES_DIR = "./Makefiles"
+load_dotenv()
 
-def run_makefile(makefile_path):
+# Iterations of each operation in the training run of profile-guided builds
+TRAINING_ITERATIONS = 10
+
+# Directory rust/build.sh copies the Rust Kyber libraries to
+RUST_BUILD_DIR = os.path.join(BUILD_DIR, "crypto_kem")
+
+def run_makefile(makefile_path, jobs, *make_args):
     """
-    Runs a Makefile using the `make` command.
+    Runs a Makefile using the `make` command. Make only rebuilds the objects and
+    libraries whose sources, headers or Makefile changed.
 
     Args:
         makefile_path (str): Path to the Makefile to execute.
+        jobs (int): Maximum number of compiler processes running in parallel.
+        *make_args (str): Additional arguments for make, e.g. "PGO_PHASE=generate".
 
     Prints:
         Success or error messages depending on the build status.
     """
     try:
-        print(f"Building {makefile_path}...")
+        print(f"Building {makefile_path} with {jobs} jobs...")
         subprocess.run(
-            ["make", "-f", makefile_path],  # Run the make command with the specified Makefile
+            # Keep going after a failed library, so the others are still built
+            ["make", "-f", makefile_path, f"--jobs={jobs}", "--keep-going", *make_args],
             check=True,                    # Raise an error if the command fails
             stdout=subprocess.PIPE,        # Capture standard output
             stderr=subprocess.PIPE,        # Capture standard error
@@ -28,41 +65,209 @@ def run_makefile(makefile_path):
         print(f"Error building {makefile_path}:")
         print(e.stderr.decode())  # Decode and print the error message
 
-def build_all_makefiles():
+def is_up_to_date(makefile_path, targets=()):
     """
-    Finds and executes all Makefiles in the MAKEFILES_DIR using multithreading.
+    Args:
+        makefile_path (str): Path to the Makefile.
+        targets (list of str): Libraries to check; all if empty.
 
-    - Ensures the required directories (`build`, `crypto_kem`, `crypto_sign`) exist.
-    - Locates all Makefiles in the MAKEFILES_DIR.
-    - Uses `ThreadPoolExecutor` to run Makefiles in parallel.
+    Returns:
+        bool: True if make has nothing to rebuild.
     """
-    # Ensure the directory for Makefiles exists
-    if not os.path.exists(MAKEFILES_DIR):
-        print(f"Directory {MAKEFILES_DIR} does not exist.")
-        return
+    result = subprocess.run(
+        ["make", "-f", makefile_path, "--question", *targets],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+def train(profile, schemes=()):
+    """
+    Runs keygen, encapsulation, decapsulation, signing and verification of every
+    instrumented library of a profile-guided build, which records the profile data.
 
-    # Paths to ensure required build directories exist
-    paths = ["./build", "./build/crypto_kem", "./build/crypto_sign"]
+    Args:
+        profile (str): Name of the build profile.
+        schemes (list of str): Scheme directories to train; all built ones if empty.
+    """
+    print(f"Training the {profile} libraries...")
+    subprocess.run(
+        [
+            sys.executable,
+            "compare_backends.py",
+            "--profile",
+            profile,
+            "--train",
+            "--iterations",
+            str(TRAINING_ITERATIONS),
+            *schemes,
+        ],
+        check=True,
+    )
 
-    # Check and create necessary directories
-    for path in paths:
-        if not os.path.exists(path):
-            os.makedirs(path)
+def write_combined_list(profile, schemes):
+    """
+    Writes the libraries the combined library is linked from to the profile's
+    combined.mk, which the main Makefile includes.
 
-    # Get a list of all Makefile paths
-    makefile_paths = [
-        os.path.join(MAKEFILES_DIR, filename)
-        for filename in os.listdir(MAKEFILES_DIR)
-        if filename.startswith("Makefile.")  # Only include files starting with "Makefile."
+    Args:
+        profile (str): Name of the build profile.
+        schemes (list): (type, library_name) of the schemes, with every implementation
+            the host supports.
+    """
+    names = [
+        makefile_suffix(library_name, implementation["name"])
+        for type_name, library_name in schemes
+        for implementation in host_implementations(type_name, library_name)
     ]
+    write_makefile(
+        os.path.join(makefile_dir(profile), "combined.mk"),
+        "# Written by run_make_files.py --combined\n"
+        f"COMBINED_NAMES = {' '.join(names)}\n",
+    )
+
+def build_all_makefiles(profile=DEFAULT_PROFILE, jobs=None, schemes=None, combined=False):
+    """
+    Builds the libraries of a build profile with the profile's main Makefile.
+
+    - Compiles PQClean/common once and every source file into its own object.
+    - Skips the objects and libraries that are up to date.
+    - For profile-guided builds, builds instrumented libraries, runs the training and
+      rebuilds the libraries with the recorded profile data, unless all libraries
+      are up to date.
+
+    Args:
+        profile (str): Name of the build profile, see `build_profiles.BUILD_PROFILES`.
+        jobs (int, optional): Maximum number of parallel compiler processes
+            (default: CPU count).
+        schemes (list, optional): (type, library_name) of the schemes to build, with
+            every implementation the host supports; all libraries if None.
+        combined (bool): If True, also links the schemes into one combined library.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    makefile_path = os.path.join(makefile_dir(profile), "Makefile")
+    targets = []
+    for type_name, library_name in schemes or ():
+        targets += library_targets(type_name, library_name, profile)
 
-    # Run all Makefiles concurrently
-    with ThreadPoolExecutor() as executor:
-        executor.map(run_makefile, makefile_paths)
+    # Ensure the Makefile exists
+    if not os.path.exists(makefile_path):
+        print(f"{makefile_path} does not exist, run generate_make_files.py first.")
+        return
+
+    if combined:
+        write_combined_list(
+            profile, schemes or find_libraries(KEM_DIR) + find_libraries(SIGN_DIR)
+        )
+        targets = (targets or ["all"]) + [os.path.normpath(combined_library_path(profile))]
+
+    if is_up_to_date(makefile_path, targets):
+        print(f"The libraries of the {profile} profile are up to date.")
+        return
+
+    if not profile_settings(profile)["pgo"]:
+        run_makefile(makefile_path, jobs, *targets)
+        return
+
+    # Profile data of older sources would not match the rebuilt libraries
+    shutil.rmtree(profile_data_dir(profile), ignore_errors=True)
+    run_makefile(makefile_path, jobs, "--always-make", "PGO_PHASE=generate", *targets)
+    train(profile, [library_name for _, library_name in schemes or ()])
+    run_makefile(makefile_path, jobs, "--always-make", "PGO_PHASE=use", *targets)
+
+def requested_algorithms(config=None):
+    """
+    Reads the algorithms a run uses.
+
+    Args:
+        config (str, optional): Path of a run configuration in .env format; its `KEMS`
+            and `SIGNATURES` are used instead of the environment's.
+
+    Returns:
+        list of str: The selected KEM and signature identifiers, or the defaults.
+    """
+    if config is None:
+        return selected_algorithms("KEMS", DEFAULT_KEMS) + selected_algorithms(
+            "SIGNATURES", DEFAULT_SIGNATURES
+        )
+    values = dotenv_values(config)
+    return (parse_algorithm_list(values.get("KEMS")) or list(DEFAULT_KEMS)) + (
+        parse_algorithm_list(values.get("SIGNATURES")) or list(DEFAULT_SIGNATURES)
+    )
+
+def report_missing(profile, schemes, rust, unknown, combined=False):
+    """
+    Prints the requested libraries that are not available after the build.
+
+    Args:
+        profile (str): Name of the build profile.
+        schemes (list): (type, library_name) of the requested PQClean schemes.
+        rust (list of str): Identifiers of the requested Rust libraries.
+        unknown (list of str): Requested identifiers that match no library.
+        combined (bool): If True, the combined library was requested as well.
+    """
+    missing = [f"{name}: unknown algorithm" for name in unknown]
+    if combined and not os.path.isfile(combined_library_path(profile)):
+        missing.append(f"combined library: {combined_library_path(profile)} was not built")
+    for type_name, library_name in schemes:
+        for target in library_targets(type_name, library_name, profile):
+            if not os.path.isfile(target):
+                missing.append(f"{type_name}/{library_name}: {target} was not built")
+    for name in rust:
+        path = os.path.join(RUST_BUILD_DIR, f"lib{name}.so")
+        if not os.path.isfile(path):
+            missing.append(f"{name}: {path} is missing, build it with rust/build.sh")
+    for line in missing:
+        print(f"Missing {line}")
 
 if __name__ == "__main__":
     """
-    Entry point for the script. Executes all Makefiles found in the MAKEFILES_DIR.
+    Entry point for the script. Builds the libraries of the algorithms a run uses:
+    those given on the command line, else the `KEMS` and `SIGNATURES` of the run
+    configuration or the environment, else the defaults. Reports the requested
+    libraries that are missing afterwards.
+
+    Command-Line Usage:
+        python run_make_files.py [ALGORITHM ...] [--config .env] [--all] [--combined]
+            [--profile o3] [--jobs <CPU count>]
     """
-    build_all_makefiles()
+    parser = argparse.ArgumentParser(description="Build the libraries.")
+    parser.add_argument(
+        "algorithms",
+        nargs="*",
+        help="Algorithms to build (default: the selected KEMS and SIGNATURES)",
+    )
+    parser.add_argument(
+        "--config", help="Run configuration whose KEMS and SIGNATURES are built"
+    )
+    parser.add_argument("--all", action="store_true", help="Build every scheme")
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="Also link the schemes into one library, loaded with LIBRARY_MODE=combined",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=BUILD_PROFILES,
+        default=DEFAULT_PROFILE,
+        help="Build profile (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Parallel compiler processes (default: CPU count)",
+    )
+    args = parser.parse_args()
 
+    if args.all:
+        schemes = find_libraries(KEM_DIR) + find_libraries(SIGN_DIR)
+        build_all_makefiles(args.profile, args.jobs, combined=args.combined)
+        report_missing(args.profile, schemes, [], [], args.combined)
+    else:
+        schemes, rust, unknown = resolve_algorithms(
+            args.algorithms or requested_algorithms(args.config)
+        )
+        if schemes:
+            build_all_makefiles(args.profile, args.jobs, schemes, args.combined)
+        report_missing(args.profile, schemes, rust, unknown, args.combined)
@@ -1,28 +1,90 @@
 from flask import Flask, jsonify, request
-from utils_server import get_kem_key, handle_client_message
+from utils_server import (
+    CRYPTO_POOLS,
+    get_kem_key,
+    register_signing_key,
+    server_busy,
+    submit_client_message,
+)
+from cost_pools import PoolFullError
+from libs_server import KEM_ALGORITHMS
+from wire_format import CONTENT_TYPE, decode_envelope
 import csv
 import os
 
 app = Flask(__name__)
 
 
+def read_payload():
+    """
+    Reads the request fields from either a JSON payload or a binary envelope.
+
+    Returns:
+        dict or None: The request fields.
+
+    Raises:
+        ValueError: If a binary envelope is malformed.
+    """
+    if request.mimetype == CONTENT_TYPE:
+        return decode_envelope(request.get_data(cache=False))
+    return request.json
+
+
 @app.route("/", methods=["POST"])
 def home():
     """
     Endpoint to handle client messages. Receives encrypted data, processes it, and returns the response.
 
     Expects:
-        JSON payload with the required fields for `handle_client_message`.
+        The required fields for `handle_client_message`, either as a JSON payload with
+        hex-encoded binary fields or as a binary envelope (Content-Type `CONTENT_TYPE`).
+
+    The message is handled on the thread pool for the cost class of its algorithm pair.
 
     Returns:
         Flask JSON response: The processed response or an error message.
-        HTTP status code: 200 on success, 500 on error.
+        HTTP status code: 200 on success, 503 with Retry-After if the message was rejected
+            by admission control, 500 on error.
     """
-    data = request.json
+    try:
+        data = read_payload()
+    except ValueError as e:
+        print(f"Error: {e}")
+        return jsonify({"message": "Error"}), 500
     if data is None:
         return jsonify({"message": "Error"}), 500
     try:
-        response, status = handle_client_message(**data)
+        response, status = submit_client_message(data).result()
+        return jsonify(response), status
+    except PoolFullError as e:
+        response, status, headers = server_busy(e)
+        return jsonify(response), status, headers
+    except Exception as e:
+        print(f"Error: {e}")
+        return jsonify({"message": "Error"}), 500
+
+
+@app.route("/sign_keys", methods=["POST"])
+def register_sign_key():
+    """
+    Endpoint to register a client's signing public key.
+
+    Expects:
+        JSON payload or binary envelope with the fields:
+            - "sign_algorithm_name" (str): Name of the signature algorithm.
+            - "sign_pub_key" (str or bytes): The signing public key (hex-encoded in JSON).
+
+    Returns:
+        Flask JSON response: The key id to send as "sign_key_id" in later messages.
+        HTTP status code: 200 on success, 400 for an unknown algorithm or key size, 500 on error.
+    """
+    try:
+        data = read_payload()
+        if data is None:
+            return jsonify({"message": "Error"}), 500
+        response, status = register_signing_key(
+            data["sign_algorithm_name"], data["sign_pub_key"]
+        )
         return jsonify(response), status
     except Exception as e:
         print(f"Error: {e}")
@@ -39,14 +101,56 @@ def get_key():
             - "kem_name" (str): Name of the KEM algorithm.
 
     Returns:
-        Flask JSON response: The public key in hexadecimal format.
-        HTTP status code: 200 on success, 500 on error.
+        Flask JSON response: The public key in hexadecimal format, with an ETag.
+        HTTP status code: 200 on success, 304 if If-None-Match matches, 400 without
+            "kem_name", 404 for unknown algorithms, 500 on error.
     """
     data = request.json
     if data is None:
         return jsonify({"message": "Error"}), 500
+    if "kem_name" not in data:
+        return jsonify({"message": "Missing KEM algorithm."}), 400
     kem_name = data["kem_name"]
-    return get_kem_key(kem_name)
+    if kem_name not in KEM_ALGORITHMS:
+        return jsonify({"message": "Unknown KEM algorithm."}), 404
+    return get_kem_key(kem_name, if_none_match=request.if_none_match)
+
+
+@app.route("/keys/<kem_name>", methods=["GET"])
+def get_key_by_name(kem_name):
+    """
+    Endpoint to retrieve the server's public key for a KEM algorithm, with conditional requests.
+
+    Expects:
+        - "kem_name" (str): Name of the KEM algorithm, in the URL.
+        - Optional query parameter "format=raw" or header "Accept: application/octet-stream"
+          for the raw key bytes instead of JSON.
+        - Optional If-None-Match header with a previously returned ETag.
+
+    Returns:
+        Flask response: The public key (JSON with hex or raw bytes) with an ETag.
+        HTTP status code: 200 on success, 304 if If-None-Match matches, 404 for unknown algorithms.
+    """
+    if kem_name not in KEM_ALGORITHMS:
+        return jsonify({"message": "Unknown KEM algorithm."}), 404
+    raw = (
+        request.args.get("format") == "raw"
+        or request.accept_mimetypes.best == "application/octet-stream"
+    )
+    return get_kem_key(kem_name, raw, request.if_none_match)
+
+
+@app.route("/stats", methods=["GET"])
+def get_stats():
+    """
+    Endpoint to retrieve the queue and latency statistics of the message thread pools.
+
+    Returns:
+        Flask JSON response: The statistics of each cost class pool and the measured cost
+            and pool of every algorithm pair, see `CostClassRouter.stats`, with the id of
+            the process that answered.
+    """
+    return jsonify({"process_id": os.getpid(), **CRYPTO_POOLS.stats()})
 
 
 if __name__ == "__main__":
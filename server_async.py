@@ -0,0 +1,262 @@
+import asyncio
+import json
+import os
+import re
+from urllib.parse import parse_qs
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header, parse_etags, quote_etag
+from dotenv import load_dotenv
+from libs_server import KEM_ALGORITHMS
+from utils_server import (
+    CRYPTO_POOLS,
+    get_kem_key_encodings,
+    register_signing_key,
+    server_busy,
+    submit_client_message,
+)
+from cost_pools import PoolFullError
+from timing_writer import flush_all
+from wire_format import CONTENT_TYPE, decode_envelope
+
+load_dotenv()
+
+
+async def read_body(receive):
+    """
+    Reads the complete request body.
+
+    Args:
+        receive (function): The ASGI receive callable.
+
+    Returns:
+        bytes: The request body.
+    """
+    body = bytearray()
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    return bytes(body)
+
+
+async def send_response(send, status, body=b"", content_type=None, headers=()):
+    """
+    Sends a complete response.
+
+    Args:
+        send (function): The ASGI send callable.
+        status (int): HTTP status code.
+        body (bytes): Response body.
+        content_type (str, optional): Value of the Content-Type header.
+        headers (iterable of tuple): Additional (name, value) headers as strings.
+    """
+    response_headers = [(b"content-length", str(len(body)).encode("ascii"))]
+    if content_type is not None:
+        response_headers.append((b"content-type", content_type.encode("ascii")))
+    for name, value in headers:
+        response_headers.append((name.encode("ascii"), value.encode("latin-1")))
+    await send(
+        {"type": "http.response.start", "status": status, "headers": response_headers}
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def send_json(send, data, status=200, headers=()):
+    """
+    Sends a JSON response, see `send_response`.
+    """
+    await send_response(
+        send, status, json.dumps(data).encode("utf-8"), "application/json", headers
+    )
+
+
+def read_payload(headers, body):
+    """
+    Reads the request fields from either a JSON payload or a binary envelope.
+
+    Args:
+        headers (dict): Request headers with lower-case names.
+        body (bytes): Request body.
+
+    Returns:
+        dict or None: The request fields.
+
+    Raises:
+        ValueError: If the payload is malformed.
+    """
+    mimetype = headers.get("content-type", "").split(";")[0].strip()
+    if mimetype == CONTENT_TYPE:
+        return decode_envelope(body)
+    if not body:
+        return None
+    return json.loads(body)
+
+
+async def home(headers, body, send):
+    """
+    Handles a client message, see `server.home`. The message is parsed on the event
+    loop; verification, decapsulation and decryption run on the thread pool for the
+    cost class of its algorithm pair.
+    """
+    try:
+        data = read_payload(headers, body)
+    except ValueError as e:
+        print(f"Error: {e}")
+        await send_json(send, {"message": "Error"}, 500)
+        return
+    if data is None:
+        await send_json(send, {"message": "Error"}, 500)
+        return
+    try:
+        response, status = await asyncio.wrap_future(submit_client_message(data))
+    except PoolFullError as e:
+        response, status, headers = server_busy(e)
+        await send_json(send, response, status, headers.items())
+        return
+    except Exception as e:
+        print(f"Error: {e}")
+        await send_json(send, {"message": "Error"}, 500)
+        return
+    await send_json(send, response, status)
+
+
+async def register_sign_key(headers, body, send):
+    """
+    Registers a client's signing public key, see `server.register_sign_key`. Hashing
+    and copying the key run on the default executor, not on the event loop.
+    """
+    try:
+        data = read_payload(headers, body)
+        if data is None:
+            await send_json(send, {"message": "Error"}, 500)
+            return
+        loop = asyncio.get_running_loop()
+        response, status = await loop.run_in_executor(
+            None,
+            register_signing_key,
+            data["sign_algorithm_name"],
+            data["sign_pub_key"],
+        )
+    except Exception as e:
+        print(f"Error: {e}")
+        await send_json(send, {"message": "Error"}, 500)
+        return
+    await send_json(send, response, status)
+
+
+async def send_kem_key(send, kem_name, raw, if_none_match):
+    """
+    Sends the server's public key for a KEM algorithm, see `utils_server.get_kem_key`.
+
+    Args:
+        send (function): The ASGI send callable.
+        kem_name (str): Name of the KEM algorithm.
+        raw (bool): If True, the body is the raw key instead of JSON with the key in hex format.
+        if_none_match (str, optional): Value of the If-None-Match header.
+    """
+    loop = asyncio.get_running_loop()
+    # The first lookup may load the algorithm and its keys
+    encodings = await loop.run_in_executor(None, get_kem_key_encodings, kem_name)
+    headers = [("cache-control", "no-cache"), ("etag", quote_etag(encodings["etag"]))]
+    if if_none_match and parse_etags(if_none_match).contains(encodings["etag"]):
+        await send_response(send, 304, headers=headers)
+    elif raw:
+        await send_response(
+            send, 200, encodings["raw"], "application/octet-stream", headers
+        )
+    else:
+        await send_response(send, 200, encodings["json"], "application/json", headers)
+
+
+async def get_key(headers, body, send):
+    """
+    Sends the server's public key for the KEM algorithm in the JSON body, see `server.get_key`.
+    """
+    try:
+        data = json.loads(body) if body else None
+    except ValueError:
+        data = None
+    if data is None:
+        await send_json(send, {"message": "Error"}, 500)
+        return
+    if "kem_name" not in data:
+        await send_json(send, {"message": "Missing KEM algorithm."}, 400)
+        return
+    if data["kem_name"] not in KEM_ALGORITHMS:
+        await send_json(send, {"message": "Unknown KEM algorithm."}, 404)
+        return
+    await send_kem_key(send, data["kem_name"], False, headers.get("if-none-match"))
+
+
+async def get_key_by_name(kem_name, headers, query, send):
+    """
+    Sends the server's public key for a KEM algorithm, see `server.get_key_by_name`.
+    """
+    if kem_name not in KEM_ALGORITHMS:
+        await send_json(send, {"message": "Unknown KEM algorithm."}, 404)
+        return
+    accept = parse_accept_header(headers.get("accept"), MIMEAccept)
+    raw = (
+        query.get("format") == ["raw"] or accept.best == "application/octet-stream"
+    )
+    await send_kem_key(send, kem_name, raw, headers.get("if-none-match"))
+
+
+async def lifespan(receive, send):
+    """
+    Handles the ASGI lifespan protocol: on shutdown, waits for the queued client
+    messages and writes the pending timings.
+    """
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            CRYPTO_POOLS.shutdown(wait=True)
+            flush_all()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """
+    ASGI application with the same endpoints as `server.app`.
+    """
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    method = scope["method"]
+    # Repeated slashes are merged like in Flask, e.g. for "http://host:5000//keys/kyber512"
+    path = re.sub("/{2,}", "/", scope["path"])
+    headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in scope["headers"]
+    }
+    body = await read_body(receive)
+
+    if path == "/" and method == "POST":
+        await home(headers, body, send)
+    elif path == "/sign_keys" and method == "POST":
+        await register_sign_key(headers, body, send)
+    elif path == "/keys" and method == "POST":
+        await get_key(headers, body, send)
+    elif path.startswith("/keys/") and method == "GET":
+        query = parse_qs(scope["query_string"].decode("latin-1"))
+        await get_key_by_name(path[len("/keys/") :], headers, query, send)
+    elif path == "/stats" and method == "GET":
+        await send_json(send, {"process_id": os.getpid(), **CRYPTO_POOLS.stats()})
+    else:
+        await send_json(send, {"message": "Not found."}, 404)
+
+
+if __name__ == "__main__":
+    """
+    Entry point for the asyncio server. Starts the server on host 0.0.0.0 and port 5000.
+    """
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=5000)
@@ -0,0 +1,114 @@
+import hashlib
+import os
+import struct
+import threading
+
+# Cache file layout: key id length (u16, big-endian) | key id (ASCII) | public key
+_KEY_ID_LENGTH = struct.Struct(">H")
+
+
+class ServerKeyCache:
+    """
+    Client-side cache of the servers' KEM public keys, keyed by server URL and KEM identifier.
+
+    Entries are persisted to `directory` so they survive client restarts. An entry
+    loaded from disk is dropped if its key does not hash to its key id (a truncated or
+    corrupted file), and otherwise revalidated once per process with a conditional request
+    (its key id is the server's ETag); after that it is used without contacting
+    the server until `invalidate` is called, e.g. because the server rotated its keys.
+    """
+
+    def __init__(self, directory, fetch):
+        """
+        Args:
+            directory (str): Directory for the persisted keys.
+            fetch (function): Called as fetch(kem_name, url, key_id) with the cached key id
+                (or None); returns None if the cached key is still current, otherwise a tuple
+                (key id, public key).
+        """
+        self.directory = directory
+        self._fetch = fetch
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._locks = {}
+
+    def get(self, url, kem_name):
+        """
+        Returns the server's current public key for a KEM algorithm.
+
+        Args:
+            url (str): Server URL.
+            kem_name (str): Name of the KEM algorithm.
+
+        Returns:
+            tuple: (key id, public key).
+        """
+        cache_key = (url, kem_name)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            lock = self._locks.setdefault(cache_key, threading.Lock())
+        with lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                return entry
+            stored = self._read(url, kem_name)
+            fetched = self._fetch(kem_name, url, stored[0] if stored else None)
+            if fetched is None:
+                entry = stored
+            else:
+                entry = fetched
+                self._write(url, kem_name, entry)
+            self._entries[cache_key] = entry
+            return entry
+
+    def invalidate(self, url, kem_name):
+        """
+        Drops the cached key so the next `get` fetches it from the server again.
+
+        Args:
+            url (str): Server URL.
+            kem_name (str): Name of the KEM algorithm.
+        """
+        self._entries.pop((url, kem_name), None)
+        try:
+            os.remove(self._path(url, kem_name))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, url, kem_name):
+        name = hashlib.sha256(f"{url}\0{kem_name}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.key")
+
+    def _read(self, url, kem_name):
+        try:
+            with open(self._path(url, kem_name), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < _KEY_ID_LENGTH.size:
+            return None
+        (key_id_length,) = _KEY_ID_LENGTH.unpack_from(data)
+        key_start = _KEY_ID_LENGTH.size + key_id_length
+        try:
+            key_id = data[_KEY_ID_LENGTH.size : key_start].decode("ascii")
+        except UnicodeDecodeError:
+            return None
+        public_key = data[key_start:]
+        # The key id is the server's ETag, the SHA-256 hash of the key
+        if hashlib.sha256(public_key).hexdigest() != key_id:
+            return None
+        return key_id, public_key
+
+    def _write(self, url, kem_name, entry):
+        key_id, public_key = entry
+        key_id_bytes = key_id.encode("ascii")
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(url, kem_name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(_KEY_ID_LENGTH.pack(len(key_id_bytes)))
+            file.write(key_id_bytes)
+            file.write(public_key)
+        os.replace(temp_path, path)
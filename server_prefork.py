@@ -0,0 +1,178 @@
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import make_server
+from server import app
+from algorithm_registry import DEFAULT_KEMS, DEFAULT_SIGNATURES, selected_algorithms
+from libs_server import KEM_ALGORITHMS, KEYGEN_WORKERS, SIGNATURE_ALGORITHMS
+from utils_server import SERVER_TIMINGS_HEADER, SIGNING_KEYS, get_kem_key_encodings
+from timing_writer import flush_all, write_header
+
+HOST = "0.0.0.0"
+PORT = 5000
+
+# Prefix of the directories the masters share registered signing keys in, followed by
+# the master's process id
+SHARED_DIRECTORY_PREFIX = "signing-keys-"
+
+
+def load_shared_state():
+    """
+    Loads the selected algorithms (`KEMS` and `SIGNATURES`, see `client.py`) and
+    precomputes the public key responses before the workers are forked.
+
+    The KEM keys are views into the memory-mapped keystore, so the forked workers
+    share the same physical pages instead of holding a copy of every key. Keys
+    that are missing from the keystore are generated here, once. Other algorithms
+    are loaded by each worker on first use.
+    """
+
+    def load(registry, name):
+        try:
+            registry[name]
+            if registry is KEM_ALGORITHMS:
+                get_kem_key_encodings(name)
+        except Exception as e:
+            print(f"Could not load {name}: {e}")
+
+    with ThreadPoolExecutor(max_workers=KEYGEN_WORKERS) as executor:
+        for name in selected_algorithms("KEMS", DEFAULT_KEMS):
+            executor.submit(load, KEM_ALGORITHMS, name)
+        for name in selected_algorithms("SIGNATURES", DEFAULT_SIGNATURES):
+            executor.submit(load, SIGNATURE_ALGORITHMS, name)
+
+
+def run_worker(listener, cpu):
+    """
+    Serves requests from the shared listening socket until the worker is stopped.
+
+    Args:
+        listener (socket.socket): The listening socket created by the master.
+        cpu (int or None): CPU the worker is pinned to, or None to leave it unpinned.
+    """
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    server = make_server(HOST, PORT, app, threaded=True, fd=listener.fileno())
+    server.serve_forever()
+
+
+def spawn_worker(worker_id, listener, cpus):
+    """
+    Forks a worker process.
+
+    Args:
+        worker_id (int): Id of the worker, used to pick its CPU.
+        listener (socket.socket): The listening socket created by the master.
+        cpus (list of int): CPUs available for pinning; empty to leave the workers unpinned.
+
+    Returns:
+        int: Process id of the worker.
+    """
+    pid = os.fork()
+    if pid:
+        return pid
+    status = 1
+    try:
+        run_worker(listener, cpus[worker_id % len(cpus)] if cpus else None)
+        status = 0
+    except SystemExit:
+        # Raised by the timing writer's signal handler on SIGTERM and SIGHUP
+        status = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        flush_all()
+        os._exit(status)
+
+
+def remove_stale_shared_directories(parent):
+    """
+    Removes the shared signing key directories of masters that are no longer running,
+    e.g. because they were killed before they could clean up.
+
+    Args:
+        parent (str): Directory the shared directories are created in.
+    """
+    for name in os.listdir(parent):
+        if not name.startswith(SHARED_DIRECTORY_PREFIX):
+            continue
+        pid = name[len(SHARED_DIRECTORY_PREFIX) :].partition("-")[0]
+        if pid.isdigit():
+            try:
+                os.kill(int(pid), 0)
+                continue  # The master is still running
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                continue  # Running under another user
+        shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+
+
+def main():
+    """
+    Entry point for the pre-fork server. Loads all keys once, then forks the workers,
+    which share the listening socket on port 5000 and are pinned to one CPU each.
+    Workers that exit unexpectedly are restarted; SIGTERM, SIGINT and SIGHUP stop the
+    master and all workers.
+
+    Command-Line Usage:
+        python server_prefork.py [WORKERS=<CPU count>]
+
+    Args:
+        WORKERS (int, optional): Number of worker processes (default is the CPU count).
+    """
+    worker_count = int(sys.argv[1]) if len(sys.argv) >= 2 else os.cpu_count() or 1
+    cpus = (
+        sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_setaffinity") else []
+    )
+
+    load_shared_state()
+    write_header("server_timings.csv", SERVER_TIMINGS_HEADER)
+    # Clients may register their signing key with one worker and then reach another
+    shared_parent = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    remove_stale_shared_directories(shared_parent)
+    shared_directory = tempfile.mkdtemp(
+        prefix=f"{SHARED_DIRECTORY_PREFIX}{os.getpid()}-", dir=shared_parent
+    )
+    SIGNING_KEYS.shared_directory = shared_directory
+
+    listener = socket.create_server((HOST, PORT), backlog=128)
+    # Workers that lose the race for a connection return to their select loop
+    listener.setblocking(False)
+    print(f"Serving on {HOST}:{PORT} with {worker_count} workers")
+
+    workers = {}
+    try:
+        for worker_id in range(worker_count):
+            workers[spawn_worker(worker_id, listener, cpus)] = worker_id
+        while True:
+            pid, status = os.wait()
+            worker_id = workers.pop(pid, None)
+            if worker_id is None:
+                continue
+            print(f"Worker {worker_id} exited with status {status}, restarting")
+            time.sleep(1)
+            workers[spawn_worker(worker_id, listener, cpus)] = worker_id
+    finally:
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in workers:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        listener.close()
+        shutil.rmtree(shared_directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import ctypes
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+
+def signing_key_id(sign_algorithm_name, public_key):
+    """
+    Computes the content-hash identifier of a signing public key.
+
+    Args:
+        sign_algorithm_name (str): Name of the signature algorithm the key belongs to.
+        public_key (bytes): The signing public key.
+
+    Returns:
+        str: Hex-encoded SHA-3 256-bit hash over the algorithm name and the key.
+    """
+    hash_obj = hashlib.sha3_256()
+    hash_obj.update(sign_algorithm_name.encode("utf-8"))
+    hash_obj.update(b"\0")
+    hash_obj.update(public_key)
+    return hash_obj.hexdigest()
+
+
+class SigningKeyCache:
+    """
+    Bounded LRU cache of registered signing public keys.
+
+    Keys are stored as ready-to-use ctypes buffers so verification does not copy
+    the key on every request. When the cache is full the least recently used key
+    is evicted and its client has to register it again.
+
+    With a `shared_directory`, registered keys are also written to that directory
+    (one file per key id), and keys missing from the cache are looked up there. This
+    lets processes serving the same clients, e.g. pre-forked workers, share the
+    registrations. The directory holds at most `capacity` keys as well: after a write,
+    the least recently used files beyond that are deleted.
+    """
+
+    def __init__(self, capacity, shared_directory=None):
+        """
+        Args:
+            capacity (int): Maximum number of keys held in the cache.
+            shared_directory (str, optional): Directory shared with other processes.
+        """
+        self.capacity = capacity
+        self.shared_directory = shared_directory
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, sign_algorithm_name, public_key):
+        """
+        Stores a signing public key under its content hash.
+
+        Args:
+            sign_algorithm_name (str): Name of the signature algorithm.
+            public_key (bytes): The signing public key.
+
+        Returns:
+            str: The key id to reference the key in later messages.
+        """
+        key_id = signing_key_id(sign_algorithm_name, public_key)
+        with self._lock:
+            if key_id in self._entries:
+                self._entries.move_to_end(key_id)
+                return key_id
+        if self.shared_directory is not None:
+            self._write_shared(key_id, sign_algorithm_name, public_key)
+        self._insert(key_id, sign_algorithm_name, public_key)
+        return key_id
+
+    def _insert(self, key_id, sign_algorithm_name, public_key):
+        key_buffer = (ctypes.c_uint8 * len(public_key)).from_buffer_copy(public_key)
+        entry = (sign_algorithm_name, key_buffer)
+        with self._lock:
+            self._entries[key_id] = entry
+            self._entries.move_to_end(key_id)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get(self, key_id):
+        """
+        Looks up a registered signing key.
+
+        Args:
+            key_id (str): The key id returned by `register`.
+
+        Returns:
+            tuple or None: (signature algorithm name, ctypes key buffer), or None if unknown.
+        """
+        with self._lock:
+            entry = self._entries.get(key_id)
+            if entry is not None:
+                self._entries.move_to_end(key_id)
+                return entry
+        if self.shared_directory is None:
+            return None
+        shared = self._read_shared(key_id)
+        if shared is None:
+            return None
+        return self._insert(key_id, *shared)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _shared_path(self, key_id):
+        # Key ids come from clients, only accept the hex digests `signing_key_id` produces
+        if len(key_id) != 64 or not all(c in "0123456789abcdef" for c in key_id):
+            return None
+        return os.path.join(self.shared_directory, key_id)
+
+    def _write_shared(self, key_id, sign_algorithm_name, public_key):
+        path = self._shared_path(key_id)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(sign_algorithm_name.encode("utf-8") + b"\0")
+            file.write(public_key)
+        os.replace(temp_path, path)
+        self._trim_shared()
+
+    def _trim_shared(self):
+        # Every write may add a key, so remove the least recently used files beyond
+        # `capacity`; a file is touched whenever a process reads it
+        files = []
+        with os.scandir(self.shared_directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    files.append((entry.stat().st_mtime_ns, entry.path))
+                except FileNotFoundError:
+                    pass  # Removed by another process meanwhile
+        files.sort()
+        for _, path in files[: max(0, len(files) - self.capacity)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _read_shared(self, key_id):
+        path = self._shared_path(key_id)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        name, _, public_key = data.partition(b"\0")
+        return name.decode("utf-8"), public_key
@@ -0,0 +1,174 @@
+import atexit
+import csv
+import io
+import os
+import queue
+import signal
+import threading
+import time
+
+# Appending to a list is atomic, so the signal handler can read it without a lock
+_writers = []
+_previous_handlers = {}
+
+
+class TimingWriter:
+    """
+    Appends CSV rows from a background thread.
+
+    `write` only puts the row on an in-memory queue. The writer thread appends
+    the queued rows in batches, opening the file once per batch, as soon as
+    `batch_size` rows are pending or `flush_interval` seconds have passed.
+    """
+
+    def __init__(self, path, header, batch_size=256, flush_interval=1.0):
+        """
+        Args:
+            path (str): Path to the CSV file; an existing file with a different header
+                is rotated, see `write_header`.
+            header (list of str): Header row written when the file is created.
+            batch_size (int): Number of pending rows that triggers a write.
+            flush_interval (float): Maximum time in seconds a row stays in memory.
+        """
+        self.path = path
+        self.header = header
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # SimpleQueue.put is reentrant, so `flush` is safe to call from a signal handler
+        self._queue = queue.SimpleQueue()
+        write_header(path, header)
+        self._thread = threading.Thread(
+            target=self._run, name=f"timing-writer-{path}", daemon=True
+        )
+        self._thread.start()
+        _writers.append(self)
+
+    def write(self, row):
+        """
+        Queues a row for writing.
+
+        Args:
+            row (list): The CSV row.
+        """
+        self._queue.put(row)
+
+    def flush(self, timeout=5.0):
+        """
+        Writes all queued rows and waits until they are on disk.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for the writer thread.
+        """
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _run(self):
+        rows = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, threading.Event):
+                self._write_rows(rows)
+                rows, deadline = [], None
+                item.set()
+                continue
+            if item is not None:
+                rows.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if rows and (len(rows) >= self.batch_size or time.monotonic() >= deadline):
+                self._write_rows(rows)
+                rows, deadline = [], None
+
+    def _write_rows(self, rows):
+        if not rows:
+            return
+        try:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            if not os.path.exists(self.path):
+                writer.writerow(self.header)
+            writer.writerows(rows)
+            # A single write to a file opened for appending, so batches written by
+            # several processes to the same file never interleave
+            with open(self.path, "ab", buffering=0) as file:
+                file.write(buffer.getvalue().encode("utf-8"))
+        except OSError as e:
+            print(f"Error writing timings to {self.path}: {e}")
+
+
+def read_header(path):
+    """
+    Args:
+        path (str): Path to a CSV file.
+
+    Returns:
+        list of str: The file's first row, or None if the file does not exist or is empty.
+    """
+    try:
+        with open(path, newline="") as file:
+            return next(csv.reader(file), None)
+    except FileNotFoundError:
+        return None
+
+
+def write_header(path, header):
+    """
+    Creates a CSV file with its header row if it does not exist yet, e.g. before
+    several processes start appending to it.
+
+    A file with a different header, e.g. written before columns were added, is
+    renamed to "<path>.old" (replacing an older one), so new rows never end up
+    under the wrong columns.
+
+    Args:
+        path (str): Path to the CSV file.
+        header (list of str): The header row.
+    """
+    existing = read_header(path)
+    if existing is not None and existing != list(header):
+        print(f"{path} has an outdated header, moving it to {path}.old")
+        os.replace(path, f"{path}.old")
+    try:
+        with open(path, "x", newline="") as file:
+            csv.writer(file).writerow(header)
+    except FileExistsError:
+        pass
+
+
+def flush_all():
+    """
+    Flushes every timing writer created in this process.
+    """
+    for writer in list(_writers):
+        writer.flush()
+
+
+def _handle_signal(signum, frame):
+    flush_all()
+    previous = _previous_handlers.get(signum)
+    if callable(previous):
+        previous(signum, frame)
+    elif previous != signal.SIG_IGN:
+        raise SystemExit(128 + signum)
+
+
+def install_signal_handlers():
+    """
+    Flushes all timing writers on SIGTERM, SIGINT and SIGHUP (sent by `tmux kill-session`)
+    before the previous handler runs, and at interpreter exit.
+
+    Does nothing when called outside the main thread, where handlers cannot be installed.
+    """
+    if threading.current_thread() is not threading.main_thread() or _previous_handlers:
+        return
+    atexit.register(flush_all)
+    for signum in (signal.SIGTERM, signal.SIGINT, getattr(signal, "SIGHUP", None)):
+        if signum is not None:
+            _previous_handlers[signum] = signal.signal(signum, _handle_signal)
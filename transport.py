@@ -0,0 +1,188 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+# Status codes that indicate a temporarily unavailable server
+TRANSIENT_STATUS_CODES = {502, 503, 504}
+
+# Methods that are safe to resend after the server may already have received them
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def connection_not_established(error):
+    """
+    Args:
+        error (requests.RequestException): Error of a failed request.
+
+    Returns:
+        bool: True if the request failed before a connection was established, so the
+            server cannot have received it.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError):
+        return False
+    # requests wraps urllib3's MaxRetryError, whose reason is the underlying error
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, NewConnectionError)
+
+
+class TransientError(Exception):
+    """
+    Raised when a request still fails with a transient error after all retries.
+    """
+
+
+class Transport:
+    """
+    HTTP transport on a shared session with connection pooling and keep-alive.
+
+    Connection errors, timeouts and `TRANSIENT_STATUS_CODES` responses are retried
+    with jittered exponential backoff ("full jitter": a random delay between 0 and
+    base * 2^attempt, capped at `backoff_max`). If a transient response carries a
+    Retry-After header, e.g. a 503 from the server's admission control, the next
+    attempt waits that long instead (at most `retry_after_max`). Any other response
+    is returned to the caller, and any other exception is raised immediately.
+    Requests of other methods than `IDEMPOTENT_METHODS`, e.g. POST, are only retried
+    after errors that occurred before a connection was established: after a read
+    timeout or a dropped connection the server may already have handled the request,
+    so the error is raised instead of sending it twice.
+    """
+
+    def __init__(
+        self,
+        pool_size=4,
+        connect_timeout=3.0,
+        read_timeout=60.0,
+        max_retries=6,
+        backoff_base=0.05,
+        backoff_max=2.0,
+        retry_after_max=30.0,
+    ):
+        """
+        Args:
+            pool_size (int): Maximum number of pooled connections per host.
+            connect_timeout (float): Timeout in seconds for establishing a connection.
+            read_timeout (float): Timeout in seconds for waiting on the response.
+            max_retries (int): Number of retries after the first attempt.
+            backoff_base (float): Base delay in seconds of the exponential backoff.
+            backoff_max (float): Maximum delay in seconds between two attempts.
+            retry_after_max (float): Maximum delay in seconds taken from a Retry-After header.
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.session = requests.Session()
+        self.set_pool_size(pool_size)
+
+    def set_pool_size(self, pool_size):
+        """
+        Replaces the connection pools, e.g. to keep one connection per sending thread.
+
+        Args:
+            pool_size (int): Maximum number of pooled connections per host.
+        """
+        self.pool_size = pool_size
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def reset(self):
+        """
+        Drops all pooled connections, e.g. in a forked worker that must not share
+        sockets with its parent.
+        """
+        self.set_pool_size(self.pool_size)
+
+    def backoff(self, attempt):
+        """
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+
+        Returns:
+            float: Delay in seconds before the next attempt.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def retry_after(self, response):
+        """
+        Args:
+            response (requests.Response): A transient response.
+
+        Returns:
+            float or None: Delay in seconds requested by the Retry-After header (at most
+                `retry_after_max`), or None if there is no valid header.
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(self.retry_after_max, max(0.0, delay))
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends a request, retrying transient failures.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            **kwargs: Passed on to `requests.Session.request`.
+
+        Returns:
+            requests.Response: The first non-transient response.
+
+        Raises:
+            TransientError: If every attempt failed with a transient error.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        error = None
+        delay = 0
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                time.sleep(delay)
+            delay = self.backoff(attempt)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if (
+                    method.upper() not in IDEMPOTENT_METHODS
+                    and not connection_not_established(e)
+                ):
+                    raise
+                error = e
+                continue
+            if response.status_code not in TRANSIENT_STATUS_CODES:
+                return response
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                # Spread the retries of clients that were rejected at the same time
+                delay = retry_after + random.uniform(0, self.backoff_base)
+            error = f"HTTP {response.status_code}"
+            response.close()
+        raise TransientError(
+            f"{method} {url} failed after {self.max_retries + 1} attempts: {error}"
+        )
+
+    def get(self, url, **kwargs):
+        """
+        Sends a GET request, see `request`.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """
+        Sends a POST request, see `request`.
+        """
+        return self.request("POST", url, **kwargs)
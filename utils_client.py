@@ -1,9 +1,27 @@
 import time
-import requests
 import ctypes
 import hashlib
+import os
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
+from wire_format import CONTENT_TYPE, encode_envelope, encode_json_fields
+from server_key_cache import ServerKeyCache
+from libs_client import KEM_ALGORITHMS
+from transport import Transport
+
+# Wire formats accepted by the server's POST / endpoint
+WIRE_FORMAT_BINARY = "binary"
+WIRE_FORMAT_JSON = "json"
+
+# Shared keep-alive connection pool with retries for all requests to the server
+TRANSPORT = Transport(
+    connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.0")),
+    read_timeout=float(os.getenv("HTTP_READ_TIMEOUT", "60.0")),
+    max_retries=int(os.getenv("HTTP_MAX_RETRIES", "6")),
+)
+
+# Signing key ids returned by the server, keyed by (url, algorithm name, public key)
+_registered_signing_keys = {}
 
 
 def hash_message(message, timings):
@@ -63,6 +81,9 @@ def encapsulate_key(
 
     Returns:
         tuple: The encapsulated key and shared secret.
+
+    Raises:
+        ValueError: If the public key is too short or the encapsulation fails.
     """
     start_time = time.time_ns()
     encapsulated_key = ctypes.create_string_buffer(cipher_text_bytes)
@@ -75,23 +96,92 @@ def encapsulate_key(
     return encapsulated_key.raw, shared_secret.raw
 
 
-def get_client_public_key(kem_name, url):
+def get_client_public_key(kem_name, url, key_id=None):
     """
-    Fetches the client's public key from the server.
+    Fetches the client's public key from the server as raw bytes.
 
     Args:
         kem_name (str): The name of the KEM algorithm.
         url (str): The server's URL.
+        key_id (str, optional): Id (ETag) of a cached key to revalidate.
+
+    Returns:
+        tuple or None: (key id, public key), or None if the cached key `key_id` is still current.
+
+    Raises:
+        ValueError: If the request fails or the key does not have the algorithm's size.
+    """
+    headers = {"Accept": "application/octet-stream"}
+    if key_id is not None:
+        headers["If-None-Match"] = f'"{key_id}"'
+    response = TRANSPORT.get(f"{url}/keys/{kem_name}", headers=headers)
+    if response.status_code == 304 and key_id is not None:
+        return None
+    if response.status_code != 200:
+        raise ValueError(f"Fetching the public key failed with status {response.status_code}")
+    public_key = response.content
+    expected_size = KEM_ALGORITHMS.spec(kem_name)["public_key_bytes"]
+    if len(public_key) != expected_size:
+        raise ValueError(
+            f"The {kem_name} public key has {len(public_key)} bytes, expected {expected_size}"
+        )
+    return response.headers.get("ETag", "").strip('"'), public_key
+
+
+# Server KEM public keys, persisted across client restarts
+SERVER_KEYS = ServerKeyCache(
+    os.getenv("SERVER_KEY_CACHE_DIR", ".server_keys"), get_client_public_key
+)
+
+
+def post_payload(url, payload, wire_format):
+    """
+    Posts a payload to the server in the requested wire format.
+
+    Args:
+        url (str): Endpoint URL.
+        payload (dict): Field names mapped to raw bytes or str values.
+        wire_format (str): `WIRE_FORMAT_BINARY` or `WIRE_FORMAT_JSON`.
 
     Returns:
-        bytes: The client's public key as bytes.
+        requests.Response: The server response.
+    """
+    if wire_format == WIRE_FORMAT_BINARY:
+        return TRANSPORT.post(
+            url,
+            data=encode_envelope(payload),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+    return TRANSPORT.post(url, json=encode_json_fields(payload))
+
+
+def register_signing_key(sign_algorithm_name, sign_public_key, url, wire_format):
     """
-    payload = {"kem_name": kem_name}
-    response = requests.post(f"{url}/keys", json=payload)
+    Registers the signing public key with the server once and returns its key id.
+
+    Args:
+        sign_algorithm_name (str): Name of the signing algorithm.
+        sign_public_key (bytes): Public key for signing.
+        url (str): Server URL.
+        wire_format (str): `WIRE_FORMAT_BINARY` or `WIRE_FORMAT_JSON`.
+
+    Returns:
+        str: The key id assigned by the server.
+    """
+    cache_key = (url, sign_algorithm_name, sign_public_key)
+    key_id = _registered_signing_keys.get(cache_key)
+    if key_id is not None:
+        return key_id
+    response = post_payload(
+        f"{url}/sign_keys",
+        {"sign_algorithm_name": sign_algorithm_name, "sign_pub_key": sign_public_key},
+        wire_format,
+    )
     data = response.json()
-    if not data or "server_public_key" not in data:
-        raise ValueError("Missing 'server_public_key' in response")
-    return bytes.fromhex(data["server_public_key"])
+    if not data or "key_id" not in data:
+        raise ValueError("Missing 'key_id' in response")
+    _registered_signing_keys[cache_key] = data["key_id"]
+    return data["key_id"]
 
 
 def get_data_to_send(
@@ -101,12 +191,12 @@ def get_data_to_send(
     cipher_text_bytes,
     shared_secret_bytes,
     sign_algorithm,
-    sign_public_key,
     sign_private_key,
     sign_bytes,
 ):
     """
     Prepares the data to be sent to the server by encrypting, hashing, and signing it.
+    The signing public key is not part of the payload, see `register_signing_key`.
 
     Args:
         raw_data (bytes): The raw data to encrypt.
@@ -115,12 +205,11 @@ def get_data_to_send(
         cipher_text_bytes (int): Ciphertext buffer size.
         shared_secret_bytes (int): Shared secret buffer size.
         sign_algorithm (function): Signing algorithm.
-        sign_public_key (bytes): Public key for signing.
         sign_private_key (bytes): Private key for signing.
         sign_bytes (int): Signature buffer size.
 
     Returns:
-        tuple: The payload dictionary and timings.
+        tuple: The payload dictionary (raw bytes values) and timings.
     """
     timings = {}
     encapsulated_key, shared_secret = encapsulate_key(
@@ -139,11 +228,10 @@ def get_data_to_send(
     )
 
     return {
-        "cipher_text": ciphertext.hex(),
-        "iv": iv.hex(),
-        "signature": signature.hex(),
-        "secret_key": encapsulated_key.hex(),
-        "sign_pub_key": sign_public_key.hex(),
+        "cipher_text": ciphertext,
+        "iv": iv,
+        "signature": signature,
+        "secret_key": encapsulated_key,
     }, timings
 
 
@@ -159,9 +247,13 @@ def send_data(
     sign_private_key,
     sign_bytes,
     url,
+    wire_format=WIRE_FORMAT_BINARY,
 ):
     """
     Sends encrypted, signed, and encapsulated data to the server.
+    The signing public key is registered once per server and then referenced by its key id.
+    The server's KEM public key comes from `SERVER_KEYS`; if the server reports that it
+    rotated the key, the cached key is invalidated and the message is sent again.
 
     Args:
         raw_data (bytes): The raw data to send.
@@ -175,28 +267,53 @@ def send_data(
         sign_private_key (bytes): Private key for signing.
         sign_bytes (int): Signature buffer size.
         url (str): Server URL.
+        wire_format (str): `WIRE_FORMAT_BINARY` for the binary envelope or `WIRE_FORMAT_JSON`
+            for hex-encoded JSON (default is binary).
 
     Returns:
         tuple: Server response message and timings.
+
+    Raises:
+        TransientError: If the server stayed unavailable or overloaded through all retries.
+        ValueError: If the server rejected the message.
     """
-    client_public_key = get_client_public_key(kem_algo_name, url)
-    payload, timings = get_data_to_send(
-        raw_data,
-        client_public_key,
-        kem_algorithm,
-        kem_cipher_text_bytes,
-        kem_shared_secret_bytes,
-        sign_algorithm,
-        sign_public_key,
-        sign_private_key,
-        sign_bytes,
-    )
-    payload["kem_algo_name"] = kem_algo_name
-    payload["sign_algorithm_name"] = sign_algorithm_name
-    response = requests.post(f"{url}", json=payload)
+    for _ in range(2):
+        kem_key_id, client_public_key = SERVER_KEYS.get(url, kem_algo_name)
+        payload, timings = get_data_to_send(
+            raw_data,
+            client_public_key,
+            kem_algorithm,
+            kem_cipher_text_bytes,
+            kem_shared_secret_bytes,
+            sign_algorithm,
+            sign_private_key,
+            sign_bytes,
+        )
+        payload["kem_algo_name"] = kem_algo_name
+        payload["kem_key_id"] = kem_key_id
+        payload["sign_algorithm_name"] = sign_algorithm_name
+        payload["sign_key_id"] = register_signing_key(
+            sign_algorithm_name, sign_public_key, url, wire_format
+        )
+        response = post_payload(f"{url}", payload, wire_format)
+        if response.status_code == 404:
+            # The server evicted or lost the key (e.g. after a restart), register it again
+            _registered_signing_keys.pop(
+                (url, sign_algorithm_name, sign_public_key), None
+            )
+            payload["sign_key_id"] = register_signing_key(
+                sign_algorithm_name, sign_public_key, url, wire_format
+            )
+            response = post_payload(f"{url}", payload, wire_format)
+        if response.status_code != 409:
+            break
+        # The server rotated its KEM key, fetch the new one and encapsulate again
+        SERVER_KEYS.invalidate(url, kem_algo_name)
+    if response.status_code != 200:
+        raise ValueError(f"Sending the message failed with status {response.status_code}")
     data = response.json()
     if not data or "message" not in data:
-        raise ValueError("Missing 'server_public_key' in response")
+        raise ValueError("Missing 'message' in response")
     return data["message"], timings
 
 
@@ -1,16 +1,80 @@
 import time
 import ctypes
 import hashlib
+import math
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import unpad
-from flask import jsonify
-from libs_server import SIGNATURE_ALGORITHMS, KEM_ALGORITHMS
-import csv
+import json
+from flask import Response
+from libs_server import BUILD_PROFILE, SIGNATURE_ALGORITHMS, KEM_ALGORITHMS
+from wire_format import field_bytes
+from signing_keys import SigningKeyCache
+from cost_pools import CostClassPool, CostClassRouter
+from timing_writer import TimingWriter, install_signal_handlers
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dotenv import load_dotenv
 import os
 
 load_dotenv()
 
+SERVER_TIMINGS_HEADER = [
+    "KEM Algorithm",
+    "Signature Algorithm",
+    "Device Name",
+    "Server Hash Time",
+    "Verify Time",
+    "Decapsulation Time",
+    "Decrypt Time",
+    "Encrypted Data Size",
+    "KEM Implementation",
+    "Signature Implementation",
+    "Build Profile",
+]
+TIMING_BATCH_SIZE = int(os.getenv("TIMING_BATCH_SIZE", "256"))
+TIMING_FLUSH_INTERVAL = float(os.getenv("TIMING_FLUSH_INTERVAL", "1.0"))
+
+# Precomputed /keys responses, keyed by KEM algorithm
+_kem_key_responses = {}
+_kem_key_responses_lock = threading.Lock()
+
+# Per-thread output buffers, see `thread_buffer`
+_thread_buffers = threading.local()
+
+# Background writers for the timing CSVs, keyed by output file
+_timing_writers = {}
+_timing_writers_lock = threading.Lock()
+install_signal_handlers()
+
+# Registered client signing keys, referenced by key id in client messages
+SIGNING_KEYS = SigningKeyCache(int(os.getenv("SIGN_KEY_CACHE_SIZE", "64")))
+
+# "sequential" verifies the signature, then decapsulates; "parallel" runs both at once
+VERIFY_DECAPSULATION_MODE = os.getenv("VERIFY_DECAPSULATION_MODE", "sequential")
+# Threads decapsulating while the message's thread verifies (parallel mode only)
+_decapsulation_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DECAPSULATION_WORKERS", os.cpu_count() or 1)),
+    thread_name_prefix="decapsulation",
+)
+
+# Thread pools handling client messages, by measured cost of their algorithm pair
+CRYPTO_POOLS = CostClassRouter(
+    CostClassPool(
+        "cheap",
+        int(os.getenv("CHEAP_POOL_WORKERS", os.cpu_count() or 1)),
+        int(os.getenv("CHEAP_POOL_QUEUE", "64")),
+        default_service_time_ms=float(os.getenv("DEFAULT_SERVICE_TIME_MS", "5.0")),
+    ),
+    CostClassPool(
+        "heavy",
+        int(os.getenv("HEAVY_POOL_WORKERS", max(1, (os.cpu_count() or 1) // 2))),
+        int(os.getenv("HEAVY_POOL_QUEUE", "16")),
+        default_service_time_ms=float(os.getenv("DEFAULT_SERVICE_TIME_MS", "5.0")),
+    ),
+    float(os.getenv("HEAVY_COST_THRESHOLD_MS", "5.0")),
+    int(os.getenv("MAX_IN_FLIGHT_PER_PAIR", "32")),
+)
+
 
 def hash_message(message, timings):
     """
@@ -41,7 +105,8 @@ def verify_signature(
         sign_algorithm_name (str): Name of the signature algorithm.
         cipher_text (bytes): The ciphertext whose signature is being verified.
         signature (bytes): The signature to verify.
-        sign_pub_key (bytes): The public key for signature verification.
+        sign_pub_key (bytes or ctypes.Array): The public key for signature verification,
+            either raw or as a prepared ctypes buffer from `SIGNING_KEYS`.
         timings (dict): Dictionary to store timing information.
 
     Returns:
@@ -59,7 +124,10 @@ def verify_signature(
         hashed_cipher_text
     )
     msg_len = ctypes.c_size_t(len(hashed_cipher_text))
-    pk_ptr = (ctypes.c_uint8 * len(sign_pub_key)).from_buffer_copy(sign_pub_key)
+    if isinstance(sign_pub_key, ctypes.Array):
+        pk_ptr = sign_pub_key
+    else:
+        pk_ptr = (ctypes.c_uint8 * len(sign_pub_key)).from_buffer_copy(sign_pub_key)
 
     start_time = time.time_ns()
     result = verify_signature_algo(sig_ptr, sig_len, msg_ptr, msg_len, pk_ptr)
@@ -87,6 +155,28 @@ def decrypt_message(aes_key, iv, cipher_text, timings):
     return message.decode("utf-8")
 
 
+def thread_buffer(size):
+    """
+    Returns an output buffer owned by the calling thread, reused by its later calls.
+
+    The buffer's content is only valid until the thread asks for a buffer of the
+    same size again, so callers copy the result out before returning.
+
+    Args:
+        size (int): Size of the buffer in bytes.
+
+    Returns:
+        ctypes.Array: The buffer.
+    """
+    buffers = getattr(_thread_buffers, "buffers", None)
+    if buffers is None:
+        buffers = _thread_buffers.buffers = {}
+    buffer = buffers.get(size)
+    if buffer is None:
+        buffer = buffers[size] = ctypes.create_string_buffer(size)
+    return buffer
+
+
 def decapsulate_aes_key(secret_key_encrypted, kem_algo_name, timings):
     """
     Decapsulates an encrypted AES key using the specified KEM algorithm.
@@ -100,16 +190,14 @@ def decapsulate_aes_key(secret_key_encrypted, kem_algo_name, timings):
         bytes: The decapsulated shared secret.
     """
     kem_algo_info = KEM_ALGORITHMS[kem_algo_name]
-    kem_private_key = kem_algo_info["private_key"]
     kem_algo = kem_algo_info["decapsulation_algorithm"]
-    kem_algo_secret_bytes = kem_algo_info["shared_secret_bytes"]
-    ss_buffer = ctypes.create_string_buffer(kem_algo_secret_bytes)
+    ss_buffer = thread_buffer(kem_algo_info["shared_secret_bytes"])
 
     # Prepare pointers for ciphertext and private key
     ct_ptr = (ctypes.c_uint8 * len(secret_key_encrypted)).from_buffer_copy(
         secret_key_encrypted
     )
-    sk_ptr = (ctypes.c_uint8 * len(kem_private_key)).from_buffer_copy(kem_private_key)
+    sk_ptr = kem_algo_info["private_key_buffer"]
 
     start_time = time.time_ns()
     result = kem_algo(ss_buffer, ct_ptr, sk_ptr)
@@ -129,7 +217,7 @@ def write_timings_to_file(
     output_file="server_timings.csv",
 ):
     """
-    Writes the collected timing information to a CSV file.
+    Queues the collected timing information for a background writer that appends it to a CSV file.
 
     Args:
         timings (dict): Timing information collected during operations.
@@ -147,26 +235,23 @@ def write_timings_to_file(
         timings["decapsulation_time"],
         timings["decrypt_time"],
         message_size,
+        KEM_ALGORITHMS.spec(kem_algo_name)["implementation"],
+        SIGNATURE_ALGORITHMS.spec(sign_algorithm_name)["implementation"],
+        BUILD_PROFILE,
     ]
-    if not os.path.exists(output_file):
-        with open(output_file, "w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(
-                [
-                    "KEM Algorithm",
-                    "Signature Algorithm",
-                    "Device Name",
-                    "Server Hash Time",
-                    "Verify Time",
-                    "Decapsulation Time",
-                    "Decrypt Time",
-                    "Encrypted Data Size",
-                ]
-            )
-
-    with open(output_file, mode="a", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(data_row)
+    writer = _timing_writers.get(output_file)
+    if writer is None:
+        with _timing_writers_lock:
+            writer = _timing_writers.get(output_file)
+            if writer is None:
+                writer = TimingWriter(
+                    output_file,
+                    SERVER_TIMINGS_HEADER,
+                    TIMING_BATCH_SIZE,
+                    TIMING_FLUSH_INTERVAL,
+                )
+                _timing_writers[output_file] = writer
+    writer.write(data_row)
 
 
 def handle_client_message(
@@ -174,31 +259,75 @@ def handle_client_message(
     iv,
     signature,
     secret_key,
-    sign_pub_key,
     kem_algo_name,
     sign_algorithm_name,
+    sign_pub_key=None,
+    sign_key_id=None,
+    kem_key_id=None,
 ):
     """
     Handles a client message by verifying the signature, decapsulating the key, and decrypting the message.
 
+    With `VERIFY_DECAPSULATION_MODE` "parallel", the key is decapsulated on another
+    thread while the signature is verified, so a message costs about the slower of
+    the two instead of their sum. The message is only decrypted after the signature
+    was verified, as in sequential mode.
+
+    Binary fields are hex strings when the message arrived as JSON and raw bytes
+    when it arrived as a binary envelope. The signing public key is either sent
+    inline (`sign_pub_key`) or referenced by the id it was registered under
+    (`sign_key_id`, see `register_signing_key`). If the client sends the id (ETag) of
+    the KEM public key it encapsulated against and that key is no longer current,
+    the message is rejected with 409 so the client can fetch the new key.
+
     Args:
-        cipher_text (str): Hex-encoded ciphertext.
-        iv (str): Hex-encoded initialization vector.
-        signature (str): Hex-encoded signature.
-        secret_key (str): Hex-encoded encrypted secret key.
-        sign_pub_key (str): Hex-encoded signing public key.
+        cipher_text (str or bytes): Ciphertext.
+        iv (str or bytes): Initialization vector.
+        signature (str or bytes): Signature.
+        secret_key (str or bytes): Encrypted secret key.
         kem_algo_name (str): Name of the KEM algorithm used.
         sign_algorithm_name (str): Name of the signature algorithm used.
+        sign_pub_key (str or bytes, optional): Signing public key.
+        sign_key_id (str, optional): Id of a registered signing public key.
+        kem_key_id (str, optional): Id (ETag) of the KEM public key used by the client.
 
     Returns:
-        tuple: JSON response and HTTP status code.
+        tuple: JSON response and HTTP status code (400 if the encrypted secret key or
+            the signing public key has the wrong size, 404 if `sign_key_id` is
+            unknown, 409 if `kem_key_id` is outdated).
     """
     timings = {}
-    signature_bytes = bytes.fromhex(signature)
-    sign_pub_key_bytes = bytes.fromhex(sign_pub_key)
-    cipher_text_bytes = bytes.fromhex(cipher_text)
-    secret_key_bytes = bytes.fromhex(secret_key)
-    iv_bytes = bytes.fromhex(iv)
+    if kem_key_id is not None and kem_key_id != get_kem_key_encodings(kem_algo_name)["etag"]:
+        return {"message": "Stale KEM key."}, 409
+    if sign_key_id is not None:
+        entry = SIGNING_KEYS.get(sign_key_id)
+        if entry is None or entry[0] != sign_algorithm_name:
+            return {"message": "Unknown signing key."}, 404
+        sign_pub_key_bytes = entry[1]
+    elif sign_pub_key is not None:
+        sign_pub_key_bytes = field_bytes(sign_pub_key)
+    else:
+        return {"message": "Missing signing key."}, 500
+    signature_bytes = field_bytes(signature)
+    cipher_text_bytes = field_bytes(cipher_text)
+    secret_key_bytes = field_bytes(secret_key)
+    iv_bytes = field_bytes(iv)
+
+    # The libraries read fixed-size buffers, so check the sizes before calling them
+    sign_spec = SIGNATURE_ALGORITHMS.spec(sign_algorithm_name)
+    if len(secret_key_bytes) != KEM_ALGORITHMS.spec(kem_algo_name)["cipher_text_bytes"]:
+        return {"message": "Invalid encrypted secret key size."}, 400
+    if sign_key_id is None and len(sign_pub_key_bytes) != sign_spec["public_key_size"]:
+        return {"message": "Invalid signing key size."}, 400
+    if len(signature_bytes) > sign_spec["signature_bytes"]:
+        return {"message": "Invalid signature size."}, 400
+
+    decapsulation = None
+    if VERIFY_DECAPSULATION_MODE == "parallel":
+        # Both library calls release the GIL, so decapsulation runs while verifying
+        decapsulation = _decapsulation_executor.submit(
+            decapsulate_aes_key, secret_key_bytes, kem_algo_name, timings
+        )
 
     # Verify the signature
     if not verify_signature(
@@ -208,10 +337,15 @@ def handle_client_message(
         sign_pub_key_bytes,
         timings,
     ):
+        if decapsulation is not None:
+            decapsulation.cancel()
         return {"message": "Could not verify signature."}, 500
 
-    # Decapsulate the AES key
-    aes_key = decapsulate_aes_key(secret_key_bytes, kem_algo_name, timings)
+    # Decapsulate the AES key; nothing is decrypted before the signature is verified
+    if decapsulation is None:
+        aes_key = decapsulate_aes_key(secret_key_bytes, kem_algo_name, timings)
+    else:
+        aes_key = decapsulation.result()
 
     # Decrypt the message
     message = decrypt_message(aes_key[:32], iv_bytes, cipher_text_bytes, timings)
@@ -222,15 +356,132 @@ def handle_client_message(
     return {"message": message}, 200
 
 
-def get_kem_key(kem_name):
+def submit_client_message(data):
+    """
+    Schedules `handle_client_message` on the pool for the message's algorithm pair.
+
+    Messages naming an unknown algorithm are answered right away and never reach the
+    pools, so they add no pair to the router's statistics.
+
+    Args:
+        data (dict): The request fields, passed on to `handle_client_message`.
+
+    Returns:
+        concurrent.futures.Future: Future of the JSON response and HTTP status code
+            (400 if an algorithm is unknown).
+
+    Raises:
+        PoolFullError: If the pool's queue is full.
+    """
+    response = None
+    if data.get("kem_algo_name") not in KEM_ALGORITHMS:
+        response = {"message": "Unknown KEM algorithm."}, 400
+    elif data.get("sign_algorithm_name") not in SIGNATURE_ALGORITHMS:
+        response = {"message": "Unknown signature algorithm."}, 400
+    if response is not None:
+        future = Future()
+        future.set_result(response)
+        return future
+    return CRYPTO_POOLS.submit(
+        data.get("kem_algo_name"),
+        data.get("sign_algorithm_name"),
+        handle_client_message,
+        **data,
+    )
+
+
+def server_busy(error):
+    """
+    Builds the response for a client message rejected by admission control.
+
+    Args:
+        error (PoolFullError): The rejection, with its estimated time until there is room.
+
+    Returns:
+        tuple: JSON response, HTTP status code 503 and the headers, with the estimate
+            rounded up to whole seconds in Retry-After.
+    """
+    retry_after = max(1, math.ceil(error.retry_after))
+    return (
+        {"message": "Server busy.", "retry_after": error.retry_after},
+        503,
+        {"Retry-After": str(retry_after)},
+    )
+
+
+def register_signing_key(sign_algorithm_name, sign_pub_key):
+    """
+    Registers a client's signing public key so later messages can reference it by id.
+
+    Args:
+        sign_algorithm_name (str): Name of the signature algorithm.
+        sign_pub_key (str or bytes): Hex-encoded or raw signing public key.
+
+    Returns:
+        tuple: JSON response with the key id and HTTP status code (400 for an unknown
+            algorithm or a key of the wrong size).
+    """
+    if sign_algorithm_name not in SIGNATURE_ALGORITHMS:
+        return {"message": "Unknown signature algorithm."}, 400
+    public_key = field_bytes(sign_pub_key)
+    if len(public_key) != SIGNATURE_ALGORITHMS.spec(sign_algorithm_name)["public_key_size"]:
+        return {"message": "Invalid signing key size."}, 400
+    key_id = SIGNING_KEYS.register(sign_algorithm_name, public_key)
+    return {"key_id": key_id}, 200
+
+
+def get_kem_key_encodings(kem_name):
+    """
+    Returns the encoded responses for a KEM public key, computed once per key.
+
+    Args:
+        kem_name (str): Name of the KEM algorithm.
+
+    Returns:
+        dict: "etag" (hash of the key), "json" (JSON body with the hex-encoded key) and
+            "raw" (the key bytes).
+    """
+    encodings = _kem_key_responses.get(kem_name)
+    if encodings is None:
+        with _kem_key_responses_lock:
+            encodings = _kem_key_responses.get(kem_name)
+            if encodings is None:
+                key = bytes(KEM_ALGORITHMS[kem_name]["public_key"])
+                encodings = {
+                    "etag": hashlib.sha256(key).hexdigest(),
+                    "json": json.dumps({"server_public_key": key.hex()}).encode("ascii"),
+                    "raw": key,
+                }
+                _kem_key_responses[kem_name] = encodings
+    return encodings
+
+
+def get_kem_key(kem_name, raw=False, if_none_match=None):
     """
     Retrieves the server's public key for the specified KEM algorithm.
 
+    The response carries a strong ETag derived from the key. If `if_none_match`
+    contains that ETag, an empty 304 response is returned instead of the key.
+
     Args:
         kem_name (str): Name of the KEM algorithm.
+        raw (bool): If True, the body is the raw key instead of JSON with the key in hex format.
+        if_none_match (werkzeug.datastructures.ETags, optional): ETags from the If-None-Match header.
 
     Returns:
-        Response: Flask JSON response containing the server's public key in hex format.
+        Response: Flask response containing the server's public key, or a 304 response.
     """
-    key = KEM_ALGORITHMS[kem_name]["public_key"]
-    return jsonify({"server_public_key": key.hex()})
+    encodings = get_kem_key_encodings(kem_name)
+    headers = {"Cache-Control": "no-cache"}
+    if if_none_match is not None and if_none_match.contains(encodings["etag"]):
+        response = Response(status=304, headers=headers)
+    elif raw:
+        response = Response(
+            encodings["raw"], mimetype="application/octet-stream", headers=headers
+        )
+    else:
+        response = Response(
+            encodings["json"], mimetype="application/json", headers=headers
+        )
+    response.set_etag(encodings["etag"])
+    return response
@@ -0,0 +1,115 @@
+import struct
+
+# Content-Type selecting the binary envelope on the POST / endpoint
+CONTENT_TYPE = "application/x-pqc-envelope"
+
+# Envelope layout (all integers big-endian):
+#   magic (4 bytes) | field count (u16)
+#   per field: name length (u8) | kind (u8) | value length (u32) | name | value
+MAGIC = b"PQC1"
+_ENVELOPE_HEADER = struct.Struct(">4sH")
+_FIELD_HEADER = struct.Struct(">BBI")
+
+KIND_BYTES = 0
+KIND_TEXT = 1
+
+
+def encode_envelope(fields):
+    """
+    Encodes a flat dictionary into a length-prefixed binary envelope.
+
+    Args:
+        fields (dict): Field names mapped to bytes-like or str values.
+
+    Returns:
+        bytes: The encoded envelope.
+
+    Raises:
+        TypeError: If a value is neither bytes-like nor str.
+    """
+    parts = [_ENVELOPE_HEADER.pack(MAGIC, len(fields))]
+    for name, value in fields.items():
+        if isinstance(value, str):
+            kind = KIND_TEXT
+            value = value.encode("utf-8")
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            kind = KIND_BYTES
+        else:
+            raise TypeError(f"Unsupported value type for field '{name}'")
+        name_bytes = name.encode("ascii")
+        parts.append(_FIELD_HEADER.pack(len(name_bytes), kind, len(value)))
+        parts.append(name_bytes)
+        parts.append(value)
+    return b"".join(parts)
+
+
+def decode_envelope(body):
+    """
+    Decodes a binary envelope without copying the binary field values.
+
+    Args:
+        body (bytes): The raw request body.
+
+    Returns:
+        dict: Field names mapped to memoryview slices of `body` (binary fields) or str (text fields).
+
+    Raises:
+        ValueError: If the envelope is truncated or malformed.
+    """
+    view = memoryview(body)
+    if len(view) < _ENVELOPE_HEADER.size:
+        raise ValueError("Envelope too short")
+    magic, count = _ENVELOPE_HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Invalid envelope magic")
+
+    fields = {}
+    offset = _ENVELOPE_HEADER.size
+    for _ in range(count):
+        if offset + _FIELD_HEADER.size > len(view):
+            raise ValueError("Truncated envelope field header")
+        name_length, kind, value_length = _FIELD_HEADER.unpack_from(view, offset)
+        offset += _FIELD_HEADER.size
+        end = offset + name_length + value_length
+        if end > len(view):
+            raise ValueError("Truncated envelope field")
+        name = bytes(view[offset : offset + name_length]).decode("ascii")
+        value = view[offset + name_length : end]
+        if kind == KIND_TEXT:
+            value = str(value, "utf-8")
+        elif kind != KIND_BYTES:
+            raise ValueError(f"Unknown kind {kind} for field '{name}'")
+        fields[name] = value
+        offset = end
+    return fields
+
+
+def encode_json_fields(fields):
+    """
+    Converts binary field values to hex so the fields can be sent as JSON.
+
+    Args:
+        fields (dict): Field names mapped to bytes-like or str values.
+
+    Returns:
+        dict: The same fields with every binary value hex-encoded.
+    """
+    return {
+        name: value if isinstance(value, str) else bytes(value).hex()
+        for name, value in fields.items()
+    }
+
+
+def field_bytes(value):
+    """
+    Returns the binary value of a message field regardless of the wire format it arrived in.
+
+    Args:
+        value (str or bytes-like): Hex string (JSON format) or raw bytes (binary envelope).
+
+    Returns:
+        bytes-like: The raw field value.
+    """
+    if isinstance(value, str):
+        return bytes.fromhex(value)
+    return value